@@ -44,11 +44,10 @@ Examples:
 """
 
 import argparse
-import asyncio
 import json
 import multiprocessing
 import sys
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from time import perf_counter
 from typing import Optional
@@ -62,7 +61,7 @@ from teelo.config import settings
 from teelo.db import get_session
 from teelo.db.models import ScrapeQueue
 from teelo.scrape.atp import ATPScraper
-from teelo.scrape.base import VirtualDisplay
+from teelo.scrape.base import VirtualDisplay, run_scraper
 from teelo.scrape.discovery import discover_tournament_tasks
 from teelo.scrape.itf import ITFScraper
 from teelo.scrape.pipeline import TaskParams, execute_task
@@ -146,6 +145,108 @@ def parse_tours(tours_str: Optional[str]) -> list[str]:
     return [t for t in TOUR_ORDER if t in valid_tours]
 
 
+async def _queue_tour_year(
+    session,
+    scraper,
+    tour_key: str,
+    year: int,
+    future_cutoff: date,
+    discovery_metrics: list[dict[str, float | int | str]],
+) -> int:
+    """
+    Queue one tour/year's tournaments that aren't already queued.
+
+    Args:
+        session: Database session
+        scraper: Open scraper for the tour
+        tour_key: Tour type key
+        year: Year to discover
+        future_cutoff: Skip tournaments starting after this date
+        discovery_metrics: Discovery timings, appended to
+
+    Returns:
+        Number of tasks added to queue
+    """
+    # Calculate priority based on year (recent = higher priority)
+    # 2024 = priority 7, 2020 = priority 9
+    base_priority = 7 + min(max(2024 - year, 0), 2)
+
+    skipped_future = 0
+    tasks_to_add: list[ScrapeQueue] = []
+
+    # Fetch existing tasks for this tour/year to avoid duplicates
+    existing_tournament_ids = set(
+        tid for (tid,) in (
+            session.query(
+                ScrapeQueue.task_params["tournament_id"].astext
+            )
+            .filter(
+                ScrapeQueue.task_type == "historical_tournament",
+                ScrapeQueue.status.in_(["pending", "in_progress", "retry"]),
+                ScrapeQueue.task_params["tour_key"].astext == tour_key,
+                cast(ScrapeQueue.task_params["year"].astext, Integer) == year,
+            )
+            .all()
+        )
+        if tid
+    )
+
+    discovery_start = perf_counter()
+    tasks = await discover_tournament_tasks(
+        tour_key,
+        year,
+        task_type="historical_tournament",
+        scraper=scraper,
+    )
+    discovery_elapsed = perf_counter() - discovery_start
+    discovery_metrics.append(
+        {
+            "tour_key": tour_key,
+            "year": year,
+            "duration_s": discovery_elapsed,
+            "tasks_found": len(tasks),
+        }
+    )
+
+    for task in tasks:
+        # Skip tournaments that are too far in the future
+        start_date_str = task.params.start_date
+        if start_date_str:
+            try:
+                start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
+                if start_date > future_cutoff:
+                    skipped_future += 1
+                    continue
+            except (ValueError, TypeError):
+                pass
+
+        # Skip if already queued
+        if task.params.tournament_id in existing_tournament_ids:
+            continue
+
+        # Enqueue task (bulk later)
+        tasks_to_add.append(
+            ScrapeQueue(
+                task_type="historical_tournament",
+                task_params=task.params.to_dict(),
+                priority=base_priority,
+                max_attempts=3,
+                status="pending",
+            )
+        )
+
+    msg = f"\n  {year}: Found {len(tasks)} tournaments, added {len(tasks_to_add)} to queue"
+    if skipped_future > 0:
+        msg += f" ({skipped_future} skipped as too far in future)"
+    print(msg)
+
+    if tasks_to_add:
+        session.bulk_save_objects(tasks_to_add)
+    # Commit after each tour/year
+    session.commit()
+    return len(tasks_to_add)
+
+
 async def populate_queue(
     session,
     queue_manager: ScrapeQueueManager,
@@ -181,91 +282,33 @@ async def populate_queue(
         print(f"Loading tournaments for: {tour_config['description']}")
         print("=" * 60)
 
-        for year in years:
-            # Calculate priority based on year (recent = higher priority)
-            # 2024 = priority 7, 2020 = priority 9
-            base_priority = 7 + min(max(2024 - year, 0), 2)
-            
-            year_tasks_added = 0
-            skipped_future = 0
-            tasks_to_add: list[ScrapeQueue] = []
-
+        # One scraper (and browser) for the tour's years, reopened after a
+        # year fails in case the failure took the browser down with it
+        pending_years = list(years)
+        while pending_years:
+            opened = False
             try:
-                # Fetch existing tasks for this tour/year to avoid duplicates
-                existing_tournament_ids = set(
-                    tid for (tid,) in (
-                        session.query(
-                            ScrapeQueue.task_params["tournament_id"].astext
-                        )
-                        .filter(
-                            ScrapeQueue.task_type == "historical_tournament",
-                            ScrapeQueue.status.in_(["pending", "in_progress", "retry"]),
-                            ScrapeQueue.task_params["tour_key"].astext == tour_key,
-                            cast(ScrapeQueue.task_params["year"].astext, Integer) == year,
-                        )
-                        .all()
-                    )
-                    if tid
-                )
-
-                discovery_start = perf_counter()
-                tasks = await discover_tournament_tasks(
-                    tour_key,
-                    year,
-                    task_type="historical_tournament",
-                )
-                discovery_elapsed = perf_counter() - discovery_start
-                discovery_metrics.append(
-                    {
-                        "tour_key": tour_key,
-                        "year": year,
-                        "duration_s": discovery_elapsed,
-                        "tasks_found": len(tasks),
-                    }
-                )
-
-                for task in tasks:
-                    # Skip tournaments that are too far in the future
-                    start_date_str = task.params.start_date
-                    if start_date_str:
+                async with _get_scraper_class(tour_key)(headless=False) as scraper:
+                    opened = True
+                    while pending_years:
+                        year = pending_years.pop(0)
                         try:
-                            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-                            if start_date > future_cutoff:
-                                skipped_future += 1
-                                continue
-                        except (ValueError, TypeError):
-                            pass
-
-                    # Skip if already queued
-                    if task.params.tournament_id in existing_tournament_ids:
-                        continue
-
-                    # Enqueue task (bulk later)
-                    tasks_to_add.append(
-                        ScrapeQueue(
-                            task_type="historical_tournament",
-                            task_params=task.params.to_dict(),
-                            priority=base_priority,
-                            max_attempts=3,
-                            status="pending",
-                        )
-                    )
-                    year_tasks_added += 1
-                    tasks_added += 1
-                
-                msg = f"\n  {year}: Found {len(tasks)} tournaments, added {year_tasks_added} to queue"
-                if skipped_future > 0:
-                    msg += f" ({skipped_future} skipped as too far in future)"
-                print(msg)
-
+                            tasks_added += await _queue_tour_year(
+                                session,
+                                scraper,
+                                tour_key,
+                                year,
+                                future_cutoff,
+                                discovery_metrics,
+                            )
+                        except Exception as e:
+                            print(f"  Error loading {year} tournaments: {e}")
+                            break
             except Exception as e:
-                print(f"  Error loading {year} tournaments: {e}")
-                continue
-
-            if tasks_to_add:
-                session.bulk_save_objects(tasks_to_add)
-            # Commit after each tour
-            session.commit()
+                print(f"  Error running the {tour_config['description']} scraper: {e}")
+                if not opened:
+                    # The browser didn't start, so move on to the next tour
+                    break
 
     return tasks_added, discovery_metrics
 
@@ -473,7 +516,7 @@ def run_worker(
     apply_fast_delays(fast)
 
     with get_session() as session:
-        stats = asyncio.run(
+        stats = run_scraper(
             process_queue(
                 session,
                 overwrite=overwrite,
@@ -804,4 +847,4 @@ Examples:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_scraper(main())
@@ -34,6 +34,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from sqlalchemy import or_
 from teelo.db.session import get_session
 from teelo.db.models import Player
+from teelo.scrape.base import run_scraper
 from teelo.scrape.player_enrichment import PlayerEnrichmentScraper, PlayerProfile
 from teelo.utils.geo import country_to_ioc
 
@@ -210,7 +211,7 @@ def main():
                         help="Re-enrich all players, overwriting existing data")
     args = parser.parse_args()
 
-    asyncio.run(run_enrichment(args.source, args.limit, args.dry_run, args.force))
+    run_scraper(run_enrichment(args.source, args.limit, args.dry_run, args.force))
 
 
 if __name__ == "__main__":
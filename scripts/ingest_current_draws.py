@@ -23,7 +23,6 @@ Usage:
 """
 
 import argparse
-import asyncio
 import sys
 from datetime import datetime, date, timedelta
 from pathlib import Path
@@ -34,6 +33,7 @@ from teelo.db.session import get_session
 from teelo.db.models import Tournament, TournamentEdition
 from teelo.players.identity import PlayerIdentityService
 from teelo.scrape.atp import ATPScraper
+from teelo.scrape.base import run_scraper
 from teelo.services.draw_ingestion import ingest_draw
 
 # Reuse get_or_create_edition from backfill
@@ -333,4 +333,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_scraper(main())
@@ -36,7 +36,7 @@ from teelo.db import get_session
 from teelo.db.models import ScrapeQueue
 from teelo.players.identity import PlayerIdentityService
 from teelo.scrape.atp import ATPScraper
-from teelo.scrape.base import VirtualDisplay
+from teelo.scrape.base import VirtualDisplay, run_scraper
 from teelo.scrape.discovery import discover_tournament_tasks
 from teelo.scrape.itf import ITFScraper
 from teelo.scrape.pipeline import TaskParams, execute_task
@@ -489,7 +489,7 @@ def run_worker(
         if quiet_worker_logs:
             with open(os.devnull, "w", encoding="utf-8") as devnull:
                 with contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
-                    stats = asyncio.run(
+                    stats = run_scraper(
                         process_queue(
                             session,
                             headless=headless,
@@ -500,7 +500,7 @@ def run_worker(
                         )
                     )
         else:
-            stats = asyncio.run(
+            stats = run_scraper(
                 process_queue(
                     session,
                     headless=headless,
@@ -836,4 +836,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_scraper(main())
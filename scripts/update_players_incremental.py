@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 import json
 from datetime import datetime, timezone
 from pathlib import Path
@@ -15,6 +14,7 @@ from sqlalchemy import or_
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from teelo.db import Player, get_session
+from teelo.scrape.base import run_scraper
 from teelo.scrape.player_enrichment import PlayerEnrichmentScraper, PlayerProfile
 from teelo.tasks import DBCheckpointStore
 from teelo.utils.geo import country_to_ioc
@@ -274,7 +274,7 @@ async def main_async() -> int:
 
 
 def main() -> int:
-    return asyncio.run(main_async())
+    return run_scraper(main_async())
 
 
 if __name__ == "__main__":
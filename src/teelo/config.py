@@ -114,10 +114,48 @@ class Settings(BaseSettings):
         default=3.0,
         description="Maximum delay between requests (seconds)",
     )
+    scrape_block_resources: bool = Field(
+        default=True,
+        description="Abort image/font/media and analytics requests while scraping",
+    )
+    scrape_max_pages: int = Field(
+        default=4,
+        description="Maximum browser pages a scraper keeps open concurrently",
+    )
+    scrape_max_total_pages: int = Field(
+        default=8,
+        description="Maximum browser pages in use at once across all scrapers in a process",
+    )
+    scrape_max_concurrency: int = Field(
+        default=8,
+        description="Maximum page navigations in flight at once across all scrapers in a process",
+    )
+    scrape_cache_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Directory for caching rendered archive/overview/results HTML "
+            "between runs (e.g. .teelo_cache). Unset disables the cache."
+        ),
+    )
+    scrape_cache_ttl: int = Field(
+        default=86400,
+        description="Lifetime of cached scrape HTML in seconds",
+    )
+    scrape_state_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Directory for saving browser cookies/storage between runs so "
+            "Cloudflare clearance survives restarts. Unset disables it."
+        ),
+    )
     scrape_max_retries: int = Field(
         default=3,
         description="Maximum retry attempts for failed scrapes",
     )
+    scrape_retry_deadline: float = Field(
+        default=300.0,
+        description="Total time budget (seconds) for one operation and its retries",
+    )
 
     # ==========================================================================
     # ML Configuration
@@ -19,15 +19,117 @@ URLs:
 import asyncio
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import zip_longest
 from typing import AsyncGenerator, Optional
 
-from bs4 import BeautifulSoup
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import Page
 
 from teelo.scrape.base import BaseScraper, ScrapedDrawEntry, ScrapedMatch, ScrapedFixture
 from teelo.scrape.parsers.score import parse_score, ScoreParseError
 from teelo.scrape.parsers.player import extract_player_info, extract_seed_from_name
-from teelo.scrape.atp_tournament_parser import parse_tournament_elements
+from teelo.scrape.atp_tournament_parser import parse_tournament_html
+
+# Day-grouped results layout: each accordion header holding a tournament-day
+# is immediately followed by the content block with that day's matches.
+_DAY_CONTENT_SELECTOR = (
+    "div.atp_accordion-header:has(> .tournament-day) + div.atp_accordion-content"
+)
+
+# Results pages only need the day accordions and match cards; everything
+# else (nav, scripts, ads, cookie banner) is skipped by the tree builder.
+# Headers are kept whole so the header + content adjacency above still holds,
+# and bare "match" elements cover the flat fallback layout.
+_RESULTS_STRAINER = SoupStrainer(
+    class_=["atp_accordion-header", "atp_accordion-content", "match"]
+)
+
+# Rendered tournament entries on the results-archive page
+_ARCHIVE_READY_SELECTOR = ".tournament-list ul.events li, .results-archive-table"
+
+# In-browser counterpart of _RESULTS_STRAINER: serializes only the outermost
+# day headers, day contents and match cards, in document order, so the
+# results HTML shipped back from the browser is a fraction of the page
+_RESULTS_EXTRACT_JS = """
+() => {
+    const sel = ".atp_accordion-header, .atp_accordion-content, .match";
+    return Array.from(document.querySelectorAll(sel))
+        .filter(el => !el.parentElement || !el.parentElement.closest(sel))
+        .map(el => el.outerHTML)
+        .join("");
+}
+"""
+
+# Draws pages only need the per-round .draw containers (header + items)
+_DRAW_STRAINER = SoupStrainer(class_="draw")
+
+# Daily schedule pages only need the court groups and match blocks: the
+# 2025+ div.schedule blocks (kept inside their content-group so court names
+# can be inherited) and the legacy match card layouts.
+_FIXTURE_STRAINER = SoupStrainer(
+    class_=re.compile(r"^(?:content-group|schedule)$|match-card|schedule-match|match-item")
+)
+
+# Day header dates ("Sun, 11 January, 2026"): a generic "day Word [year]"
+# pattern, with the month word looked up in a table.
+_DAY_DATE_RE = re.compile(r"(\d{1,2})\s+([A-Z][a-z]+)(?:,?\s*(\d{4}))?")
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        (
+            "January", "February", "March", "April", "May", "June",
+            "July", "August", "September", "October", "November", "December",
+        ),
+        start=1,
+    )
+}
+
+# Player profile links: /en/players/{slug}/{ATP_ID}/...
+_PLAYER_ID_RE = re.compile(r"/players/[^/]+/([a-zA-Z0-9]+)/")
+
+# Tournament links: /en/scores/archive/{slug}/{number}/{year}/results,
+# or a bare /scores/archive/{slug} or /tournaments/{slug} link
+_ARCHIVE_FULL_RE = re.compile(r"/scores/archive/([^/]+)/(\d+)/\d+/results")
+_ARCHIVE_ID_RE = re.compile(r"/(?:scores/archive|tournaments)/([^/]+)")
+_TOURNAMENT_HREF_RE = re.compile(r"/tournaments/([^/]+)/")
+
+# Archive dates like "2024.01.14 - 2024.01.28" (also "-" or "/" separated)
+_DATE_RE = re.compile(r"(\d{4}[-./]\d{2}[-./]\d{2})")
+_DATE_SEPARATORS = str.maketrans("/.", "--")
+
+# Parenthesised number: seeds "(1)" and tiebreaks "7(5)"
+_PAREN_NUMBER_RE = re.compile(r"\((\d+)\)")
+
+# Legacy (pre-2025) fixture card selectors, compiled once instead of per card
+_FIXTURE_PLAYERS_SEL = sv.compile("a[href*='/players/'], .player-name")
+_FIXTURE_TIME_SEL = sv.compile(".time, .schedule-time")
+_FIXTURE_COURT_SEL = sv.compile(".court, .venue")
+_FIXTURE_ROUND_SEL = sv.compile(".round, .match-round")
+
+# Schedule times: "11:00 AM" / "2.30 pm" style, then 24-hour "14:30"
+_AMPM_TIME_RE = re.compile(r"(\d{1,2})(?:[:\.](\d{2}))?\s*([AP]M)", re.IGNORECASE)
+_24H_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
+# Explicit walkover/retirement markers in match-cta or score text
+_STATUS_RE = re.compile(r"w/o|walkover|ret", re.IGNORECASE)
+
+# Padding for a set one player has no score for on the draws page: (games, tiebreak)
+_EMPTY_SET_SCORE = ("0", "")
+
+# Level keywords searched in tournament overview page text, in priority order.
+# Challenger only applies when the level is still the ATP 250 default.
+PAGE_LEVEL_KEYWORDS: tuple[tuple[str, str], ...] = (
+    ("grand slam", "Grand Slam"),
+    ("masters 1000", "Masters 1000"),
+    ("atp masters", "Masters 1000"),
+    ("atp 500", "ATP 500"),
+    ("challenger", "Challenger"),
+)
+_PAGE_LEVEL_RE = re.compile(
+    "|".join(re.escape(kw) for kw, _ in PAGE_LEVEL_KEYWORDS), re.IGNORECASE
+)
 
 
 class ATPScraper(BaseScraper):
@@ -68,24 +170,35 @@ class ATPScraper(BaseScraper):
 
     # Known ATP 500 tournaments (as of 2024) - used as fallback for level detection
     # These are identified by tournament slug
-    ATP_500_TOURNAMENTS = {
+    ATP_500_TOURNAMENTS = frozenset({
         "rotterdam", "rio-de-janeiro", "acapulco", "dubai", "barcelona",
         "washington", "hamburg", "tokyo", "beijing", "vienna", "basel",
         "queen-s-club", "halle",
-    }
+    })
 
     # Known ATP 250 tournaments that might be confused with higher levels
     # (most tournaments default to 250 anyway)
-    GRAND_SLAM_TOURNAMENTS = {
+    GRAND_SLAM_TOURNAMENTS = frozenset({
         "australian-open", "roland-garros", "wimbledon", "us-open",
-    }
+    })
 
     # Known Masters 1000 tournaments
-    MASTERS_1000_TOURNAMENTS = {
+    MASTERS_1000_TOURNAMENTS = frozenset({
         "indian-wells", "miami", "monte-carlo", "madrid", "rome",
         "canada", "cincinnati", "shanghai", "paris",
+    })
+
+    # Single slug -> level lookup over the known sets above. Built in
+    # ascending priority so a slug in several sets keeps the highest level.
+    _LEVEL_BY_ID = {
+        **dict.fromkeys(ATP_500_TOURNAMENTS, "ATP 500"),
+        **dict.fromkeys(MASTERS_1000_TOURNAMENTS, "Masters 1000"),
+        **dict.fromkeys(GRAND_SLAM_TOURNAMENTS, "Grand Slam"),
     }
 
+    # LEVEL_MAPPING as a tuple for the per-element substring scans
+    _LEVEL_MAPPING_ITEMS = tuple(LEVEL_MAPPING.items())
+
     def __init__(self, headless: bool = None):
         super().__init__(headless=headless)
         # Cache expensive lookup pages within a scraper session.
@@ -120,44 +233,69 @@ class ATPScraper(BaseScraper):
             - end_date: Tournament end date
             - number: Tournament number (for ATP URLs)
         """
-        page = await self.new_page()
         tournaments = []
 
-        try:
+        async with self.acquire_page() as page:
             # Navigate to results archive
             # For Challenger tours, add tournamentType=ch parameter
             url = f"{self.BASE_URL}/en/scores/results-archive?year={year}"
             if tour_type == "challenger":
                 url += "&tournamentType=ch"
 
-            await self.navigate(page, url, wait_for="domcontentloaded")
-            # Wait for JS to render the tournament list
-            try:
-                await page.wait_for_selector(".tournament-list, .results-archive-table", timeout=4000)
-            except PlaywrightTimeout:
-                pass
-            await self.random_delay()
-
-            # Get page content
-            html = await page.content()
-            soup = BeautifulSoup(html, "lxml")
+            # Get page content once JS has rendered the tournament entries
+            html = await self.fetch_html(
+                page, url, ready_selector=_ARCHIVE_READY_SELECTOR
+            )
 
             # Parse tournament entries using the dedicated parser
             # (handles the actual ATP HTML structure: div.tournament-list > ul.events > li)
-            tournaments = parse_tournament_elements(soup, year)
+            tournaments = parse_tournament_html(html, year)
 
             print(f"Parsed {len(tournaments)} tournaments from archive page")
 
+            # This is the same archive page _get_tournament_number would load,
+            # so remember every number on it for later results/draw scrapes
+            for tournament in tournaments:
+                if tournament.get("number"):
+                    self._tournament_number_cache[
+                        (tournament["id"], year, tour_type)
+                    ] = tournament["number"]
+
             # If no tournaments found, try alternative approach
             if not tournaments:
                 print("No tournaments found with primary parser, trying fallback...")
                 tournaments = await self._get_tournaments_from_schedule(page, year, tour_type)
 
-        finally:
-            await page.close()
-
         return tournaments
 
+    async def get_tournament_lists(
+        self,
+        years: list[int],
+        tour_type: str = "main",
+        concurrency: int = 4,
+    ) -> dict[int, list[dict]]:
+        """
+        Get ATP tournament lists for several years concurrently.
+
+        Each year's archive page is loaded on its own page (see
+        acquire_page), with at most `concurrency` years in flight.
+
+        Args:
+            years: Years to get tournaments for
+            tour_type: "main" or "challenger" (see get_tournament_list)
+            concurrency: Maximum number of years fetched at once
+
+        Returns:
+            Dictionary mapping each year to its list of tournament dicts
+        """
+        semaphore = asyncio.BoundedSemaphore(concurrency)
+
+        async def fetch_year(year: int) -> tuple[int, list[dict]]:
+            async with semaphore:
+                return year, await self.get_tournament_list(year, tour_type)
+
+        return dict(await asyncio.gather(*(fetch_year(year) for year in years)))
+
     async def _get_tournaments_from_schedule(
         self,
         page: Page,
@@ -180,10 +318,9 @@ class ATPScraper(BaseScraper):
         tournaments = []
 
         url = f"{self.BASE_URL}/en/tournaments"
-        await self.navigate(page, url, wait_for="networkidle")
-        await self.random_delay()
-
-        html = await page.content()
+        html = await self.fetch_html(
+            page, url, ready_selector="a[href*='/tournaments/']", ready_state="attached"
+        )
         soup = BeautifulSoup(html, "lxml")
 
         # Find tournament links
@@ -192,7 +329,7 @@ class ATPScraper(BaseScraper):
         for link in links:
             href = link.get("href", "")
             # Extract tournament ID from URL
-            match = re.search(r"/tournaments/([^/]+)/", href)
+            match = _TOURNAMENT_HREF_RE.search(href)
             if match:
                 tourney_id = match.group(1)
                 
@@ -255,13 +392,13 @@ class ATPScraper(BaseScraper):
 
         # Extract tournament ID and number from URL
         # Format: /en/scores/archive/tournament-name/580/2024/results
-        full_match = re.search(r"/scores/archive/([^/]+)/(\d+)/\d+/results", href)
+        full_match = _ARCHIVE_FULL_RE.search(href)
         if full_match:
             tourney_id = full_match.group(1)
             tourney_number = full_match.group(2)
         else:
             # Try simpler pattern
-            id_match = re.search(r"/(?:scores/archive|tournaments)/([^/]+)", href)
+            id_match = _ARCHIVE_ID_RE.search(href)
             if not id_match:
                 return None
             tourney_id = id_match.group(1)
@@ -293,11 +430,11 @@ class ATPScraper(BaseScraper):
         if date_elem:
             date_text = date_elem.get_text(strip=True)
             # Find all YYYY.MM.DD / YYYY-MM-DD / YYYY/MM/DD dates in the text
-            date_matches = re.findall(r"(\d{4}[-./]\d{2}[-./]\d{2})", date_text)
+            date_matches = _DATE_RE.findall(date_text)
             if date_matches:
-                start_date = date_matches[0].replace("/", "-").replace(".", "-")
+                start_date = date_matches[0].translate(_DATE_SEPARATORS)
                 if len(date_matches) >= 2:
-                    end_date = date_matches[1].replace("/", "-").replace(".", "-")
+                    end_date = date_matches[1].translate(_DATE_SEPARATORS)
 
         return {
             "id": tourney_id,
@@ -342,7 +479,7 @@ class ATPScraper(BaseScraper):
         if banner:
             src = banner.get("src", "").lower()
             # Check for level indicators in the filename
-            for level_key, level_name in self.LEVEL_MAPPING.items():
+            for level_key, level_name in self._LEVEL_MAPPING_ITEMS:
                 if level_key in src:
                     return level_name
 
@@ -356,7 +493,7 @@ class ATPScraper(BaseScraper):
         href_lower = href.lower()
         elem_classes = " ".join(elem.get("class", [])).lower()
 
-        for level_key, level_name in self.LEVEL_MAPPING.items():
+        for level_key, level_name in self._LEVEL_MAPPING_ITEMS:
             if level_key in href_lower or level_key in elem_classes:
                 return level_name
 
@@ -377,22 +514,11 @@ class ATPScraper(BaseScraper):
         Returns:
             Tournament level string
         """
-        tourney_lower = tourney_id.lower()
-
-        # Check Grand Slams first (highest priority)
-        if tourney_lower in self.GRAND_SLAM_TOURNAMENTS:
-            return "Grand Slam"
-
-        # Check Masters 1000
-        if tourney_lower in self.MASTERS_1000_TOURNAMENTS:
-            return "Masters 1000"
-
-        # Check ATP 500
-        if tourney_lower in self.ATP_500_TOURNAMENTS:
-            return "ATP 500"
-
-        # Default based on tour type
-        return "Challenger" if tour_type == "challenger" else "ATP 250"
+        # Known slug, else default based on tour type
+        return self._LEVEL_BY_ID.get(
+            tourney_id.lower(),
+            "Challenger" if tour_type == "challenger" else "ATP 250",
+        )
 
     async def _get_tournament_number(
         self,
@@ -424,26 +550,17 @@ class ATPScraper(BaseScraper):
         if tour_type == "challenger":
             url += "&tournamentType=ch"
 
-        await self.navigate(page, url, wait_for="domcontentloaded")
-        await self.random_delay()
-
-        html = await page.content()
-        soup = BeautifulSoup(html, "lxml")
-
-        # Find links matching this tournament
+        html = await self.fetch_html(
+            page, url, ready_selector=_ARCHIVE_READY_SELECTOR
+        )
+        # Find this tournament's results link with one scan of the raw HTML
+        # (no parse tree needed for a single URL pattern)
         # Format: /en/scores/archive/australian-open/580/2024/results
-        pattern = rf"/en/scores/archive/{re.escape(tournament_id)}/(\d+)/{year}/results"
-
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            match = re.search(pattern, href)
-            if match:
-                number = match.group(1)
-                self._tournament_number_cache[cache_key] = number
-                return number
+        match = _archive_number_re(tournament_id, year).search(html)
+        number = match.group(1) if match else None
 
-        self._tournament_number_cache[cache_key] = None
-        return None
+        self._tournament_number_cache[cache_key] = number
+        return number
 
     async def scrape_tournament_results(
         self,
@@ -468,58 +585,91 @@ class ATPScraper(BaseScraper):
         Yields:
             ScrapedMatch objects for each completed match
         """
-        # Use a single page for all operations (navigating between URLs)
-        # This is more efficient than opening multiple pages
-        page = await self.new_page()
-
-        try:
-            # Look up tournament number if not provided
-            # ATP URLs require: /en/scores/archive/{slug}/{number}/{year}/results
-            if not tournament_number:
-                print(f"Looking up tournament number for {tournament_id}...")
+        # Look up tournament number if not provided
+        # ATP URLs require: /en/scores/archive/{slug}/{number}/{year}/results
+        if not tournament_number:
+            print(f"Looking up tournament number for {tournament_id}...")
+            async with self.acquire_page() as page:
                 tournament_number = await self._get_tournament_number(
                     page, tournament_id, year, tour_type
                 )
 
-                if not tournament_number:
-                    print(f"Could not find tournament number for {tournament_id} {year}")
-                    return
-
-                print(f"Found tournament number: {tournament_number}")
+            if not tournament_number:
+                print(f"Could not find tournament number for {tournament_id} {year}")
+                return
 
-            # Get tournament metadata (navigates to tournament overview page)
-            tournament_info = await self._get_tournament_info(
-                page, tournament_id, year, tour_type,
-                tournament_number=tournament_number,
-            )
-            tournament_info["number"] = tournament_number
+            print(f"Found tournament number: {tournament_number}")
 
-            # Scrape main draw results
-            # Format: /en/scores/archive/{slug}/{number}/{year}/results
-            # Note: Deduplication is handled via external_id (which includes player IDs)
-            # at the calling layer (backfill script) and the database unique constraint
-            results_url = f"{self.BASE_URL}/en/scores/archive/{tournament_id}/{tournament_number}/{year}/results"
-            print(f"Scraping: {results_url}")
+        # Scrape main draw results
+        # Format: /en/scores/archive/{slug}/{number}/{year}/results
+        # Note: Deduplication is handled via external_id (which includes player IDs)
+        # at the calling layer (backfill script) and the database unique constraint
+        results_url = (
+            f"{self.BASE_URL}/en/scores/archive/"
+            f"{tournament_id}/{tournament_number}/{year}/results"
+        )
+        print(f"Scraping: {results_url}")
+
+        # The overview page (tournament metadata) and the results page are
+        # independent, so load them concurrently on two pages. Both pages are
+        # closed before any match is yielded.
+        tournament_info, html = await asyncio.gather(
+            self._load_tournament_info(
+                tournament_id, year, tour_type, tournament_number
+            ),
+            self._fetch_results_html(results_url),
+        )
+        tournament_info["number"] = tournament_number
 
-            await self.navigate(page, results_url, wait_for="domcontentloaded")
+        # Parse and yield matches
+        async for match in self._parse_results_page(html, tournament_info, "main"):
+            yield match
 
-            # Wait for match elements to load (ATP uses JavaScript rendering)
-            try:
-                await page.wait_for_selector(".match", timeout=4000)
-            except Exception:
-                print(f"Warning: No .match elements found on page for {tournament_id}")
+    async def _load_tournament_info(
+        self,
+        tournament_id: str,
+        year: int,
+        tour_type: str,
+        tournament_number: Optional[str],
+    ) -> dict:
+        """
+        Get tournament metadata on a page of its own.
 
-            await self.random_delay()
+        Args:
+            tournament_id: Tournament URL slug
+            year: Tournament year
+            tour_type: "main" or "challenger"
+            tournament_number: Tournament number for the overview URL
 
-            html = await page.content()
+        Returns:
+            Dictionary with tournament metadata (see _get_tournament_info)
+        """
+        async with self.acquire_page() as page:
+            return await self._get_tournament_info(
+                page, tournament_id, year, tour_type,
+                tournament_number=tournament_number,
+            )
 
-            # Parse and yield matches
-            async for match in self._parse_results_page(html, tournament_info, "main"):
-                yield match
+    async def _fetch_results_html(self, results_url: str) -> str:
+        """
+        Load a tournament results page and return its rendered HTML.
 
+        Args:
+            results_url: Full results archive URL
 
-        finally:
-            await page.close()
+        Returns:
+            HTML of the page's day headers, day contents and match cards
+            once match elements have rendered (or the wait timed out)
+        """
+        async with self.acquire_page() as page:
+            # Wait for match elements to load (ATP uses JavaScript rendering),
+            # then pull back just the results markup
+            return await self.fetch_html(
+                page,
+                results_url,
+                ready_selector=".match",
+                extract_script=_RESULTS_EXTRACT_JS,
+            )
 
     async def scrape_tournament_draw(
         self,
@@ -545,10 +695,9 @@ class ATPScraper(BaseScraper):
         Returns:
             List of ScrapedDrawEntry objects for all draw slots
         """
-        page = await self.new_page()
         entries = []
 
-        try:
+        async with self.acquire_page() as page:
             # Look up tournament number if not provided
             if not tournament_number:
                 print(f"Looking up tournament number for {tournament_id}...")
@@ -576,20 +725,18 @@ class ATPScraper(BaseScraper):
             await self.navigate(page, draws_url, wait_for="domcontentloaded")
 
             # Wait for draw-item elements (draws page uses .draw-item, not .match)
+            # (no extra delay once they are there)
             try:
                 await page.wait_for_selector(".draw-item", timeout=4000)
             except Exception:
                 print(f"Warning: No .draw-item elements found on draws page for {tournament_id}")
+                await self.random_delay()
 
-            await self.random_delay()
             html = await page.content()
 
             # Parse draw entries from the HTML
             entries = self._parse_draw_page(html, tournament_info)
 
-        finally:
-            await page.close()
-
         return entries
 
     def _parse_draw_page(
@@ -624,7 +771,7 @@ class ATPScraper(BaseScraper):
         Returns:
             List of ScrapedDrawEntry objects
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", parse_only=_DRAW_STRAINER)
         entries = []
 
         # Iterate over each round's .draw container
@@ -799,18 +946,14 @@ class ATPScraper(BaseScraper):
         name = link.get_text(strip=True).title()
 
         # ATP ID from href: /en/players/jannik-sinner/s0ag/overview
-        atp_id = None
-        href = link.get("href", "")
-        id_match = re.search(r"/players/[^/]+/([a-zA-Z0-9]+)/", href)
-        if id_match:
-            atp_id = id_match.group(1).upper()
+        atp_id = _atp_id_from_href(link.get("href", ""))
 
         # Seed from the span sibling of the link (e.g., "(1)")
         seed = None
         seed_span = name_div.find("span")
         if seed_span:
             seed_text = seed_span.get_text(strip=True)
-            seed_match = re.search(r"\((\d+)\)", seed_text)
+            seed_match = _PAREN_NUMBER_RE.search(seed_text)
             if seed_match:
                 seed = int(seed_match.group(1))
 
@@ -819,15 +962,15 @@ class ATPScraper(BaseScraper):
 
         # Extract per-set scores from .scores → .score-item
         # Each score-item has 2 spans: [game_count, tiebreak_score]
-        scores = []
+        scores: list[tuple[str, str]] = []
         scores_div = stats_item.find(class_="scores")
         if scores_div:
             for score_item in scores_div.find_all(class_="score-item"):
-                spans = score_item.find_all("span")
+                spans = score_item.find_all("span", limit=2)
                 games = spans[0].get_text(strip=True) if len(spans) >= 1 else ""
                 tiebreak = spans[1].get_text(strip=True) if len(spans) >= 2 else ""
                 if games:  # Only include sets that have been played
-                    scores.append({"games": games, "tiebreak": tiebreak})
+                    scores.append((games, tiebreak))
 
         return {
             "name": name,
@@ -839,49 +982,38 @@ class ATPScraper(BaseScraper):
 
     def _build_draw_score(
         self,
-        scores_a: list[dict],
-        scores_b: list[dict],
+        scores_a: list[tuple[str, str]],
+        scores_b: list[tuple[str, str]],
     ) -> Optional[str]:
         """
         Build a standard score string from per-player set scores.
 
         The draws page shows scores per player (unlike the results page which
-        interleaves them). Each player has a list of {games, tiebreak} dicts.
+        interleaves them). Each player has a list of (games, tiebreak) tuples.
+        A set missing on one side is padded as "0" games with no tiebreak.
 
         Args:
-            scores_a: Player A's per-set scores [{games: "6", tiebreak: ""}, ...]
-            scores_b: Player B's per-set scores [{games: "3", tiebreak: ""}, ...]
+            scores_a: Player A's per-set scores [("6", ""), ("7", ""), ...]
+            scores_b: Player B's per-set scores [("3", ""), ("6", "4"), ...]
 
         Returns:
             Score string like "6-3 7-6(4) 6-3" or None if no scores
 
         Example:
-            scores_a = [{"games": "6", "tiebreak": ""}, {"games": "7", "tiebreak": ""}]
-            scores_b = [{"games": "3", "tiebreak": ""}, {"games": "6", "tiebreak": "4"}]
+            scores_a = [("6", ""), ("7", "")]
+            scores_b = [("3", ""), ("6", "4")]
             → "6-3 7-6(4)"
         """
         if not scores_a and not scores_b:
             return None
 
-        num_sets = max(len(scores_a), len(scores_b))
-        if num_sets == 0:
-            return None
-
         sets = []
-        for i in range(num_sets):
-            a_games = scores_a[i]["games"] if i < len(scores_a) else "0"
-            b_games = scores_b[i]["games"] if i < len(scores_b) else "0"
-
-            set_str = f"{a_games}-{b_games}"
-
-            # Add tiebreak score (shown on the losing side)
-            a_tb = scores_a[i].get("tiebreak", "") if i < len(scores_a) else ""
-            b_tb = scores_b[i].get("tiebreak", "") if i < len(scores_b) else ""
+        for (a_games, a_tb), (b_games, b_tb) in zip_longest(
+            scores_a, scores_b, fillvalue=_EMPTY_SET_SCORE
+        ):
+            # Tiebreak score is shown on the losing side
             tb = a_tb or b_tb
-            if tb:
-                set_str += f"({tb})"
-
-            sets.append(set_str)
+            sets.append(f"{a_games}-{b_games}({tb})" if tb else f"{a_games}-{b_games}")
 
         result = " ".join(sets)
         return result if result.strip() else None
@@ -938,10 +1070,14 @@ class ATPScraper(BaseScraper):
             url = f"{self.BASE_URL}/en/tournaments/{tournament_id}/overview"
 
         try:
-            await self.navigate(page, url, wait_for="domcontentloaded")
-            await self.random_delay()
-
-            html = await page.content()
+            # Continue as soon as the overview details exist instead of
+            # sleeping; only fall back to the delay if they never show up
+            html = await self.fetch_html(
+                page,
+                url,
+                ready_selector="h1, ul.td_left li, .surface, .info-area",
+                ready_state="attached",
+            )
             soup = BeautifulSoup(html, "lxml")
 
             # Get tournament name
@@ -979,7 +1115,6 @@ class ATPScraper(BaseScraper):
 
             # Try to improve level detection from page content if we only have default
             # Only override if we find more specific information
-            page_text = soup.get_text().lower()
 
             # Check banner image first (most reliable)
             banner = soup.select_one(".events_banner, .tourney-badge, img[src*='banner']")
@@ -990,15 +1125,14 @@ class ATPScraper(BaseScraper):
                         info["level"] = level_name
                         break
             else:
-                # Fall back to page text analysis
-                if "grand slam" in page_text:
-                    info["level"] = "Grand Slam"
-                elif "masters 1000" in page_text or "atp masters" in page_text:
-                    info["level"] = "Masters 1000"
-                elif "atp 500" in page_text:
-                    info["level"] = "ATP 500"
-                elif "challenger" in page_text and info["level"] == "ATP 250":
-                    info["level"] = "Challenger"
+                # Fall back to page text analysis: collect every level keyword
+                # in one scan, then take the highest-priority one found
+                found = {kw.lower() for kw in _PAGE_LEVEL_RE.findall(soup.get_text())}
+                text_level = next(
+                    (level for kw, level in PAGE_LEVEL_KEYWORDS if kw in found), None
+                )
+                if text_level and (text_level != "Challenger" or info["level"] == "ATP 250"):
+                    info["level"] = text_level
 
         except Exception as e:
             print(f"Could not get tournament info for {tournament_id}: {e}")
@@ -1033,38 +1167,37 @@ class ATPScraper(BaseScraper):
         Yields:
             ScrapedMatch objects
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", parse_only=_RESULTS_STRAINER)
         match_number = 0
+        # Shared "YYYY_TOURNEY_" prefix of every external ID on this page
+        external_id_prefix = f"{tournament_info['year']}_{tournament_info['id']}_"
+
+        # Try day-based parsing first (2025+ ATP layout).
+        # One selector pass returns each day's content block directly; the
+        # adjacent header holds the date.
+        day_contents = soup.select(_DAY_CONTENT_SELECTOR)
 
-        # Try day-based parsing first (2025+ ATP layout)
-        day_elems = soup.find_all(class_="tournament-day")
+        # Every match card repeats its round label, and consecutive cards
+        # usually share it, so the round code is only recomputed on change.
+        last_round_text, current_round = None, ""
 
-        if day_elems:
-            for day_elem in day_elems:
-                # Extract date from the <h4> inside tournament-day
+        if day_contents:
+            for content in day_contents:
+                # Extract date from the <h4> inside the day header
                 # Format: "Sun, 11 January, 2026Day (9)" or just "Final"
+                header = content.find_previous_sibling(class_="atp_accordion-header")
                 match_date = self._extract_date_from_day_header(
-                    day_elem, tournament_info["year"]
+                    header, tournament_info["year"]
                 )
 
-                # Find matches in the accordion content (sibling of the header)
-                header = day_elem.parent  # atp_accordion-header
-                if not header:
-                    continue
-                content = header.find_next_sibling(class_="atp_accordion-content")
-                if not content:
-                    continue
-
+                day_first_match = match_number
                 match_containers = content.find_all(class_="match")
                 for match_elem in match_containers:
                     try:
-                        round_header = match_elem.find(class_="match-header")
-                        current_round = ""
-                        if round_header:
-                            span = round_header.find("span")
-                            if span:
-                                round_text = span.get_text(strip=True)
-                                current_round = self._normalize_round(round_text)
+                        round_text = _match_round_text(match_elem)
+                        if round_text != last_round_text:
+                            last_round_text = round_text
+                            current_round = self._normalize_round(round_text) if round_text else ""
 
                         match = self._parse_match_element(
                             match_elem,
@@ -1072,6 +1205,7 @@ class ATPScraper(BaseScraper):
                             current_round,
                             draw_type,
                             match_number,
+                            external_id_prefix=external_id_prefix,
                         )
 
                         if match:
@@ -1084,6 +1218,13 @@ class ATPScraper(BaseScraper):
                         print(f"Error parsing match element: {e}")
                         continue
 
+                # Free the day's subtree once its matches have been yielded -
+                # the consumer typically does DB work between matches, so this
+                # releases parsed days instead of holding the whole page.
+                # Blocks that yielded nothing stay for the flat fallback below.
+                if match_number > day_first_match:
+                    content.decompose()
+
             if match_number > 0:
                 return
 
@@ -1097,13 +1238,10 @@ class ATPScraper(BaseScraper):
 
         for match_elem in match_containers:
             try:
-                round_header = match_elem.find(class_="match-header")
-                current_round = ""
-                if round_header:
-                    span = round_header.find("span")
-                    if span:
-                        round_text = span.get_text(strip=True)
-                        current_round = self._normalize_round(round_text)
+                round_text = _match_round_text(match_elem)
+                if round_text != last_round_text:
+                    last_round_text = round_text
+                    current_round = self._normalize_round(round_text) if round_text else ""
 
                 match = self._parse_match_element(
                     match_elem,
@@ -1111,6 +1249,7 @@ class ATPScraper(BaseScraper):
                     current_round,
                     draw_type,
                     match_number,
+                    external_id_prefix=external_id_prefix,
                 )
 
                 if match:
@@ -1131,12 +1270,16 @@ class ATPScraper(BaseScraper):
         - "Final" → None (no date available on older pages)
 
         Args:
-            day_elem: BeautifulSoup element with class="tournament-day"
+            day_elem: BeautifulSoup element containing the tournament-day <h4>
+                      (the tournament-day itself or its accordion header)
             year: Tournament year (used as fallback for parsing)
 
         Returns:
             ISO date string "YYYY-MM-DD" or None if no date found
         """
+        if day_elem is None:
+            return None
+
         h4 = day_elem.find("h4")
         if not h4:
             return None
@@ -1145,24 +1288,22 @@ class ATPScraper(BaseScraper):
 
         # Try to match a date pattern like "Sun, 11 January, 2026"
         # The "Day (N)" suffix gets concatenated but we can ignore it
-        date_match = re.search(
-            r"(\d{1,2})\s+(January|February|March|April|May|June|"
-            r"July|August|September|October|November|December)"
-            r"(?:,?\s*(\d{4}))?",
-            text
-        )
-        if not date_match:
+        for date_match in _DAY_DATE_RE.finditer(text):
+            month = _MONTHS.get(date_match.group(2))
+            if month:
+                break
+        else:
             return None
 
         day = int(date_match.group(1))
-        month_name = date_match.group(2)
         match_year = int(date_match.group(3)) if date_match.group(3) else year
 
+        # Build the ISO string directly; datetime() only validates the day
         try:
-            dt = datetime.strptime(f"{day} {month_name} {match_year}", "%d %B %Y")
-            return dt.strftime("%Y-%m-%d")
+            datetime(match_year, month, day)
         except ValueError:
             return None
+        return f"{match_year:04d}-{month:02d}-{day:02d}"
 
     def _parse_match_element(
         self,
@@ -1171,6 +1312,7 @@ class ATPScraper(BaseScraper):
         current_round: str,
         draw_type: str,
         match_number: int,
+        external_id_prefix: Optional[str] = None,
     ) -> Optional[ScrapedMatch]:
         """
         Parse a single match element using v3.0's working selectors.
@@ -1186,6 +1328,8 @@ class ATPScraper(BaseScraper):
             current_round: Current round (from header)
             draw_type: 'main' or 'qualifying'
             match_number: Match number for external ID
+            external_id_prefix: Precomputed "YYYY_TOURNEY_" external ID prefix
+                                (built from tournament_info when omitted)
 
         Returns:
             ScrapedMatch if successfully parsed, None otherwise
@@ -1210,8 +1354,8 @@ class ATPScraper(BaseScraper):
         name_a = player_a_link.get_text(strip=True).title()
         name_b = player_b_link.get_text(strip=True).title()
 
-        # Skip byes
-        if name_a.lower() == "bye" or name_b.lower() == "bye":
+        # Skip byes (names are already title-cased, so no extra lowercasing)
+        if name_a == "Bye" or name_b == "Bye":
             return None
 
         # Skip walkovers shown in score
@@ -1220,49 +1364,41 @@ class ATPScraper(BaseScraper):
         # Extract ATP IDs from href
         # Format: /en/players/jannik-sinner/s0ag/overview
         # Note: IDs can be lowercase (s0ag, mm58) or uppercase (D0AG)
-        href_a = player_a_link.get("href", "")
-        href_b = player_b_link.get("href", "")
-
-        id_match_a = re.search(r"/players/[^/]+/([a-zA-Z0-9]+)/", href_a)
-        id_match_b = re.search(r"/players/[^/]+/([a-zA-Z0-9]+)/", href_b)
-
-        atp_id_a = id_match_a.group(1).upper() if id_match_a else None
-        atp_id_b = id_match_b.group(1).upper() if id_match_b else None
+        atp_id_a = _atp_id_from_href(player_a_link.get("href", ""))
+        atp_id_b = _atp_id_from_href(player_b_link.get("href", ""))
 
         # Clean names and extract seeds
         name_a, seed_a = extract_seed_from_name(name_a)
         name_b, seed_b = extract_seed_from_name(name_b)
 
-        # Get scores using v3.0 pattern (class="score-item")
-        score_items = match_elem.find_all(class_="score-item")
-        score_raw = self._parse_score_items(score_items)
+        match_cta = match_elem.find(class_="match-cta")
+        cta_text = match_cta.get_text() if match_cta else ""
+
+        # Get scores using v3.0 pattern (class="score-item"), unless the CTA
+        # already marks a walkover - no games were played, so the score cells
+        # are at most placeholders
+        cta_status = _STATUS_RE.search(cta_text)
+        if cta_status and cta_status.group(0).lower() != "ret":
+            score_raw, last_set = "", None
+        else:
+            score_items = match_elem.find_all(class_="score-item")
+            score_raw, last_set = self._parse_score_items(score_items)
 
         # Determine match status (completed, retired, walkover)
         status = "completed"
 
-        # Strategy 1: Check match-cta text for explicit indicators
-        match_cta = match_elem.find(class_="match-cta")
-        if match_cta:
-            cta_text = match_cta.get_text().lower()
-            if "w/o" in cta_text or "walkover" in cta_text:
-                status = "walkover"
-            elif "ret" in cta_text:
-                status = "retired"
-
-        # Strategy 2: Check score text for explicit indicators
-        if status == "completed" and score_raw:
-            score_lower = score_raw.lower()
-            if "w/o" in score_lower or "walkover" in score_lower:
-                status = "walkover"
-            elif "ret" in score_lower:
-                status = "retired"
+        # Strategies 1 & 2: Look for explicit indicators in the match-cta text,
+        # then the score, with one scan over both (CTA text comes first)
+        status_match = _STATUS_RE.search(f"{cta_text} {score_raw}")
+        if status_match:
+            status = "retired" if status_match.group(0).lower() == "ret" else "walkover"
 
         # Strategy 3: Detect retirement from incomplete final set
         # ATP doesn't always mark retirements explicitly — the score just
         # shows an incomplete set (e.g. "7-5 2-1" where neither player
         # reached 6 games in the last set)
-        if status == "completed" and score_raw:
-            status = _detect_retirement_from_score(score_raw, status)
+        elif last_set:
+            status = _detect_retirement_from_score(last_set, status)
 
         # Strategy 4: No score at all but match exists -> walkover
         if not score_raw or score_raw.strip() == "":
@@ -1273,17 +1409,21 @@ class ATPScraper(BaseScraper):
         # Format: YYYY_TOURNEY_ROUND_PLAYERID1_PLAYERID2 (sorted for consistency)
         # This ensures the same match always gets the same external_id regardless
         # of parsing order or if it appears multiple times in the HTML
-        round_code = current_round if current_round else "R128"
-        if draw_type == "qualifying" and current_round:
-            round_code = f"Q{current_round[-1] if current_round[-1].isdigit() else '1'}"
+        round_code = _external_round_code(current_round, draw_type)
 
         # Use player IDs if available, otherwise fall back to normalized names
+        # (the name slug is only built when the ID is missing)
         # Sort to ensure consistent ordering (A vs B == B vs A)
-        player_id_a = atp_id_a or name_a.lower().replace(" ", "-")
-        player_id_b = atp_id_b or name_b.lower().replace(" ", "-")
-        sorted_ids = sorted([player_id_a, player_id_b])
+        player_id_a = atp_id_a or _name_slug(name_a)
+        player_id_b = atp_id_b or _name_slug(name_b)
+        if player_id_a <= player_id_b:
+            low_id, high_id = player_id_a, player_id_b
+        else:
+            low_id, high_id = player_id_b, player_id_a
 
-        external_id = f"{tournament_info['year']}_{tournament_info['id']}_{round_code}_{sorted_ids[0]}_{sorted_ids[1]}"
+        if external_id_prefix is None:
+            external_id_prefix = f"{tournament_info['year']}_{tournament_info['id']}_"
+        external_id = f"{external_id_prefix}{round_code}_{low_id}_{high_id}"
 
         return ScrapedMatch(
             external_id=external_id,
@@ -1307,7 +1447,9 @@ class ATPScraper(BaseScraper):
             status=status,
         )
 
-    def _parse_score_items(self, score_items) -> str:
+    def _parse_score_items(
+        self, score_items
+    ) -> tuple[str, Optional[tuple[int, int]]]:
         """
         Parse ATP score items into standard format.
 
@@ -1322,33 +1464,25 @@ class ATPScraper(BaseScraper):
             score_items: List of BeautifulSoup elements with class="score-item"
 
         Returns:
-            Score string in standard format like "7-6(5) 6-4"
+            Tuple of (score string in standard format like "7-6(5) 6-4",
+            (a_games, b_games) of the last set or None if not numeric)
         """
         if not score_items:
-            return ""
+            return "", None
 
         scores = []
         for item in score_items:
-            span = item.find("span")
-            if not span:
-                continue
-
-            score_text = span.get_text(strip=True)
-
-            # Include tiebreak scores from additional spans
-            # (sometimes shown as separate spans within the item)
-            extra_spans = item.find_all("span")[1:]
-            for extra in extra_spans:
-                extra_text = extra.get_text(strip=True)
-                if extra_text:
-                    score_text += extra_text
-
+            # Game count in the first span, tiebreak score (if any) in
+            # additional spans - one walk collects both
+            score_text = "".join(
+                span.get_text(strip=True) for span in item.find_all("span")
+            )
             if score_text:
                 scores.append(score_text)
 
         # Need even number of scores (half for each player)
         if not scores or len(scores) % 2 != 0:
-            return ""
+            return "", None
 
         # Combine into standard format: "7-6(5) 6-4"
         half = len(scores) // 2
@@ -1362,23 +1496,25 @@ class ATPScraper(BaseScraper):
             a_games = a_score[0] if a_score else "0"
             b_games = b_score[0] if b_score else "0"
 
-            set_str = f"{a_games}-{b_games}"
-
             # Add tiebreak if present (in parentheses)
             # Tiebreak shown after the game count, e.g., "7(5)" means 7 games with tiebreak 5
-            if len(a_score) > 1 and "(" in a_score:
-                # Extract tiebreak portion
-                tb_match = re.search(r"\((\d+)\)", a_score)
-                if tb_match:
-                    set_str += f"({tb_match.group(1)})"
-            elif len(b_score) > 1 and "(" in b_score:
-                tb_match = re.search(r"\((\d+)\)", b_score)
-                if tb_match:
-                    set_str += f"({tb_match.group(1)})"
+            # Most sets have no tiebreak, so a plain "(" check avoids the regex
+            tb_match = None
+            if "(" in a_score:
+                tb_match = _PAREN_NUMBER_RE.search(a_score)
+            if tb_match is None and "(" in b_score:
+                tb_match = _PAREN_NUMBER_RE.search(b_score)
+            if tb_match:
+                sets.append(f"{a_games}-{b_games}({tb_match.group(1)})")
+            else:
+                sets.append(f"{a_games}-{b_games}")
 
-            sets.append(set_str)
+        # Last set's game counts, reused for retirement detection
+        last_set = None
+        if a_games.isdigit() and b_games.isdigit():
+            last_set = (int(a_games), int(b_games))
 
-        return " ".join(sets)
+        return " ".join(sets), last_set
 
     async def scrape_fixtures(
         self,
@@ -1395,9 +1531,7 @@ class ATPScraper(BaseScraper):
         Yields:
             ScrapedFixture objects for upcoming matches
         """
-        page = await self.new_page()
-
-        try:
+        async with self.acquire_page() as page:
             # Get current year
             year = datetime.now().year
 
@@ -1418,7 +1552,7 @@ class ATPScraper(BaseScraper):
             await self.random_delay()
 
             html = await page.content()
-            soup = BeautifulSoup(html, "lxml")
+            soup = BeautifulSoup(html, "lxml", parse_only=_FIXTURE_STRAINER)
 
             # Get tournament info
             tournament_info = {
@@ -1455,7 +1589,7 @@ class ATPScraper(BaseScraper):
                 court = None
                 court_elem = elem.select_one(".schedule-location-timestamp strong")
                 if court_elem:
-                    court = court_elem.get_text(strip=True)
+                    court = _leaf_text(court_elem)
                     last_court_by_group[group_key] = court
                 else:
                     court = last_court_by_group.get(group_key)
@@ -1498,9 +1632,6 @@ class ATPScraper(BaseScraper):
 
                 yield fixture
 
-        finally:
-            await page.close()
-
     def _parse_fixture_element(
         self,
         elem,
@@ -1534,7 +1665,7 @@ class ATPScraper(BaseScraper):
 
         # Legacy structure parsing
         # Find players
-        player_elems = elem.select("a[href*='/players/'], .player-name")
+        player_elems = _FIXTURE_PLAYERS_SEL.select(elem)
         if len(player_elems) < 2:
             return None
 
@@ -1545,16 +1676,16 @@ class ATPScraper(BaseScraper):
             return None
 
         # Get scheduled time
-        time_elem = elem.select_one(".time, .schedule-time")
-        scheduled_time = time_elem.get_text(strip=True) if time_elem else None
+        time_elem = _FIXTURE_TIME_SEL.select_one(elem)
+        scheduled_time = _leaf_text(time_elem) if time_elem else None
 
         # Get court
-        court_elem = elem.select_one(".court, .venue")
-        court = court_elem.get_text(strip=True) if court_elem else None
+        court_elem = _FIXTURE_COURT_SEL.select_one(elem)
+        court = _leaf_text(court_elem) if court_elem else None
 
         # Get round
-        round_elem = elem.select_one(".round, .match-round")
-        round_str = round_elem.get_text(strip=True) if round_elem else "R64"
+        round_elem = _FIXTURE_ROUND_SEL.select_one(elem)
+        round_str = _leaf_text(round_elem) if round_elem else "R64"
 
         return ScrapedFixture(
             tournament_name=tournament_info["name"],
@@ -1578,7 +1709,7 @@ class ATPScraper(BaseScraper):
         round_str = "R32"
         round_elem = elem.select_one(".schedule-type")
         if round_elem:
-            round_str = round_elem.get_text(strip=True)
+            round_str = _leaf_text(round_elem)
 
         # 2. Players
         players_div = elem.select_one(".schedule-players")
@@ -1661,7 +1792,7 @@ class ATPScraper(BaseScraper):
         time_text = None
         time_elem = elem.select_one(".schedule-location-timestamp .matchtime")
         if time_elem:
-            time_text = time_elem.get_text(strip=True)
+            time_text = _leaf_text(time_elem)
         else:
             display_time = elem.get("data-displaytime") or ""
             if display_time:
@@ -1673,7 +1804,7 @@ class ATPScraper(BaseScraper):
         followed_by = "followed by" in suffix or (time_text and "followed by" in time_text.lower())
 
         def parse_ampm_time(text: str) -> Optional[str]:
-            match = re.search(r"(\d{1,2})(?:[:\.](\d{2}))?\s*([AP]M)", text, re.I)
+            match = _AMPM_TIME_RE.search(text)
             if not match:
                 return None
             hour = int(match.group(1))
@@ -1686,7 +1817,7 @@ class ATPScraper(BaseScraper):
             return f"{hour:02d}:{minute:02d}"
 
         def parse_24h_time(text: str) -> Optional[str]:
-            match = re.search(r"(\d{1,2}):(\d{2})", text)
+            match = _24H_TIME_RE.search(text)
             if not match:
                 return None
             return f"{int(match.group(1)):02d}:{match.group(2)}"
@@ -1710,7 +1841,115 @@ class ATPScraper(BaseScraper):
         return {"date": date_str, "time": time_str, "followed_by": followed_by}
 
 
-def _detect_retirement_from_score(score_raw: str, current_status: str) -> str:
+def _leaf_text(elem) -> str:
+    """
+    Stripped text of an element that normally holds a single string.
+
+    Reads .string directly for leaf cells (court, time, round) and only
+    falls back to the recursive get_text walk when there are several
+    text nodes.
+
+    Args:
+        elem: BeautifulSoup element
+
+    Returns:
+        The element's text, stripped
+    """
+    text = elem.string
+    return text.strip() if text is not None else elem.get_text(strip=True)
+
+
+def _match_round_text(match_elem) -> str:
+    """
+    Raw round label from a results-page match card.
+
+    Args:
+        match_elem: BeautifulSoup element with class="match"
+
+    Returns:
+        Text of the card's .match-header span (e.g., "Quarter-Finals"),
+        or "" if the card has no round header
+    """
+    round_header = match_elem.find(class_="match-header")
+    span = round_header.find("span") if round_header else None
+    return span.get_text(strip=True) if span else ""
+
+
+@lru_cache(maxsize=256)
+def _archive_number_re(tournament_id: str, year: int) -> re.Pattern:
+    """
+    Compiled pattern for one tournament's results link in the archive.
+
+    Args:
+        tournament_id: Tournament URL slug (e.g., "australian-open")
+        year: Archive year
+
+    Returns:
+        Pattern whose group 1 is the tournament number
+    """
+    return re.compile(
+        rf"/en/scores/archive/{re.escape(tournament_id)}/(\d+)/{year}/results"
+    )
+
+
+@lru_cache(maxsize=2048)
+def _atp_id_from_href(href: str) -> Optional[str]:
+    """
+    Extract the uppercased ATP player ID from a player profile href.
+
+    Memoized since the same players' links repeat across a tournament.
+
+    Args:
+        href: Link like "/en/players/jannik-sinner/s0ag/overview"
+
+    Returns:
+        ATP ID like "S0AG", or None if the href has no player ID
+    """
+    id_match = _PLAYER_ID_RE.search(href)
+    return id_match.group(1).upper() if id_match else None
+
+
+@lru_cache(maxsize=4096)
+def _name_slug(name: str) -> str:
+    """
+    Fallback player key for external IDs when a match has no ATP ID.
+
+    Memoized since a player reappears in every round they reach.
+
+    Args:
+        name: Cleaned player name like "Jannik Sinner"
+
+    Returns:
+        Slug like "jannik-sinner"
+    """
+    return name.lower().replace(" ", "-")
+
+
+@lru_cache(maxsize=64)
+def _external_round_code(current_round: str, draw_type: str) -> str:
+    """
+    Round code used in match external IDs.
+
+    Qualifying rounds become Q1/Q2/Q3 from the round's trailing digit.
+    Memoized since every match in a round shares the same code.
+
+    Args:
+        current_round: Normalized round from the results page (may be empty)
+        draw_type: 'main' or 'qualifying'
+
+    Returns:
+        Round code like "SF" or "Q2" ("R128" when the round is unknown)
+    """
+    if not current_round:
+        return "R128"
+    if draw_type == "qualifying":
+        return f"Q{current_round[-1] if current_round[-1].isdigit() else '1'}"
+    return current_round
+
+
+def _detect_retirement_from_score(
+    last_set: tuple[int, int], current_status: str
+) -> str:
     """
     Detect retirement from an incomplete final set in the score.
 
@@ -1722,7 +1961,7 @@ def _detect_retirement_from_score(score_raw: str, current_status: str) -> str:
     it's not a tiebreak situation (both at 6 or 7).
 
     Args:
-        score_raw: Score string like "6-4 2-1" or "7-6(5) 3-6 4-2"
+        last_set: (a_games, b_games) of the final set, e.g. (2, 1) for "6-4 2-1"
         current_status: Current status (only overrides if "completed")
 
     Returns:
@@ -1731,23 +1970,7 @@ def _detect_retirement_from_score(score_raw: str, current_status: str) -> str:
     if current_status != "completed":
         return current_status
 
-    if not score_raw:
-        return current_status
-
-    # Split into sets and check the last one
-    sets = score_raw.strip().split()
-    if not sets:
-        return current_status
-
-    last_set = sets[-1]
-
-    # Match standard set score pattern: "6-4", "7-6(5)", etc.
-    match = re.match(r"^(\d+)-(\d+)", last_set)
-    if not match:
-        return current_status
-
-    a_games = int(match.group(1))
-    b_games = int(match.group(2))
+    a_games, b_games = last_set
 
     # A set is complete if:
     # - A player reached 6+ and leads by 2+ (e.g. 6-4, 6-3, 6-0)
@@ -1786,6 +2009,46 @@ async def scrape_atp_tournament(
     return matches
 
 
+async def scrape_atp_tournaments(
+    ids_years: list[tuple[str, int]],
+    tour_type: str = "main",
+    max_concurrency: int = 4,
+) -> list[ScrapedMatch]:
+    """
+    Convenience function to scrape several ATP tournaments concurrently.
+
+    All tournaments share one browser session; each runs on its own page
+    (see BaseScraper.acquire_page), with at most `max_concurrency`
+    tournaments in flight.
+
+    Args:
+        ids_years: (tournament_id, year) pairs to scrape
+        tour_type: "main" for ATP main tour, "challenger" for Challenger tour
+        max_concurrency: Maximum number of tournaments scraped at once
+
+    Returns:
+        List of ScrapedMatch objects, grouped by tournament in input order
+    """
+    semaphore = asyncio.BoundedSemaphore(max_concurrency)
+
+    async with ATPScraper() as scraper:
+
+        async def scrape_one(tournament_id: str, year: int) -> list[ScrapedMatch]:
+            async with semaphore:
+                return [
+                    match
+                    async for match in scraper.scrape_tournament_results(
+                        tournament_id, year, tour_type=tour_type
+                    )
+                ]
+
+        results = await asyncio.gather(
+            *(scrape_one(tournament_id, year) for tournament_id, year in ids_years)
+        )
+
+    return [match for matches in results for match in matches]
+
+
 async def scrape_challenger_tournament(
     tournament_id: str,
     year: int,
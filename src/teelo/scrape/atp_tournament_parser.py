@@ -35,7 +35,8 @@ import re
 from datetime import datetime
 from typing import Optional
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 
 
 # Maps banner image filename keywords to tournament levels.
@@ -50,6 +51,47 @@ BANNER_LEVEL_MAP: dict[str, str] = {
     "finals": "ATP Finals",
 }
 
+# All banner keywords in one pattern, longest first so a longer keyword is
+# never cut short by a shorter one at the same position
+_BANNER_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(BANNER_LEVEL_MAP, key=len, reverse=True))
+)
+
+# Tournament slug and number from the results link
+# (/en/scores/archive/{slug}/{number}/{year}/results) and the profile link
+# (/en/tournaments/{slug}/{number}/overview)
+_RESULTS_LINK_RE = re.compile(r"/scores/archive/([^/]+)/(\d+)/")
+_PROFILE_LINK_RE = re.compile(r"/tournaments/([^/]+)/(\d+)/")
+
+# Archive date range pieces: the range separator (hyphen or en-dash, with
+# optional spaces) and a month name on the start side
+_DATE_RANGE_SPLIT_RE = re.compile(r"\s*[-–]\s*")
+_HAS_LETTER_RE = re.compile(r"[a-zA-Z]")
+
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        (
+            "january", "february", "march", "april", "may", "june",
+            "july", "august", "september", "october", "november", "december",
+        ),
+        start=1,
+    )
+}
+
+# Only the tournament list is parsed; the rest of the archive page is skipped
+_ARCHIVE_STRAINER = SoupStrainer("div", class_="tournament-list")
+
+# Archive selectors, compiled once instead of per entry
+_TOURNAMENT_LIST_SEL = sv.compile(".tournament-list")
+_ENTRY_SEL = sv.compile("ul.events > li")
+_RESULTS_LINK_SEL = sv.compile("a.results")
+_PROFILE_LINK_SEL = sv.compile("a.tournament__profile")
+_NAME_SEL = sv.compile("span.name")
+_VENUE_SEL = sv.compile("span.venue")
+_DATE_SEL = sv.compile("span.Date")
+_BANNER_SEL = sv.compile("img.events_banner")
+
 
 def parse_atp_date_range(date_text: str, year: int) -> tuple[Optional[str], Optional[str]]:
     """
@@ -76,7 +118,7 @@ def parse_atp_date_range(date_text: str, year: int) -> tuple[Optional[str], Opti
 
         # Split on " - " (with spaces around the dash/hyphen)
         # Some pages may use en-dash (–) instead of hyphen
-        parts = re.split(r"\s*[-–]\s*", date_text, maxsplit=1)
+        parts = _DATE_RANGE_SPLIT_RE.split(date_text, maxsplit=1)
         if len(parts) != 2:
             return None, None
 
@@ -84,7 +126,10 @@ def parse_atp_date_range(date_text: str, year: int) -> tuple[Optional[str], Opti
         right = parts[1].strip()  # e.g., "7 January, 2024"
 
         # Parse the right side first — it always has "DD Month, YYYY"
-        end_date = datetime.strptime(right, "%d %B, %Y")
+        end_day, end_month, end_year = _parse_archive_date(right)
+        if end_year is None:
+            return None, None
+        end_date = datetime(end_year, end_month, end_day)
 
         # Parse the left side — format varies:
         #   "31 December, 2023" — full date with year
@@ -93,16 +138,19 @@ def parse_atp_date_range(date_text: str, year: int) -> tuple[Optional[str], Opti
 
         if "," in left:
             # Full date with year: "31 December, 2023"
-            start_date = datetime.strptime(left, "%d %B, %Y")
-        elif re.search(r"[a-zA-Z]", left):
+            start_day, start_month, start_year = _parse_archive_date(left)
+            if start_year is None:
+                return None, None
+            start_date = datetime(start_year, start_month, start_day)
+        elif _HAS_LETTER_RE.search(left):
             # Day + month without year: "29 January"
-            start_parsed = datetime.strptime(left, "%d %B")
+            start_day, start_month, _ = _parse_archive_date(left)
             # Determine year: if start month > end month, it's the previous year
             # (e.g., December start, January end means December of year-1)
             start_year = end_date.year
-            if start_parsed.month > end_date.month:
+            if start_month > end_date.month:
                 start_year -= 1
-            start_date = start_parsed.replace(year=start_year)
+            start_date = datetime(start_year, start_month, start_day)
         else:
             # Day only: "1" — use month and year from end_date
             start_day = int(left)
@@ -122,6 +170,29 @@ def parse_atp_date_range(date_text: str, year: int) -> tuple[Optional[str], Opti
         return None, None
 
 
+def _parse_archive_date(text: str) -> tuple[int, int, Optional[int]]:
+    """
+    Split an archive date like "31 December, 2023" or "29 January".
+
+    A month-name lookup instead of datetime.strptime, which rebuilds its
+    format regex state on every call.
+
+    Args:
+        text: Day, full month name and optional ", YYYY"
+
+    Returns:
+        Tuple of (day, month, year), with year None when not given
+
+    Raises:
+        ValueError: If the text isn't in either form
+    """
+    parts = text.replace(",", " ").split()
+    if len(parts) not in (2, 3) or parts[1].lower() not in _MONTHS:
+        raise ValueError(f"Unrecognised archive date: {text!r}")
+    year = int(parts[2]) if len(parts) == 3 else None
+    return int(parts[0]), _MONTHS[parts[1].lower()], year
+
+
 def _detect_level_from_banner(src: str) -> Optional[str]:
     """
     Detect tournament level from the banner image filename.
@@ -134,11 +205,32 @@ def _detect_level_from_banner(src: str) -> Optional[str]:
     Returns:
         Level string (e.g., "ATP 250") or None if not recognized
     """
-    src_lower = src.lower()
-    for keyword, level in BANNER_LEVEL_MAP.items():
-        if keyword in src_lower:
-            return level
-    return None
+    # Match against the filename only, so digits elsewhere in the URL
+    # (CDN paths, image sizes) can't be mistaken for a level
+    filename = src.rpartition("/")[2].lower()
+    # Most tour events are 250s, so check their stamp before the regex
+    if filename.endswith("_250.png"):
+        return "ATP 250"
+    match = _BANNER_RE.search(filename)
+    return BANNER_LEVEL_MAP[match.group()] if match else None
+
+
+def parse_tournament_html(html: str, year: int) -> list[dict]:
+    """
+    Parse tournament entries from raw ATP archive page HTML.
+
+    Only the div.tournament-list subtree is built into a tree, which is
+    much cheaper than parsing the whole page first.
+
+    Args:
+        html: Raw HTML of the ATP results archive page
+        year: The year being scraped
+
+    Returns:
+        List of tournament dicts (see parse_tournament_elements)
+    """
+    soup = BeautifulSoup(html, "lxml", parse_only=_ARCHIVE_STRAINER)
+    return parse_tournament_elements(soup, year)
 
 
 def parse_tournament_elements(soup: BeautifulSoup, year: int) -> list[dict]:
@@ -159,12 +251,12 @@ def parse_tournament_elements(soup: BeautifulSoup, year: int) -> list[dict]:
     tournaments: list[dict] = []
 
     # The tournament list is inside <div class="tournament-list">
-    tournament_list = soup.select_one(".tournament-list")
+    tournament_list = _TOURNAMENT_LIST_SEL.select_one(soup)
     if not tournament_list:
         return tournaments
 
     # Each tournament is an <li> inside <ul class="events">
-    entries = tournament_list.select("ul.events > li")
+    entries = _ENTRY_SEL.select(tournament_list)
 
     for entry in entries:
         try:
@@ -195,10 +287,10 @@ def _parse_single_tournament(entry, year: int) -> Optional[dict]:
     tournament_id = None
     tournament_number = None
 
-    results_link = entry.select_one("a.results")
+    results_link = _RESULTS_LINK_SEL.select_one(entry)
     if results_link:
         href = results_link.get("href", "")
-        match = re.search(r"/scores/archive/([^/]+)/(\d+)/", href)
+        match = _RESULTS_LINK_RE.search(href)
         if match:
             tournament_id = match.group(1)
             tournament_number = match.group(2)
@@ -206,10 +298,10 @@ def _parse_single_tournament(entry, year: int) -> Optional[dict]:
     # Fallback: try the tournament profile link
     # /en/tournaments/{slug}/{number}/overview
     if not tournament_id:
-        profile_link = entry.select_one("a.tournament__profile")
+        profile_link = _PROFILE_LINK_SEL.select_one(entry)
         if profile_link:
             href = profile_link.get("href", "")
-            match = re.search(r"/tournaments/([^/]+)/(\d+)/", href)
+            match = _PROFILE_LINK_RE.search(href)
             if match:
                 tournament_id = match.group(1)
                 tournament_number = match.group(2)
@@ -219,12 +311,12 @@ def _parse_single_tournament(entry, year: int) -> Optional[dict]:
         return None
 
     # --- Tournament name ---
-    name_elem = entry.select_one("span.name")
+    name_elem = _NAME_SEL.select_one(entry)
     name = name_elem.get_text(strip=True) if name_elem else tournament_id.replace("-", " ").title()
 
     # --- Location ---
     # <span class="venue">Brisbane, Australia | </span>
-    venue_elem = entry.select_one("span.venue")
+    venue_elem = _VENUE_SEL.select_one(entry)
     location = ""
     if venue_elem:
         location = venue_elem.get_text(strip=True).rstrip("| ").strip()
@@ -232,7 +324,7 @@ def _parse_single_tournament(entry, year: int) -> Optional[dict]:
     # --- Dates ---
     # <span class="Date">31 December, 2023 - 7 January, 2024</span>
     # Note: capital "D" in class name
-    date_elem = entry.select_one("span.Date")
+    date_elem = _DATE_SEL.select_one(entry)
     start_date = None
     end_date = None
     if date_elem:
@@ -242,7 +334,7 @@ def _parse_single_tournament(entry, year: int) -> Optional[dict]:
     # --- Level from banner image ---
     # <img class="events_banner" src="...categorystamps_250.png"/>
     level = "ATP 250"  # Default
-    banner = entry.select_one("img.events_banner")
+    banner = _BANNER_SEL.select_one(entry)
     if banner:
         src = banner.get("src", "")
         detected = _detect_level_from_banner(src)
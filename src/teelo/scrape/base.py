@@ -13,17 +13,37 @@ Key features:
 """
 
 import asyncio
+import errno
+import hashlib
 import logging
 import os
 import random
 import shutil
+import socket
 import subprocess
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import AsyncGenerator, Optional
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Optional,
+    TypeVar,
+)
+from urllib.parse import urlsplit
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 from playwright_stealth import Stealth
 
 from teelo.config import settings
@@ -33,8 +53,94 @@ logger = logging.getLogger(__name__)
 # Stealth configuration to avoid bot detection (Cloudflare, etc.)
 _stealth = Stealth()
 
+# Responses that mean "slow down" rather than "page broken"
+_RATE_LIMIT_STATUSES = frozenset({429, 503})
+
+# Navigation pacing after rate limits (AIMD): the pause before each
+# navigation doubles on a 429/503 and shrinks by a fixed step per success
+_NAV_PAUSE_MIN_STEP = 1.0
+_NAV_PAUSE_MAX = 60.0
+_NAV_PAUSE_DECREASE = 0.5
+
 
 @dataclass
+class _HostPacing:
+    """Navigation pacing state for one host (see BaseScraper.navigate)."""
+
+    # Pause before every navigation to the host
+    pause: float = 0.0
+    # time.monotonic() until which navigation to the host is on hold
+    throttle_until: float = 0.0
+
+
+# Pacing is tracked per host and shared by every scraper in the process, so
+# a rate limit from one site never slows down navigation to another
+_host_pacing: dict[str, _HostPacing] = {}
+
+
+def _pacing_for(url: str) -> _HostPacing:
+    """Pacing state for a URL's host, created on first use."""
+    host = urlsplit(url).netloc
+    pacing = _host_pacing.get(host)
+    if pacing is None:
+        pacing = _host_pacing[host] = _HostPacing()
+    return pacing
+
+
+class RateLimitedError(Exception):
+    """Raised when a navigation is answered with 429/503."""
+
+    def __init__(self, url: str, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status} for {url}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+
+
+# Failures with_retry retries: page loads/timeouts, rate limits and network
+# errors (ConnectionError is an OSError). Anything else is a bug and is
+# raised on the first attempt.
+_RETRYABLE = (PlaywrightError, RateLimitedError, asyncio.TimeoutError, OSError)
+
+
+# Browser context fingerprint shared by every scraper (see __aenter__)
+_CONTEXT_OPTIONS = MappingProxyType({
+    "user_agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "viewport": {"width": 1920, "height": 1080},
+    "locale": "en-US",
+})
+
+# Requests no scraper needs: parsers only read the DOM, never images, fonts
+# or media, and analytics beacons just add network round-trips.
+# Stylesheets are kept so visibility-based waits behave as in a real browser.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_URL_PARTS = (
+    "googletagmanager",
+    "google-analytics",
+    "doubleclick",
+    "facebook",
+)
+
+# Runs in the page for fetch_text_matrix: one row per row element, one
+# cell per column ("@name" = row attribute or null, "" = the row's own
+# text, otherwise text of the first matching descendant or "")
+_TEXT_MATRIX_SCRIPT = """
+({rowSelector, columns}) => Array.from(
+    document.querySelectorAll(rowSelector),
+    (row) => columns.map((column) => {
+        if (column.startsWith("@")) return row.getAttribute(column.slice(1));
+        const cell = column ? row.querySelector(column) : row;
+        return cell ? cell.innerText.trim() : "";
+    })
+)
+"""
+
+
+@dataclass(slots=True)
 class ScrapedMatch:
     """
     Standardized match data from any tour source.
@@ -98,8 +204,8 @@ class ScrapedMatch:
     status: str = "completed"  # 'completed', 'retired', 'walkover', 'default'
     retirement_set: Optional[int] = None  # Which set player retired in
 
-    # Detailed statistics (optional - may not be available)
-    stats: Optional[dict] = field(default_factory=dict)
+    # Detailed statistics (None unless the source page provides them)
+    stats: Optional[dict] = None
 
     def __repr__(self) -> str:
         return (
@@ -108,7 +214,7 @@ class ScrapedMatch:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedFixture:
     """
     Standardized upcoming match (fixture) data.
@@ -158,7 +264,7 @@ class ScrapedFixture:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedDrawEntry:
     """
     A single entry from a tournament draw bracket.
@@ -223,7 +329,10 @@ class VirtualDisplay:
     - VNC client on port 5900 (configurable)
     - Web browser at http://host:6080/vnc.html (noVNC)
 
-    Uses a singleton pattern - only one virtual display runs per process.
+    Uses a singleton pattern - only one virtual display runs per process,
+    and only one process on the machine owns the Xvfb/VNC servers for a
+    display number. Other processes (e.g. backfill workers) that find the
+    display already claimed just point DISPLAY at it.
     The display stays alive for the entire process lifetime so VNC connections
     aren't interrupted between scraper tasks. Cleaned up automatically on
     exit (including Ctrl+C).
@@ -247,6 +356,8 @@ class VirtualDisplay:
         self._vnc_proc: Optional[subprocess.Popen] = None
         self._novnc_proc: Optional[subprocess.Popen] = None
         self._original_wayland_display: Optional[str] = None
+        # Held while this process owns the display (see _claim_display)
+        self._display_lock: Optional[socket.socket] = None
         self._running = False
 
     @classmethod
@@ -268,6 +379,29 @@ class VirtualDisplay:
         """Get or create the singleton virtual display (called by BaseScraper)."""
         return cls.ensure_running()
 
+    async def wait_until_ready(self, timeout: float = 5.0) -> bool:
+        """
+        Wait, without blocking the event loop, until Xvfb accepts clients.
+
+        Xvfb is spawned without waiting for it to come up, so a browser
+        launched straight after start() could race it. Readiness is its
+        X socket appearing under /tmp/.X11-unix.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the display is ready, False on timeout
+        """
+        socket_path = f"/tmp/.X11-unix/X{self.display_num}"
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(socket_path):
+            if time.monotonic() >= deadline:
+                logger.warning("Virtual display %s not ready after %.1fs", self.display, timeout)
+                return False
+            await asyncio.sleep(0.1)
+        return True
+
     @classmethod
     def release(cls) -> None:
         """No-op - display stays alive until explicit shutdown or process exit."""
@@ -280,11 +414,53 @@ class VirtualDisplay:
             cls._instance.stop()
             cls._instance = None
 
+    def _claim_display(self) -> bool:
+        """
+        Claim this display number for the current process.
+
+        Binds a Linux abstract-namespace socket named after the display as a
+        machine-wide mutex; it is released by the kernel when the owning
+        process exits, so a crashed owner never leaves a stale lock.
+
+        Returns:
+            False if another process already owns the display, else True
+            (including platforms without abstract sockets, where every
+            process starts its own servers as before)
+        """
+        lock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            lock.bind(f"\0teelo_xvfb_{self.display_num}")
+        except OSError as e:
+            lock.close()
+            return e.errno != errno.EADDRINUSE
+        self._display_lock = lock
+        return True
+
+    def _release_display(self) -> None:
+        """Give up ownership of the display number, if held."""
+        if self._display_lock is not None:
+            self._display_lock.close()
+            self._display_lock = None
+
+    def _use_display(self) -> None:
+        """Point Chromium at our display, forcing X11 over Wayland."""
+        os.environ["DISPLAY"] = self.display
+        self._original_wayland_display = os.environ.pop("WAYLAND_DISPLAY", None)
+        os.environ["XDG_SESSION_TYPE"] = "x11"
+
     def start(self) -> None:
         """Start Xvfb, x11vnc, and noVNC if available."""
+        if not self._claim_display():
+            # Another process runs Xvfb/VNC on this display - share it
+            self._use_display()
+            self._running = True
+            logger.info("Using virtual display %s owned by another process", self.display)
+            return
+
         # Start Xvfb (virtual framebuffer)
         xvfb_path = shutil.which("Xvfb")
         if not xvfb_path:
+            self._release_display()
             raise RuntimeError(
                 "Xvfb not found. Install it:\n"
                 "  Ubuntu/Debian: sudo apt install xvfb\n"
@@ -299,9 +475,7 @@ class VirtualDisplay:
         # Force Chromium to use X11 instead of Wayland, and point it at our
         # virtual display. Without this, Chromium on Wayland ignores DISPLAY
         # and renders on the real screen.
-        os.environ["DISPLAY"] = self.display
-        self._original_wayland_display = os.environ.pop("WAYLAND_DISPLAY", None)
-        os.environ["XDG_SESSION_TYPE"] = "x11"
+        self._use_display()
         logger.info("Xvfb started on display %s (PID %d)", self.display, self._xvfb_proc.pid)
 
         # Start x11vnc if available (allows VNC clients to connect)
@@ -356,7 +530,16 @@ class VirtualDisplay:
         self._running = True
 
     def _register_cleanup(self) -> None:
-        """Register atexit and signal handlers for graceful shutdown."""
+        """
+        Register atexit and signal handlers for graceful shutdown.
+
+        Inside a running event loop the signals are handled by the loop
+        (loop.add_signal_handler): the handler only starts the shutdown -
+        via asyncio.run()'s own Ctrl+C handling, or by raising SystemExit,
+        which cancels the remaining tasks - so scrapers unwind and close
+        their browsers first, and the atexit hook then stops the display.
+        Outside a loop, plain signal handlers stop the display directly.
+        """
         import atexit
         import signal
 
@@ -366,6 +549,32 @@ class VirtualDisplay:
         original_sigint = signal.getsignal(signal.SIGINT)
         original_sigterm = signal.getsignal(signal.SIGTERM)
 
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        def _loop_handler(signum):
+            """Begin shutdown from within the event loop."""
+            # Back to the default handlers, so a second signal is immediate
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+            handler = original_sigint if signum == signal.SIGINT else original_sigterm
+            if callable(handler):
+                # e.g. asyncio.run()'s handler, which cancels the main task
+                handler(signum, None)
+            elif handler == signal.SIG_DFL:
+                raise SystemExit(128 + signum)
+
+        if loop is not None:
+            try:
+                for sig in (signal.SIGINT, signal.SIGTERM):
+                    loop.add_signal_handler(sig, _loop_handler, sig)
+                return
+            except (NotImplementedError, RuntimeError, ValueError):
+                # No loop signal support (Windows, or not the main thread)
+                pass
+
         def _cleanup_handler(signum, frame):
             """Stop the virtual display, then call the original handler."""
             VirtualDisplay.shutdown()
@@ -383,6 +592,7 @@ class VirtualDisplay:
     def stop(self) -> None:
         """Stop all virtual display processes."""
         if not self._running:
+            self._release_display()
             return
         self._running = False
 
@@ -399,6 +609,9 @@ class VirtualDisplay:
                     proc.kill()
                 logger.info("%s stopped (PID %d)", name, proc.pid)
 
+        # Only let another process claim the display once Xvfb is gone
+        self._release_display()
+
         # Restore original display environment
         if os.environ.get("DISPLAY") == self.display:
             os.environ.pop("DISPLAY", None)
@@ -407,6 +620,115 @@ class VirtualDisplay:
             os.environ["XDG_SESSION_TYPE"] = "wayland"
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds.
+
+    Args:
+        value: Header value (e.g., "30"), or None if absent
+
+    Returns:
+        Seconds to wait (capped at the maximum navigation pause),
+        or None if absent or not a number (HTTP-date form)
+    """
+    try:
+        return min(max(float(value), 0.0), _NAV_PAUSE_MAX)
+    except (TypeError, ValueError):
+        return None
+
+
+class _BrowserPool:
+    """
+    Process-wide shared Playwright driver and Chromium browser.
+
+    Scrapers that are open at the same time (e.g. an ATP and an ITF
+    scraper in one update run) share one browser, each in its own
+    context, instead of launching Chromium per scraper. The browser is
+    ref-counted per headless mode and closed when its last scraper exits.
+    """
+
+    _browsers: dict[bool, dict] = {}
+    _lock: Optional[asyncio.Lock] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            # Playwright objects are bound to the loop that created them,
+            # so a new asyncio.run() starts from an empty pool
+            cls._loop = loop
+            cls._lock = asyncio.Lock()
+            cls._browsers = {}
+        return cls._lock
+
+    @classmethod
+    async def acquire(cls, headless: bool) -> Browser:
+        """Get the shared browser for this headless mode, launching it if needed."""
+        async with cls._get_lock():
+            shared = cls._browsers.get(headless)
+            if shared is None or not shared["browser"].is_connected():
+                if shared is not None:
+                    await shared["playwright"].stop()
+                playwright = await async_playwright().start()
+                browser = await playwright.chromium.launch(headless=headless)
+                refcount = shared["refcount"] if shared is not None else 0
+                shared = {"playwright": playwright, "browser": browser, "refcount": refcount}
+                cls._browsers[headless] = shared
+            shared["refcount"] += 1
+            return shared["browser"]
+
+    @classmethod
+    async def release(cls, headless: bool) -> None:
+        """Drop one user of the shared browser; close it when none are left."""
+        async with cls._get_lock():
+            shared = cls._browsers.get(headless)
+            if shared is None:
+                return
+            shared["refcount"] -= 1
+            if shared["refcount"] <= 0:
+                del cls._browsers[headless]
+                await shared["browser"].close()
+                await shared["playwright"].stop()
+
+
+async def _block_unneeded_requests(route) -> None:
+    """Abort image/font/media and analytics requests; let everything else through."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in _BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+_T = TypeVar("_T")
+
+
+def run_scraper(main: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Run a scraping coroutine to completion, on uvloop when installed.
+
+    Drop-in replacement for asyncio.run() in scraper entrypoints. uvloop
+    (pulled in by uvicorn[standard] on Linux/macOS) speeds up the pipe
+    I/O that carries every Playwright call; without it, e.g. on Windows,
+    this is plain asyncio.run().
+
+    Args:
+        main: Coroutine to run (e.g., main())
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
+
 class BaseScraper(ABC):
     """
     Abstract base class for all tennis data scrapers.
@@ -428,11 +750,24 @@ class BaseScraper(ABC):
             for tournament in tournaments:
                 async for match in scraper.scrape_tournament_results(tournament, 2024):
                     process_match(match)
+
+    Entry-point scripts start the event loop with run_scraper() rather
+    than asyncio.run() so scrapers run on uvloop where it is available.
     """
 
     # Base URLs for different tours (override in subclasses)
     BASE_URL: str = ""
 
+    # Process-wide cap on in-flight page.goto calls (see navigate), shared
+    # by every scraper and created lazily for the running event loop
+    _nav_slots: Optional[asyncio.Semaphore] = None
+    _nav_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # Process-wide cap on pages in use (see acquire_page): scrapers share
+    # one browser, so per-scraper caps alone don't bound it
+    _shared_page_slots: Optional[asyncio.BoundedSemaphore] = None
+    _shared_page_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def __init__(self, headless: bool = None):
         """
         Initialize the scraper.
@@ -445,66 +780,106 @@ class BaseScraper(ABC):
         self.timeout = settings.scrape_timeout
         self._use_virtual_display = settings.scrape_virtual_display and not self.headless
 
-        # Playwright objects (initialized in __aenter__)
-        self._playwright = None
+        # Playwright objects (initialized in __aenter__); the browser is
+        # shared process-wide (see _BrowserPool), the context is ours
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
 
+        # Caps how many pages can be open at once when one scraper is
+        # shared by concurrent tasks (see acquire_page)
+        self._page_slots = asyncio.BoundedSemaphore(settings.scrape_max_pages)
+        # Pages returned by finished jobs, reused by the next acquire_page
+        self._idle_pages: list[Page] = []
+
     async def __aenter__(self) -> "BaseScraper":
         """
         Async context manager entry - starts browser.
 
-        Sets up Playwright with a Chromium browser and context
-        configured for web scraping (appropriate user agent, etc.)
+        Joins the process-wide shared Chromium browser (launching it if
+        this is the first open scraper) and creates this scraper's own
+        context, configured for web scraping (appropriate user agent, etc.)
         """
         # Start virtual display if configured (for headed browser on headless machines)
         if self._use_virtual_display:
-            VirtualDisplay.acquire()
+            await VirtualDisplay.acquire().wait_until_ready()
 
-        self._playwright = await async_playwright().start()
+        self._browser = await _BrowserPool.acquire(self.headless)
 
-        # Launch browser
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.headless
-        )
-
-        # Create context with realistic browser fingerprint
-        self._context = await self._browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            viewport={"width": 1920, "height": 1080},
-            locale="en-US",
-        )
+        # Create context with realistic browser fingerprint, restoring the
+        # previous run's cookies (e.g. Cloudflare clearance) when saved
+        state_path = self._storage_state_path()
+        self._context = None
+        if state_path and state_path.exists():
+            try:
+                self._context = await self._browser.new_context(
+                    storage_state=str(state_path), **_CONTEXT_OPTIONS
+                )
+            except (PlaywrightError, OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable storage state %s: %s", state_path, e)
+        if self._context is None:
+            self._context = await self._browser.new_context(**_CONTEXT_OPTIONS)
 
         # Set default timeout for all operations
         self._context.set_default_timeout(self.timeout)
 
+        if settings.scrape_block_resources:
+            await self._context.route("**/*", _block_unneeded_requests)
+
+        # Apply stealth once to the shared context; its init script then
+        # runs in every page opened by new_page()
+        await _stealth.apply_stealth_async(self._context)
+
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """
         Async context manager exit - cleans up browser resources.
 
-        Always closes browser and Playwright, even if an exception occurred.
+        Always closes this scraper's context and releases the shared
+        browser (closed once no scraper uses it), even if an exception
+        occurred.
         """
+        # Pooled pages belong to the context and close with it
+        self._idle_pages.clear()
         if self._context:
+            await self._save_storage_state()
             await self._context.close()
+            self._context = None
         if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+            self._browser = None
+            await _BrowserPool.release(self.headless)
         if self._use_virtual_display:
             VirtualDisplay.release()
 
+    def _storage_state_path(self) -> Optional[Path]:
+        """
+        Saved cookies/storage file for this scraper, or None if disabled.
+
+        One JSON file per scraper class under settings.scrape_state_dir.
+        """
+        if not settings.scrape_state_dir:
+            return None
+        return Path(settings.scrape_state_dir) / f"{type(self).__name__.lower()}.json"
+
+    async def _save_storage_state(self) -> None:
+        """Save the context's cookies/storage for the next run, if enabled."""
+        state_path = self._storage_state_path()
+        if not state_path:
+            return
+        try:
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            await self._context.storage_state(path=str(state_path))
+        except (PlaywrightError, OSError) as e:
+            logger.warning("Could not save storage state to %s: %s", state_path, e)
+
     async def new_page(self) -> Page:
         """
         Create a new browser page with stealth mode enabled.
 
-        Applies playwright-stealth to avoid bot detection by sites
-        using Cloudflare or similar protection.
+        Pages are opened in the scraper's single shared context, which
+        already carries the playwright-stealth init script (applied in
+        __aenter__) to avoid bot detection by sites using Cloudflare or
+        similar protection.
 
         Returns:
             New Playwright Page object with stealth enabled
@@ -512,18 +887,50 @@ class BaseScraper(ABC):
         if not self._context:
             raise RuntimeError("Scraper not initialized. Use 'async with' context manager.")
 
-        page = await self._context.new_page()
+        return await self._context.new_page()
 
-        # Apply stealth to avoid Cloudflare and other bot detection
-        await _stealth.apply_stealth_async(page)
+    @asynccontextmanager
+    async def acquire_page(self) -> AsyncIterator[Page]:
+        """
+        Check out a page from the shared browser context for one job.
 
-        return page
+        Waits for a free slot (at most settings.scrape_max_pages pages are
+        open at once), so tasks that share this scraper can run concurrently
+        with asyncio.gather without opening unbounded pages. Pages in use
+        across all scrapers sharing the browser are capped as well
+        (settings.scrape_max_total_pages). Pages are
+        pooled: a page whose job finished cleanly is handed to the next
+        job instead of being closed, while a page whose job failed is
+        closed. The slot is released on exit either way.
+
+        Usage:
+            async with self.acquire_page() as page:
+                await self.navigate(page, url)
+
+        Yields:
+            New Playwright Page object with stealth enabled
+        """
+        async with self._page_slots, self._browser_page_slots():
+            page = None
+            while self._idle_pages and page is None:
+                candidate = self._idle_pages.pop()
+                if not candidate.is_closed():
+                    page = candidate
+            if page is None:
+                page = await self.new_page()
+            try:
+                yield page
+            except BaseException:
+                await page.close()
+                raise
+            if not page.is_closed():
+                self._idle_pages.append(page)
 
     async def navigate(
         self,
         page: Page,
         url: str,
-        wait_for: str = "load",
+        wait_for: str = "domcontentloaded",
         max_attempts: Optional[int] = None,
     ) -> None:
         """
@@ -532,18 +939,269 @@ class BaseScraper(ABC):
         Args:
             page: Playwright Page object
             url: URL to navigate to
-            wait_for: Wait condition ('load', 'domcontentloaded', 'networkidle')
+            wait_for: Wait condition ('domcontentloaded', 'load', 'networkidle').
+                      The DOM is all the parsers need; for content rendered
+                      later by JS, wait for its selector after navigating
+                      (see fetch_html) rather than for 'load'/'networkidle'.
+
+        At most settings.scrape_max_concurrency page loads run at once
+        across all scrapers in the process.
+
+        Rate limiting (HTTP 429/503) is treated as a failed attempt: the
+        Retry-After header (if any) is honoured, and every navigation to
+        the same host is paced by a pause that doubles on each rate limit
+        and shrinks again as requests succeed.
 
         Raises:
+            RateLimitedError: If still rate-limited after all retries
             Exception: If navigation fails after all retries
         """
-        # Use lambda to create a fresh coroutine on each retry attempt
+        pacing = _pacing_for(url)
+
+        async def goto():
+            await self._wait_for_nav_slot(pacing)
+            # Only the page load holds a slot, not the pauses or retry backoff
+            async with self._navigation_slots():
+                response = await page.goto(url, wait_until=wait_for, timeout=self.timeout)
+            if response is not None and response.status in _RATE_LIMIT_STATUSES:
+                retry_after = _parse_retry_after(response.headers.get("retry-after"))
+                self._on_rate_limited(pacing, retry_after)
+                raise RateLimitedError(url, response.status, retry_after)
+            pacing.pause = max(0.0, pacing.pause - _NAV_PAUSE_DECREASE)
+            return response
+
+        # Pass the function so each retry attempt gets a fresh coroutine
         await self.with_retry(
-            lambda: page.goto(url, wait_until=wait_for, timeout=self.timeout),
+            goto,
             max_attempts=max_attempts,
             description=f"Navigate to {url}",
         )
 
+    @classmethod
+    def _navigation_slots(cls) -> asyncio.Semaphore:
+        """Semaphore capping concurrent navigations (settings.scrape_max_concurrency)."""
+        loop = asyncio.get_running_loop()
+        if BaseScraper._nav_slots_loop is not loop:
+            BaseScraper._nav_slots = asyncio.Semaphore(settings.scrape_max_concurrency)
+            BaseScraper._nav_slots_loop = loop
+        return BaseScraper._nav_slots
+
+    @classmethod
+    def _browser_page_slots(cls) -> asyncio.BoundedSemaphore:
+        """Semaphore capping pages in use across scrapers (settings.scrape_max_total_pages)."""
+        loop = asyncio.get_running_loop()
+        if BaseScraper._shared_page_slots_loop is not loop:
+            BaseScraper._shared_page_slots = asyncio.BoundedSemaphore(
+                settings.scrape_max_total_pages
+            )
+            BaseScraper._shared_page_slots_loop = loop
+        return BaseScraper._shared_page_slots
+
+    async def _wait_for_nav_slot(self, pacing: _HostPacing) -> None:
+        """Sleep out the host's rate-limit cooldown and navigation pause."""
+        wait = max(pacing.throttle_until - time.monotonic(), pacing.pause)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _on_rate_limited(self, pacing: _HostPacing, retry_after: Optional[float]) -> None:
+        """Back off: double the host's navigation pause and start a cooldown."""
+        pacing.pause = min(max(pacing.pause * 2, _NAV_PAUSE_MIN_STEP), _NAV_PAUSE_MAX)
+        cooldown = max(retry_after or 0.0, pacing.pause)
+        pacing.throttle_until = max(pacing.throttle_until, time.monotonic() + cooldown)
+        logger.warning("Rate limited - pausing navigation for %.1fs", cooldown)
+
+    async def fetch_html(
+        self,
+        page: Page,
+        url: str,
+        wait_for: str = "domcontentloaded",
+        ready_selector: Optional[str] = None,
+        ready_state: str = "visible",
+        ttl: Optional[float] = None,
+        extract_script: Optional[str] = None,
+    ) -> str:
+        """
+        Get a page's rendered HTML, reusing the on-disk cache when enabled.
+
+        With settings.scrape_cache_dir set, HTML fetched within the last
+        `ttl` seconds is read back from disk without navigating, so re-run
+        or resumed backfills skip page loads for idempotent pages. With no
+        cache directory this is just navigate + wait + page.content().
+
+        Args:
+            page: Playwright Page object (unused on a cache hit)
+            url: URL to load
+            wait_for: Navigation wait condition (see navigate)
+            ready_selector: CSS selector signalling the content has rendered.
+                            If it never appears, a random delay is used instead
+                            and the HTML is not cached.
+            ready_state: Selector state to wait for ('visible', 'attached')
+            ttl: Cache lifetime in seconds (default settings.scrape_cache_ttl)
+            extract_script: Optional JS function returning an HTML string,
+                            run in the page instead of page.content() so only
+                            the needed markup crosses from the browser
+
+        Returns:
+            Page HTML (or the extract_script's HTML)
+        """
+        cached = self.read_cached_html(url, ttl)
+        if cached is not None:
+            return cached
+
+        await self.navigate(page, url, wait_for=wait_for)
+
+        ready = True
+        if ready_selector:
+            try:
+                await page.wait_for_selector(ready_selector, state=ready_state, timeout=4000)
+            except PlaywrightTimeout:
+                logger.warning("'%s' not found on %s", ready_selector, url)
+                ready = False
+                await self.random_delay()
+
+        if extract_script:
+            html = await page.evaluate(extract_script)
+        else:
+            html = await page.content()
+
+        # Never cache a page whose content didn't render
+        if ready:
+            self.write_cached_html(url, html)
+
+        return html
+
+    def read_cached_html(
+        self,
+        key: str,
+        ttl: Optional[float] = None,
+        final_after: Optional[datetime] = None,
+    ) -> Optional[str]:
+        """
+        Get HTML stored by write_cached_html, if cached and still fresh.
+
+        For pages fetch_html can't load in one step (e.g. after clicking
+        through a carousel), so they can share its on-disk cache.
+
+        Args:
+            key: Cache key, normally the page URL (plus any view suffix)
+            ttl: Cache lifetime in seconds (default settings.scrape_cache_ttl)
+            final_after: When the page stops changing (e.g. a season's end).
+                Copies saved after this never expire; older ones use ttl.
+
+        Returns:
+            Cached HTML, or None if caching is disabled, missing or expired
+        """
+        cache_path = self._html_cache_path(key)
+        if not cache_path or not cache_path.exists():
+            return None
+        saved_at = cache_path.stat().st_mtime
+        if final_after is None or saved_at < final_after.timestamp():
+            if ttl is None:
+                ttl = settings.scrape_cache_ttl
+            if time.time() - saved_at >= ttl:
+                return None
+        return cache_path.read_text(encoding="utf-8")
+
+    def write_cached_html(self, key: str, html: str) -> None:
+        """Store rendered HTML under a cache key (no-op if caching is disabled)."""
+        cache_path = self._html_cache_path(key)
+        if cache_path:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(html, encoding="utf-8")
+
+    async def fetch_text_matrix(
+        self,
+        page: Page,
+        row_selector: str,
+        columns: list[str],
+        url: Optional[str] = None,
+    ) -> list[list[Optional[str]]]:
+        """
+        Read text/attributes from every row of a grid in one browser call.
+
+        Replaces per-element query_selector_all / get_attribute /
+        inner_text loops, which cost one round-trip to the browser per
+        cell, with a single page.evaluate.
+
+        Args:
+            page: Playwright Page object
+            row_selector: CSS selector for the rows
+            columns: Per-row cells to read: a CSS selector relative to the
+                     row (its text, "" if absent), "" for the row's own
+                     text, or "@name" for the row's attribute (None if absent)
+            url: If given, navigate here and wait for the first row first
+
+        Returns:
+            One list of cell values per row, in document order
+        """
+        if url:
+            await self.navigate(page, url)
+            await page.wait_for_selector(row_selector, state="attached", timeout=4000)
+        return await page.evaluate(
+            _TEXT_MATRIX_SCRIPT, {"rowSelector": row_selector, "columns": columns}
+        )
+
+    def _html_cache_path(self, url: str) -> Optional[Path]:
+        """
+        On-disk cache file for a URL, or None if caching is disabled.
+
+        Files live under settings.scrape_cache_dir in a per-scraper
+        subdirectory, named by the SHA-1 of the URL.
+        """
+        if not settings.scrape_cache_dir:
+            return None
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return Path(settings.scrape_cache_dir) / type(self).__name__.lower() / f"{digest}.html"
+
+    async def stream(
+        self,
+        items: AsyncGenerator[_T, None],
+        consumer: Callable[[_T], Awaitable[None]],
+        maxsize: int = 128,
+    ) -> None:
+        """
+        Feed a scrape generator to a consumer through a bounded queue.
+
+        The generator runs in its own task, so it can keep loading pages
+        while the consumer is awaiting (e.g. on ingestion), but it is held
+        back once `maxsize` items are waiting to be consumed.
+
+        Args:
+            items: Async generator of scraped records
+                   (e.g. scrape_tournament_results(...))
+            consumer: Async callable awaited once per record, in order
+            maxsize: Most records buffered ahead of the consumer
+
+        Raises:
+            Exception: Whatever the generator or the consumer raised. If the
+                       consumer fails, the generator is cancelled and closed.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        done = object()
+
+        async def produce() -> None:
+            # aclosing() runs the generator's cleanup (e.g. returning its
+            # page) even if the task is cancelled while it is suspended
+            async with aclosing(items):
+                try:
+                    async for item in items:
+                        await queue.put(item)
+                finally:
+                    # Consumer still draining unless we were cancelled by it
+                    if not asyncio.current_task().cancelling():
+                        await queue.put(done)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (item := await queue.get()) is not done:
+                await consumer(item)
+        except BaseException:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            raise
+        # Re-raise a scraping error once everything before it was consumed
+        await producer
+
     async def random_delay(self) -> None:
         """
         Wait for a random duration to avoid rate limiting.
@@ -560,10 +1218,16 @@ class BaseScraper(ABC):
         max_attempts: int = None,
         base_delay: float = 2.0,
         description: str = "Operation",
+        deadline: Optional[float] = None,
     ):
         """
         Execute an async operation with exponential backoff retry.
 
+        Only transient failures (_RETRYABLE: Playwright errors and timeouts,
+        rate limits, network errors) are retried. Other exceptions, such as
+        an AttributeError from a parsing bug, propagate immediately rather
+        than using up the retry budget.
+
         IMPORTANT: Pass a callable (like a lambda) that creates a coroutine,
         not a pre-created coroutine. Coroutines can only be awaited once,
         so we need to create a fresh one for each retry attempt.
@@ -573,12 +1237,16 @@ class BaseScraper(ABC):
             max_attempts: Maximum retry attempts (default from settings)
             base_delay: Initial delay between retries (doubles each attempt)
             description: Description for logging
+            deadline: Total seconds allowed for all attempts including
+                      backoff (default settings.scrape_retry_deadline).
+                      A retry whose backoff would overrun it is not made.
 
         Returns:
             Result of the coroutine
 
         Raises:
-            Exception: The last exception if all retries fail
+            Exception: The last retryable exception if all retries fail, or
+                       the first non-retryable one
 
         Example:
             # Correct - lambda creates fresh coroutine each attempt
@@ -592,6 +1260,9 @@ class BaseScraper(ABC):
         """
         if max_attempts is None:
             max_attempts = settings.scrape_max_retries
+        if deadline is None:
+            deadline = settings.scrape_retry_deadline
+        give_up_at = time.monotonic() + deadline
 
         last_error = None
 
@@ -599,18 +1270,19 @@ class BaseScraper(ABC):
             try:
                 # Call the function to get a fresh coroutine for each attempt
                 return await coro_func()
-            except Exception as e:
+            except _RETRYABLE as e:
                 last_error = e
 
                 if attempt < max_attempts - 1:
-                    # Calculate delay with exponential backoff
-                    delay = base_delay * (2 ** attempt)
-                    # Add some jitter to avoid thundering herd
-                    delay += random.uniform(0, 1)
-
-                    print(
-                        f"[Retry {attempt + 1}/{max_attempts}] {description} "
-                        f"failed: {e}. Retrying in {delay:.1f}s..."
+                    # Exponential backoff plus up to 1s of jitter to avoid
+                    # a thundering herd
+                    delay = base_delay * (1 << attempt) + random.random()
+                    if time.monotonic() + delay > give_up_at:
+                        break
+
+                    logger.warning(
+                        "[Retry %d/%d] %s failed: %s. Retrying in %.1fs...",
+                        attempt + 1, max_attempts, description, e, delay,
                     )
                     await asyncio.sleep(delay)
 
@@ -676,7 +1348,10 @@ class BaseScraper(ABC):
     # Helper Methods
     # =========================================================================
 
-    def _normalize_round(self, round_str: str) -> str:
+    # Pure string lookups over a small set of labels, so results are memoized
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _normalize_round(round_str: str) -> str:
         """
         Normalize round names to standard format.
 
@@ -745,7 +1420,9 @@ class BaseScraper(ABC):
         # Default - return as-is (will need manual handling)
         return round_str.upper()
 
-    def _normalize_surface(self, surface_str: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _normalize_surface(surface_str: str) -> str:
         """
         Normalize surface names to standard format.
 
@@ -769,7 +1446,9 @@ class BaseScraper(ABC):
         # Default to Hard (most common)
         return "Hard"
 
-    def _normalize_level(self, level_str: str, tour: str = "atp") -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _normalize_level(level_str: str, tour: str = "atp") -> str:
         """
         Normalize tournament level names.
 
@@ -4,7 +4,8 @@ Shared helpers for discovering tournament tasks.
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+import asyncio
+from datetime import date, timedelta
 from typing import Any, Mapping, Optional
 
 from teelo.scrape.atp import ATPScraper
@@ -15,10 +16,11 @@ from teelo.scrape.wta import WTAScraper
 
 
 def _parse_date(value: Optional[str]) -> Optional[date]:
-    if not value:
-        return None
+    # Scrapers always emit "YYYY-MM-DD", so slice it rather than strptime
     try:
-        return datetime.strptime(value, "%Y-%m-%d").date()
+        if len(value) != 10 or value[4] != "-" or value[7] != "-":
+            return None
+        return date(int(value[:4]), int(value[5:7]), int(value[8:]))
     except Exception:
         return None
 
@@ -28,15 +30,17 @@ def _is_tournament_in_window(
     window_start: date,
     window_end: date,
 ) -> bool:
+    # Most calendar entries start after the window, so settle those before
+    # parsing the end date
     start_date = _parse_date(tournament.get("start_date"))
-    end_date = _parse_date(tournament.get("end_date"))
+    if start_date is None or start_date > window_end:
+        return False
 
-    if start_date and end_date:
-        return start_date <= window_end and end_date >= window_start
-    if start_date:
-        est_end = start_date + timedelta(days=7)
-        return start_date <= window_end and est_end >= window_start
-    return False
+    end_date = _parse_date(tournament.get("end_date"))
+    if end_date:
+        return end_date >= window_start
+    # No end date: assume a week-long event
+    return start_date >= window_start - timedelta(days=7)
 
 
 def normalize_tournament(
@@ -63,15 +67,17 @@ def normalize_tournament(
     }
 
 
+# Scraper class per TOUR_TYPES "scraper" value, and the TOUR_TYPES key its
+# get_tournament_list takes as a keyword (tour_type or gender)
+_SCRAPER_CLASSES = {"atp": ATPScraper, "wta": WTAScraper, "itf": ITFScraper}
+_TOURNAMENT_LIST_ARGS = {"atp": "tour_type", "wta": "tour_type", "itf": "gender"}
+
+
 def _get_scraper_class(tour_key: str):
-    scraper_type = TOUR_TYPES[tour_key]["scraper"]
-    if scraper_type == "atp":
-        return ATPScraper
-    if scraper_type == "wta":
-        return WTAScraper
-    if scraper_type == "itf":
-        return ITFScraper
-    raise ValueError(f"Unknown scraper type for {tour_key}")
+    try:
+        return _SCRAPER_CLASSES[TOUR_TYPES[tour_key]["scraper"]]
+    except KeyError:
+        raise ValueError(f"Unknown scraper type for {tour_key}") from None
 
 
 async def _fetch_tournaments_with_scraper(
@@ -80,11 +86,8 @@ async def _fetch_tournaments_with_scraper(
     year: int,
 ) -> list[dict]:
     config = TOUR_TYPES[tour_key]
-    if config["scraper"] == "atp":
-        return await scraper.get_tournament_list(year, tour_type=config["tour_type"])
-    if config["scraper"] == "wta":
-        return await scraper.get_tournament_list(year, tour_type=config["tour_type"])
-    return await scraper.get_tournament_list(year, gender=config["gender"])
+    argument = _TOURNAMENT_LIST_ARGS[config["scraper"]]
+    return await scraper.get_tournament_list(year, **{argument: config[argument]})
 
 
 async def discover_tournament_tasks(
@@ -104,14 +107,59 @@ async def discover_tournament_tasks(
     else:
         tournaments = await _fetch_tournaments_with_scraper(scraper, tour_key, year)
 
+    if window:
+        tournaments = [
+            tournament
+            for tournament in tournaments
+            if _is_tournament_in_window(tournament, window[0], window[1])
+        ]
+
     tasks: list[TournamentTask] = []
     for tournament in tournaments:
         try:
             normalized = normalize_tournament(tournament, tour_key, year)
         except ValueError:
             continue
-        if window and not _is_tournament_in_window(normalized, window[0], window[1]):
-            continue
         task_params = build_task_params(normalized, tour_key)
         tasks.append(TournamentTask(task_type=task_type, params=task_params))
     return tasks
+
+
+async def discover_all_tournament_tasks(
+    tour_keys: list[str],
+    year: int,
+    task_type: str,
+    *,
+    window: Optional[tuple[date, date]] = None,
+    headless: Optional[bool] = None,
+) -> list[TournamentTask]:
+    """
+    Discover tournament tasks for several tours at once.
+
+    Every tour's scraper is open at the same time, so they share one
+    Chromium browser (see BaseScraper) and their calendar page loads
+    overlap; page loads are still capped by settings.scrape_max_concurrency.
+
+    A library entry point for callers that want every tour's tasks in one
+    list. The scripts discover tour by tour instead, since they time and
+    report each tour on its own.
+
+    Args:
+        tour_keys: Tours to discover (e.g. ["ATP", "WTA", "ITF_MEN"])
+        year: Season to discover
+        task_type: Task type for the created tasks
+        window: Optional (start, end) dates tournaments must overlap
+        headless: Run the browser headless (None falls back to headed mode)
+
+    Returns:
+        All tours' tasks, grouped in tour_keys order
+    """
+    per_tour = await asyncio.gather(
+        *(
+            discover_tournament_tasks(
+                tour_key, year, task_type, window=window, headless=headless
+            )
+            for tour_key in tour_keys
+        )
+    )
+    return [task for tasks in per_tour for task in tasks]
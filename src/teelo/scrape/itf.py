@@ -7,10 +7,12 @@ Scrapes match results from itftennis.com for:
 
 ITF draw pages show 3 rounds at a time in a carousel. A 32-draw tournament
 has 5 rounds (1st Round, 2nd Round, Quarter-finals, Semi-finals, Final)
-totalling 31 matches (16+8+4+2+1). We scrape by:
-1. Capturing the initial view (rounds 1-3)
-2. Clicking next to reveal round 4
-3. Clicking next again to reveal round 5
+totalling 31 matches (16+8+4+2+1). We scrape by loading, concurrently in
+separate pages:
+1. The initial view (rounds 1-3)
+2. The view after clicking next once (reveals round 4)
+3. The view after clicking next twice (reveals round 5)
+Each view is parsed as soon as it (and the views before it) has loaded.
 
 HTML structure per match (.drawsheet-widget):
 - .drawsheet-widget__team-info--team-1 / --team-2 (with .is-winner class on winner)
@@ -28,10 +30,12 @@ URLs:
 
 import asyncio
 import re
-from datetime import datetime, timedelta
+from functools import lru_cache
+from datetime import date, datetime, timedelta
 from typing import AsyncGenerator, Optional
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
 
 from teelo.scrape.base import BaseScraper, ScrapedMatch, ScrapedFixture, ScrapedDrawEntry
@@ -48,6 +52,96 @@ ITF_ROUND_MAP = {
     "final": "F",
 }
 
+# ITF_ROUND_MAP keyed without spaces or hyphens, for spelling variants
+_COMPACT_ROUND_MAP = {
+    name.replace("-", "").replace(" ", ""): code for name, code in ITF_ROUND_MAP.items()
+}
+
+# Set by OneTrust once the cookie banner has been accepted
+_CONSENT_COOKIE = "OptanonAlertBoxClosed"
+
+# Draw carousel views: rounds 1-3, then 2-4, then 3-5 (see module docstring)
+_CAROUSEL_VIEWS = 3
+
+# Draws pages only need the per-round containers (title + match widgets) and
+# order-of-play pages only the per-court containers; the rest of the page
+# (nav, scripts, footer, cookie banner) is skipped by the tree builder.
+_DRAWSHEET_STRAINER = SoupStrainer(class_="drawsheet-round-container")
+_ORDER_OF_PLAY_STRAINER = SoupStrainer(class_="orderop-widget-container")
+
+# Draw-sheet selectors, compiled once instead of per round/widget/player
+_ROUND_CONTAINER_SEL = sv.compile(".drawsheet-round-container")
+_ROUND_TITLE_SEL = sv.compile(".drawsheet-round-container__round-title")
+_DRAW_WIDGET_SEL = sv.compile(".drawsheet-widget")
+_TEAM_1_SEL = sv.compile(".drawsheet-widget__team-info--team-1")
+_TEAM_2_SEL = sv.compile(".drawsheet-widget__team-info--team-2")
+_WINNER_STATUS_SEL = sv.compile(".drawsheet-widget__winner-status-desc")
+_FIRST_NAME_SEL = sv.compile(".drawsheet-widget__first-name")
+_LAST_NAME_SEL = sv.compile(".drawsheet-widget__last-name")
+
+# Everything _extract_team reads from a team-info block (player link, flag,
+# seeding, set scores), matched in one walk and told apart by class
+_TEAM_PARTS_SEL = sv.compile(
+    ".player-wrapper a, .drawsheet-widget__nationality .itf-flags,"
+    " .drawsheet-widget__seeding, .drawsheet-widget__score"
+)
+
+# Calendar rows' date range and tournament links
+_CALENDAR_DATE_SEL = sv.compile("td.date span.date")
+_TOURNAMENT_LINK_SEL = sv.compile("a[href*='/tournament/']")
+
+# Prize level in a name or ID: "M15 Monastir" / "w-itf-..." -> "15"
+_LEVEL_RE = re.compile(r"[MW](\d+)")
+
+# Calendar date ranges: "01 Jan to 07 Jan 2024", parsed by hand with the
+# month abbreviation looked up in a table
+_TRAILING_YEAR_RE = re.compile(r"(\d{4})$")
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+         "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        start=1,
+    )
+}
+
+# Seeds "[1]" on draw sheets and order of play
+_SEED_RE = re.compile(r"\[(\d+)\]")
+
+# Order-of-play start times: "Starts At 10:00" / "Followed By ... 14:30"
+_TIME_RE = re.compile(r"(\d{1,2}:\d{2})")
+
+# Player profile links: /en/players/{slug}/{ITF_ID}/...
+_PLAYER_ID_RE = re.compile(r"/players/[^/]+/(\d+)/")
+
+# Page-side readiness checks. networkidle rarely fires on ITF pages
+# (analytics keeps pinging), so instead of waiting on the network we wait
+# for the DOM change clicks cause: the carousel's round titles shift, or the
+# calendar's tournament link count grows and then holds for _SETTLE_INTERVAL.
+_ROUND_TITLES_SCRIPT = """
+() => Array.from(
+    document.querySelectorAll('.drawsheet-round-container__round-title'),
+    el => el.textContent.trim()
+).join('||')
+"""
+_ROUND_TITLES_CHANGED_SCRIPT = f"(old) => ({_ROUND_TITLES_SCRIPT.strip()})() !== old"
+_TOURNAMENT_LINK_COUNT_SCRIPT = (
+    "() => document.querySelectorAll(\"a[href*='/tournament/']\").length"
+)
+_SETTLE_INTERVAL = 0.5
+
+# Draw views are read back as just their round containers' HTML (all the
+# parser looks at) instead of serializing the whole page with content()
+_DRAWSHEET_HTML_SCRIPT = """
+() => Array.from(
+    document.querySelectorAll('.drawsheet-round-container'),
+    el => el.outerHTML
+).join('')
+"""
+
+# "More Matches" clicks fired back to back before waiting for the calendar
+_MORE_MATCHES_BATCH = 5
+
 # ITF tournament level mapping based on prize money
 LEVEL_MAPPING = {
     "15": "ITF $15K",
@@ -77,8 +171,27 @@ class ITFScraper(BaseScraper):
     # XPath for "More Matches" button on calendar page
     MORE_MATCHES_XPATH = '//*[@id="whatson-hero"]/div[3]/section/div/div/button'
 
+    def __init__(self, headless: bool = None):
+        super().__init__(headless=headless)
+        # In-flight draw-view loads by draws URL, so results and draw
+        # scrapes of the same tournament running together share one load.
+        self._draw_view_loads: dict[str, list[asyncio.Future]] = {}
+
     async def _accept_cookies(self, page: Page) -> None:
-        """Dismiss the OneTrust cookie consent popup if present."""
+        """
+        Dismiss the OneTrust cookie consent popup if present.
+
+        Skipped once consent is recorded: OneTrust's cookie is shared by
+        every page in the context and restored with the saved storage state
+        (settings.scrape_state_dir), and the banner isn't shown again.
+        """
+        try:
+            cookies = await page.context.cookies(self.BASE_URL)
+        except Exception:
+            cookies = []
+        if any(cookie["name"] == _CONSENT_COOKIE for cookie in cookies):
+            return
+
         try:
             btn = await page.wait_for_selector(
                 "#onetrust-accept-btn-handler", timeout=4000
@@ -110,8 +223,10 @@ class ITFScraper(BaseScraper):
         """
         Scrape all completed match results for an ITF tournament.
 
-        Navigates through the draw carousel (3 views for a 32-draw tournament)
-        and parses matches from each visible round container.
+        Loads the draw carousel's views (3 for a 32-draw tournament) and
+        parses matches from each visible round container. Each view is
+        parsed as soon as it arrives, so the first rounds' matches are
+        yielded while the later views are still loading.
 
         Args:
             tournament_url: Full URL to tournament page
@@ -120,77 +235,186 @@ class ITFScraper(BaseScraper):
         Yields:
             ScrapedMatch for each completed match (including walkovers/retirements)
         """
-        page = await self.new_page()
+        draws_url = tournament_url.rstrip("/") + "/draws-and-results/"
+        print(f"Scraping ITF tournament: {draws_url}")
 
-        try:
-            draws_url = tournament_url.rstrip("/") + "/draws-and-results/"
-            print(f"Scraping ITF tournament: {draws_url}")
+        seen_rounds = set()
+        match_number = 0
+
+        # Views overlap by two rounds (view 1 shows R16-SF, view 2 QF-F),
+        # so rounds already parsed from an earlier view are skipped
+        views = self._iter_draw_views(draws_url, _draws_final_after(tournament_info))
+        async for html in views:
+            soup = BeautifulSoup(html, "lxml", parse_only=_DRAWSHEET_STRAINER)
+
+            for container in _ROUND_CONTAINER_SEL.select(soup):
+                title_elem = _ROUND_TITLE_SEL.select_one(container)
+                if not title_elem:
+                    continue
+
+                round_name = _normalize_round(title_elem.get_text(strip=True))
+                if round_name in seen_rounds:
+                    continue
+                seen_rounds.add(round_name)
+
+                # Parse all match widgets in this round container
+                for widget in _DRAW_WIDGET_SEL.select(container):
+                    match = _parse_match_widget(
+                        widget, round_name, tournament_info, match_number
+                    )
+                    if match:
+                        match_number += 1
+                        match.match_number = match_number
+                        yield match
+
+        print(f"Scraped {match_number} matches from {len(seen_rounds)} rounds")
+
+    async def _iter_draw_views(
+        self, draws_url: str, final_after: Optional[datetime] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Load every carousel view of a draws page concurrently, yielding in order.
+
+        Each view is loaded in its own page (see _load_draw_view) and all
+        of them start at once, so the page loads and carousel clicks overlap.
+        Views are yielded as soon as they and the views before them are
+        ready, so callers can parse the first rounds while the later views
+        are still loading. Views are read from and saved to the on-disk HTML
+        cache (settings.scrape_cache_dir) when it is enabled. Callers asking
+        for a draws page that is already loading share that load (see
+        scrape_everything).
+
+        Args:
+            draws_url: Tournament draws-and-results URL
+            final_after: When the draw is final; views cached after it
+                never expire (see read_cached_html)
+
+        Yields:
+            HTML of each view in carousel order, stopping at the first view
+            the carousel could not reach (e.g. smaller draws)
+        """
+        loads = self._draw_view_loads.get(draws_url)
+        if loads is None:
+            loads = [
+                asyncio.ensure_future(self._load_draw_view(draws_url, view, final_after))
+                for view in range(_CAROUSEL_VIEWS)
+            ]
+            self._draw_view_loads[draws_url] = loads
+            asyncio.gather(*loads, return_exceptions=True).add_done_callback(
+                lambda _: self._draw_view_loads.pop(draws_url, None)
+            )
+
+        for load in loads:
+            # Shielded so one caller stopping early doesn't cancel the
+            # others' load
+            html = await asyncio.shield(load)
+            if html is None:
+                return
+            yield html
+
+    async def _load_draw_view(
+        self, draws_url: str, view: int, final_after: Optional[datetime] = None
+    ) -> Optional[str]:
+        """
+        Open a draws page and advance its carousel to the given view.
+
+        Args:
+            draws_url: Tournament draws-and-results URL
+            view: Number of times to click the carousel's next button
+            final_after: When the draw is final; a view cached after it
+                never expires (see read_cached_html)
+
+        Returns:
+            HTML of the round containers at that view, or None if the next
+            button ran out first
+        """
+        cache_key = f"{draws_url}#view={view}"
+        cached = self.read_cached_html(cache_key, final_after=final_after)
+        if cached is not None:
+            return cached
 
+        async with self.acquire_page() as page:
             await self.navigate(page, draws_url, wait_for="domcontentloaded")
             try:
                 await page.wait_for_selector(
                     ".drawsheet-round-container, .drawsheet-widget",
                     timeout=4000,
                 )
+                ready = True
             except PlaywrightTimeout:
-                pass
+                ready = False
             await self._accept_cookies(page)
 
-            all_matches = []
-            seen_rounds = set()
-            match_number = 0
+            for _ in range(view):
+                try:
+                    next_btn = await page.wait_for_selector(
+                        "button.btn--chevron-next", timeout=4000
+                    )
+                except PlaywrightTimeout:
+                    return None
+                if not next_btn or not await next_btn.is_visible():
+                    return None
+                titles = await page.evaluate(_ROUND_TITLES_SCRIPT)
+                await next_btn.click()
+                try:
+                    await page.wait_for_function(
+                        _ROUND_TITLES_CHANGED_SCRIPT, arg=titles, timeout=4000
+                    )
+                except PlaywrightTimeout:
+                    # Still showing an earlier view, so don't cache it as this one
+                    ready = False
 
-            # Collect matches from up to 3 carousel views
-            # View 0: rounds 1-3 (R32, R16, QF)
-            # View 1: rounds 2-4 (R16, QF, SF) - we skip already-seen rounds
-            # View 2: rounds 3-5 (QF, SF, F) - we skip already-seen rounds
-            for view_idx in range(3):
-                html = await page.content()
-                soup = BeautifulSoup(html, "lxml")
+            html = await page.evaluate(_DRAWSHEET_HTML_SCRIPT)
 
-                for container in soup.select(".drawsheet-round-container"):
-                    title_elem = container.select_one(
-                        ".drawsheet-round-container__round-title"
-                    )
-                    if not title_elem:
-                        continue
+        # Never cache a draw that didn't render or reach its view
+        if ready:
+            self.write_cached_html(cache_key, html)
+        return html
 
-                    round_name = _normalize_round(title_elem.get_text(strip=True))
-                    if round_name in seen_rounds:
-                        continue
-                    seen_rounds.add(round_name)
-
-                    # Parse all match widgets in this round container
-                    for widget in container.select(".drawsheet-widget"):
-                        match = _parse_match_widget(
-                            widget, round_name, tournament_info, match_number
-                        )
-                        if match:
-                            match_number += 1
-                            match.match_number = match_number
-                            yield match
-
-                # Click next to advance the carousel
-                if view_idx < 2:
-                    try:
-                        next_btn = await page.wait_for_selector(
-                            "button.btn--chevron-next", timeout=4000
-                        )
-                        if next_btn and await next_btn.is_visible():
-                            await next_btn.click()
-                            try:
-                                await page.wait_for_load_state("networkidle", timeout=4000)
-                            except PlaywrightTimeout:
-                                pass
-                        else:
-                            break
-                    except PlaywrightTimeout:
-                        break
+    async def scrape_everything(
+        self,
+        tournament_url: str,
+        tournament_info: dict,
+        gender: Optional[str] = None,
+        *,
+        results: bool = True,
+        fixtures: bool = True,
+    ) -> tuple[list[ScrapedMatch], list[ScrapedDrawEntry], list[ScrapedFixture]]:
+        """
+        Scrape a tournament's results, draw and order of play concurrently.
 
-            print(f"Scraped {match_number} matches from {len(seen_rounds)} rounds")
+        The three scrapes run together; results and draw share one load of
+        the draw carousel views, and the order of play loads in its own page
+        alongside them.
+
+        Args:
+            tournament_url: Full URL to tournament page
+            tournament_info: Dict with id, name, level, surface, year, gender
+            gender: "men" or "women", for the fixtures
+            results: Scrape match results (otherwise an empty list)
+            fixtures: Scrape the order of play (otherwise an empty list)
 
-        finally:
-            await page.close()
+        Returns:
+            Tuple of (matches, draw entries, fixtures). A scrape that failed
+            holds its exception instead, so callers can handle each part on
+            its own.
+        """
+        async def collect(items: AsyncGenerator) -> list:
+            return [item async for item in items]
+
+        async def skipped() -> list:
+            return []
+
+        return tuple(
+            await asyncio.gather(
+                collect(self.scrape_tournament_results(tournament_url, tournament_info))
+                if results else skipped(),
+                self.scrape_tournament_draw(tournament_url, tournament_info),
+                collect(self.scrape_fixtures(tournament_url, gender))
+                if fixtures else skipped(),
+                return_exceptions=True,
+            )
+        )
 
     # =========================================================================
     # Tournament list scraping (calendar page)
@@ -214,45 +438,59 @@ class ITFScraper(BaseScraper):
         Returns:
             List of tournament dicts with id, name, level, surface, url, etc.
         """
-        page = await self.new_page()
-        tournaments = []
-
-        try:
-            if gender == "women":
-                calendar_path = "womens-world-tennis-tour-calendar"
-            else:
-                calendar_path = "mens-world-tennis-tour-calendar"
-
-            url = f"{self.BASE_URL}/en/tournament-calendar/{calendar_path}/?categories=All&startdate={year}"
-            print(f"Loading ITF {gender}'s calendar for {year}...")
-            await self.navigate(page, url, wait_for="domcontentloaded")
-            try:
-                await page.wait_for_selector("a[href*='/tournament/']", timeout=4000)
-            except PlaywrightTimeout:
-                pass
-            await self._accept_cookies(page)
+        if gender == "women":
+            calendar_path = "womens-world-tennis-tour-calendar"
+        else:
+            calendar_path = "mens-world-tennis-tour-calendar"
 
-            # Load all tournaments by clicking "More Matches" repeatedly
-            await self._load_all_tournaments(page)
+        url = (
+            f"{self.BASE_URL}/en/tournament-calendar/{calendar_path}/"
+            f"?categories=All&startdate={year}"
+        )
+        html = self.read_cached_html(url, final_after=_season_end(year))
+        if html is None:
+            async with self.acquire_page() as page:
+                print(f"Loading ITF {gender}'s calendar for {year}...")
+                await self.navigate(page, url, wait_for="domcontentloaded")
+                try:
+                    await page.wait_for_selector("a[href*='/tournament/']", timeout=4000)
+                    ready = True
+                except PlaywrightTimeout:
+                    ready = False
+                await self._accept_cookies(page)
 
-            html = await page.content()
-            soup = BeautifulSoup(html, "lxml")
+                # Load all tournaments by clicking "More Matches" repeatedly
+                await self._load_all_tournaments(page)
 
-            # Find tournament links in the calendar
-            for link in soup.select("a[href*='/tournament/']"):
-                href = link.get("href", "")
-                # Skip non-tournament links (media, etc.)
-                if "draws-and-results" in href or "media" in href:
-                    continue
-                if f"/{year}/" not in href and str(year) not in href:
-                    continue
+                html = await page.content()
+            if ready:
+                self.write_cached_html(url, html)
 
-                tournament = self._parse_tournament_link(link, href, year, gender)
-                if tournament:
-                    tournaments.append(tournament)
+        soup = BeautifulSoup(html, "lxml")
 
-        finally:
-            await page.close()
+        # Find tournament links in the calendar. A row's date range is read
+        # once (keyed by the row) and shared by every link in that row.
+        tournaments = []
+        row_dates: dict[int, Optional[str]] = {}
+        for link in _TOURNAMENT_LINK_SEL.select(soup):
+            href = link.get("href", "")
+            # Skip non-tournament links (media, etc.)
+            if "draws-and-results" in href or "media" in href:
+                continue
+            if f"/{year}/" not in href and str(year) not in href:
+                continue
+
+            date_text = None
+            row = link.find_parent("tr")
+            if row is not None:
+                if id(row) not in row_dates:
+                    date_span = _CALENDAR_DATE_SEL.select_one(row)
+                    row_dates[id(row)] = date_span.get_text(strip=True) if date_span else None
+                date_text = row_dates[id(row)]
+
+            tournament = self._parse_tournament_link(link, href, year, gender, date_text)
+            if tournament:
+                tournaments.append(tournament)
 
         print(f"Parsed {len(tournaments)} ITF {gender}'s tournaments for {year}")
         return tournaments
@@ -271,16 +509,21 @@ class ITFScraper(BaseScraper):
                     consecutive_failures += 1
                     continue
 
-                await more_button.click()
-                total_clicks += 1
+                # Fire a batch of clicks back to back so the requests they
+                # trigger overlap, then wait once for the list to settle
+                link_count = await page.evaluate(_TOURNAMENT_LINK_COUNT_SCRIPT)
+                for _ in range(_MORE_MATCHES_BATCH):
+                    await more_button.click(no_wait_after=True)
+                    total_clicks += 1
+                    if total_clicks % 10 == 0:
+                        print(f"  Clicked 'More Matches' {total_clicks} times...")
+                    more_button = await page.query_selector(
+                        f"xpath={self.MORE_MATCHES_XPATH}"
+                    )
+                    if not more_button or not await more_button.is_visible():
+                        break
                 consecutive_failures = 0
-                try:
-                    await page.wait_for_load_state("networkidle", timeout=4000)
-                except PlaywrightTimeout:
-                    pass
-
-                if total_clicks % 10 == 0:
-                    print(f"  Clicked 'More Matches' {total_clicks} times...")
+                await self._wait_for_tournaments_to_settle(page, link_count)
 
             except PlaywrightTimeout:
                 consecutive_failures += 1
@@ -289,10 +532,47 @@ class ITFScraper(BaseScraper):
 
         print(f"Finished loading tournaments (clicked {total_clicks} times)")
 
+    async def _wait_for_tournaments_to_settle(
+        self, page: Page, link_count: int, timeout: float = 8.0
+    ) -> None:
+        """
+        Wait for the calendar to grow past link_count and stop growing.
+
+        Polls the tournament link count until it has increased and then held
+        steady for one interval, or until the timeout passes.
+
+        Args:
+            page: Calendar page
+            link_count: Tournament link count before the last batch of clicks
+            timeout: Maximum seconds to wait
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        last_count = link_count
+        while loop.time() < deadline:
+            await asyncio.sleep(_SETTLE_INTERVAL)
+            count = await page.evaluate(_TOURNAMENT_LINK_COUNT_SCRIPT)
+            if count > link_count and count == last_count:
+                return
+            last_count = count
+
     def _parse_tournament_link(
-        self, link, href: str, year: int, gender: str
+        self, link, href: str, year: int, gender: str, date_text: Optional[str] = None
     ) -> Optional[dict]:
-        """Parse a tournament link element from the calendar page."""
+        """
+        Parse a tournament link element from the calendar page.
+
+        Args:
+            link: Tournament <a> element
+            href: The link's href
+            year: Calendar year being scraped
+            gender: "men" or "women"
+            date_text: The link's row's date range (e.g. "01 Jan to 07 Jan
+                2024"), or None when the link isn't in a table row
+
+        Returns:
+            Tournament dict, or None if the href has no tournament ID
+        """
         # Extract tournament ID from URL path
         # e.g. /en/tournament/m25-monastir/tun/2024/m-itf-tun-2024-064/
         parts = href.strip("/").split("/")
@@ -312,45 +592,42 @@ class ITFScraper(BaseScraper):
 
         # Detect level from name (e.g. "M15 Monastir" -> ITF $15K)
         level = "ITF"
-        level_match = re.search(r"[MW](\d+)", name) or re.search(
-            r"[MW](\d+)", tourney_id
-        )
+        level_match = _LEVEL_RE.search(name) or _LEVEL_RE.search(tourney_id)
         if level_match:
             prize_level = level_match.group(1)
             level = LEVEL_MAPPING.get(prize_level, f"ITF ${prize_level}K")
 
         full_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
 
-        # Extract start date from table row
+        # Parse start date from the row's date range
         start_date = None
         try:
-            tr = link.find_parent("tr")
-            if tr:
-                date_span = tr.select_one("td.date span.date")
-                if date_span:
-                    # Format: "01 Jan to 07 Jan 2024"
-                    full_text = date_span.get_text(strip=True)
-                    parts = full_text.split(" to ")
-                    
-                    if parts:
-                        start_part = parts[0].strip()  # "01 Jan"
-                        
-                        # Infer year from the end of the full string
-                        year_match = re.search(r"(\d{4})$", full_text)
-                        year_to_use = int(year_match.group(1)) if year_match else year
-                        
-                        # Check if start_part already has year (rare but possible)
-                        if re.search(r"\d{4}", start_part):
-                            dt = datetime.strptime(start_part, "%d %b %Y")
-                        else:
-                            dt = datetime.strptime(f"{start_part} {year_to_use}", "%d %b %Y")
-                            
-                            # Handle Dec-Jan rollover
-                            # If start is Dec and end is Jan, start year should be year-1
-                            if dt.month == 12 and len(parts) > 1 and "Jan" in parts[1]:
-                                dt = dt.replace(year=year_to_use - 1)
-                        
-                        start_date = dt.strftime("%Y-%m-%d")
+            if date_text:
+                # Format: "01 Jan to 07 Jan 2024"
+                parts = date_text.split(" to ")
+
+                if parts:
+                    start_part = parts[0].strip()  # "01 Jan"
+
+                    # Infer year from the end of the full string
+                    year_match = _TRAILING_YEAR_RE.search(date_text)
+                    year_to_use = int(year_match.group(1)) if year_match else year
+
+                    day, month, *start_year = start_part.split()
+                    month_number = _MONTHS[month[:3].title()]
+
+                    # Check if start_part already has year (rare but possible)
+                    if start_year:
+                        dt = date(int(start_year[0]), month_number, int(day))
+                    else:
+                        dt = date(year_to_use, month_number, int(day))
+
+                        # Handle Dec-Jan rollover
+                        # If start is Dec and end is Jan, start year should be year-1
+                        if dt.month == 12 and len(parts) > 1 and "Jan" in parts[1]:
+                            dt = dt.replace(year=year_to_use - 1)
+
+                    start_date = dt.strftime("%Y-%m-%d")
         except Exception:
             # Ignore date parsing errors, just leave start_date as None
             pass
@@ -379,7 +656,7 @@ class ITFScraper(BaseScraper):
         """
         Scrape the full draw bracket for an ITF tournament.
 
-        Navigates through the draw carousel to capture all match slots, including
+        Loads every draw carousel view to capture all match slots, including
         byes and upcoming matches.
 
         Args:
@@ -389,74 +666,39 @@ class ITFScraper(BaseScraper):
         Returns:
             List of ScrapedDrawEntry objects
         """
-        page = await self.new_page()
         entries = []
 
-        try:
-            draws_url = tournament_url.rstrip("/") + "/draws-and-results/"
-            print(f"Scraping ITF draw: {draws_url}")
+        draws_url = tournament_url.rstrip("/") + "/draws-and-results/"
+        print(f"Scraping ITF draw: {draws_url}")
 
-            await self.navigate(page, draws_url, wait_for="domcontentloaded")
-            try:
-                await page.wait_for_selector(
-                    ".drawsheet-round-container, .drawsheet-widget",
-                    timeout=4000,
-                )
-            except PlaywrightTimeout:
-                pass
-            await self._accept_cookies(page)
+        seen_rounds = set()
 
-            seen_rounds = set()
-            
-            # Carousel iteration (similar to results scraping)
-            for view_idx in range(3):
-                html = await page.content()
-                soup = BeautifulSoup(html, "lxml")
+        views = self._iter_draw_views(draws_url, _draws_final_after(tournament_info))
+        async for html in views:
+            soup = BeautifulSoup(html, "lxml", parse_only=_DRAWSHEET_STRAINER)
 
-                for container in soup.select(".drawsheet-round-container"):
-                    title_elem = container.select_one(
-                        ".drawsheet-round-container__round-title"
-                    )
-                    if not title_elem:
-                        continue
+            for container in _ROUND_CONTAINER_SEL.select(soup):
+                title_elem = _ROUND_TITLE_SEL.select_one(container)
+                if not title_elem:
+                    continue
 
-                    round_name = _normalize_round(title_elem.get_text(strip=True))
-                    if round_name in seen_rounds:
-                        continue
-                    seen_rounds.add(round_name)
-
-                    # Parse all widgets in this round
-                    # ITF displays matches in vertical order, so index+1 is the draw position
-                    widgets = container.select(".drawsheet-widget")
-                    print(f"  Round {round_name}: {len(widgets)} slots")
-
-                    for i, widget in enumerate(widgets):
-                        draw_position = i + 1
-                        entry = _parse_draw_entry_widget(
-                            widget, round_name, draw_position, tournament_info
-                        )
-                        if entry:
-                            entries.append(entry)
-
-                # Click next
-                if view_idx < 2:
-                    try:
-                        next_btn = await page.wait_for_selector(
-                            "button.btn--chevron-next", timeout=4000
-                        )
-                        if next_btn and await next_btn.is_visible():
-                            await next_btn.click()
-                            try:
-                                await page.wait_for_load_state("networkidle", timeout=4000)
-                            except PlaywrightTimeout:
-                                pass
-                        else:
-                            break
-                    except PlaywrightTimeout:
-                        break
+                round_name = _normalize_round(title_elem.get_text(strip=True))
+                if round_name in seen_rounds:
+                    continue
+                seen_rounds.add(round_name)
 
-        finally:
-            await page.close()
+                # Parse all widgets in this round
+                # ITF displays matches in vertical order, so index+1 is the draw position
+                widgets = _DRAW_WIDGET_SEL.select(container)
+                print(f"  Round {round_name}: {len(widgets)} slots")
+
+                for i, widget in enumerate(widgets):
+                    draw_position = i + 1
+                    entry = _parse_draw_entry_widget(
+                        widget, round_name, draw_position, tournament_info
+                    )
+                    if entry:
+                        entries.append(entry)
 
         print(f"Scraped {len(entries)} draw entries from {tournament_info['id']}")
         return entries
@@ -478,13 +720,11 @@ class ITFScraper(BaseScraper):
         Matches are grouped by court in .orderop-widget-container elements.
         Each match is an .orderop-widget.
         """
-        page = await self.new_page()
-        
         # Construct OOP URL
         # tournament_url usually ends with / e.g. .../m-itf-gbr-2026-001/
         oop_url = tournament_url.rstrip("/") + "/order-of-play/"
         
-        try:
+        async with self.acquire_page() as page:
             print(f"Scraping ITF schedule: {oop_url}")
             await self.navigate(page, oop_url, wait_for="domcontentloaded")
             try:
@@ -494,7 +734,7 @@ class ITFScraper(BaseScraper):
             await self._accept_cookies(page)
 
             html = await page.content()
-            soup = BeautifulSoup(html, "lxml")
+            soup = BeautifulSoup(html, "lxml", parse_only=_ORDER_OF_PLAY_STRAINER)
 
             # Iterate over courts
             court_containers = soup.select(".orderop-widget-container")
@@ -550,9 +790,6 @@ class ITFScraper(BaseScraper):
                             fixture.scheduled_time = effective_time
                         yield fixture
 
-        finally:
-            await page.close()
-
     def _parse_fixture_widget(
         self,
         widget,
@@ -600,7 +837,7 @@ class ITFScraper(BaseScraper):
             seed = None
             seed_el = team_div.select_one(".orderop-widget__seeding")
             if seed_el:
-                s_match = re.search(r"\[(\d+)\]", seed_el.get_text(strip=True))
+                s_match = _SEED_RE.search(seed_el.get_text(strip=True))
                 if s_match:
                     seed = int(s_match.group(1))
             
@@ -651,12 +888,7 @@ class ITFScraper(BaseScraper):
 
         date_elem = widget.select_one(".orderop-widget__date")
         if date_elem:
-            try:
-                raw_date = date_elem.get_text(strip=True)
-                dt = datetime.strptime(raw_date, "%A %d %B %Y")
-                date_str = dt.strftime("%Y-%m-%d")
-            except ValueError:
-                pass
+            date_str = _parse_oop_date(date_elem.get_text(strip=True))
 
         time_elem = widget.select_one(".orderop-widget__start-time")
         raw_time = ""
@@ -665,7 +897,7 @@ class ITFScraper(BaseScraper):
             lower = raw_time.lower()
             if "followed by" in lower:
                 followed_by = True
-            time_match = re.search(r"(\d{1,2}:\d{2})", raw_time)
+            time_match = _TIME_RE.search(raw_time)
             if time_match:
                 time_str = time_match.group(1)
 
@@ -677,9 +909,63 @@ class ITFScraper(BaseScraper):
 # =============================================================================
 
 
+@lru_cache(maxsize=256)
 def _normalize_round(raw: str) -> str:
-    """Normalize ITF round name to standard code (R32, R16, QF, SF, F)."""
-    return ITF_ROUND_MAP.get(raw.lower().strip(), raw.upper())
+    """
+    Normalize ITF round name to standard code (R32, R16, QF, SF, F).
+
+    Memoized since a draw or order of play repeats a handful of labels.
+    Spelling variants ("Quarter Finals", "Semi Finals") are matched with
+    spaces and hyphens removed.
+    """
+    key = raw.strip().casefold()
+    code = ITF_ROUND_MAP.get(key)
+    if code is None:
+        code = _COMPACT_ROUND_MAP.get(key.replace("-", "").replace(" ", ""), raw.upper())
+    return code
+
+
+@lru_cache(maxsize=512)
+def _parse_oop_date(raw_date: str) -> Optional[str]:
+    """
+    Parse an order-of-play day header like "Monday 15 January 2024".
+
+    Memoized since every widget on a day repeats the same header.
+
+    Args:
+        raw_date: Header text in "%A %d %B %Y" form
+
+    Returns:
+        Date string like "2024-01-15", or None if it doesn't parse
+    """
+    try:
+        return datetime.strptime(raw_date, "%A %d %B %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _season_end(year: int) -> datetime:
+    """When a season's calendar stops changing (midnight on 1 January after)."""
+    return datetime(year + 1, 1, 1)
+
+
+def _draws_final_after(tournament_info: dict) -> datetime:
+    """
+    When a tournament's draws page stops changing.
+
+    The day after its end date (or a week after its start date when only
+    that is known), falling back to the end of its season when neither is
+    known or parses.
+    """
+    for key, days in (("end_date", 1), ("start_date", 8)):
+        raw = tournament_info.get(key)
+        if not raw:
+            continue
+        try:
+            return datetime.strptime(raw, "%Y-%m-%d") + timedelta(days=days)
+        except (ValueError, TypeError):
+            continue
+    return _season_end(tournament_info["year"])
 
 
 def _itf_source_from_gender(gender: Optional[str]) -> str:
@@ -713,14 +999,14 @@ def _parse_match_widget(
     Returns:
         ScrapedMatch if parseable, None for BYEs or unparseable matches
     """
-    team1 = widget.select_one(".drawsheet-widget__team-info--team-1")
-    team2 = widget.select_one(".drawsheet-widget__team-info--team-2")
+    team1 = _TEAM_1_SEL.select_one(widget)
+    team2 = _TEAM_2_SEL.select_one(widget)
 
     if not team1 or not team2:
         return None
 
-    player_a = _extract_player(team1)
-    player_b = _extract_player(team2)
+    player_a, scores_a = _extract_team(team1)
+    player_b, scores_b = _extract_team(team2)
 
     if not player_a or not player_b:
         return None
@@ -736,10 +1022,6 @@ def _parse_match_widget(
     elif "is-winner" in (team2.get("class") or []):
         winner_name = player_b["name"]
 
-    # Extract set scores from each team's score spans
-    scores_a = [s.get_text(strip=True) for s in team1.select(".drawsheet-widget__score")]
-    scores_b = [s.get_text(strip=True) for s in team2.select(".drawsheet-widget__score")]
-
     # Check if all scores are empty (ITF shows empty spans for walkovers)
     has_scores = any(s for s in scores_a) or any(s for s in scores_b)
 
@@ -749,7 +1031,7 @@ def _parse_match_widget(
     # Check for retirement/walkover status
     # The status description appears as .drawsheet-widget__winner-status-desc
     status = "completed"
-    status_elem = widget.select_one(".drawsheet-widget__winner-status-desc")
+    status_elem = _WINNER_STATUS_SEL.select_one(widget)
     if status_elem:
         status_text = status_elem.get_text(strip=True).lower()
         if "retired" in status_text or "ret" in status_text:
@@ -802,37 +1084,53 @@ def _parse_match_widget(
     )
 
 
-def _extract_player(team_info) -> Optional[dict]:
+def _extract_team(team_info) -> tuple[Optional[dict], list[str]]:
     """
-    Extract player info from a .drawsheet-widget__team-info element.
+    Extract player info and set scores from a .drawsheet-widget__team-info element.
 
-    Returns dict with name, itf_id, nationality, seed, or None if no player found.
+    The player link, flag, seeding and score elements are found in one
+    pass over the block (_TEAM_PARTS_SEL) rather than a query each.
+
+    Returns:
+        Tuple of (player dict with name, itf_id, nationality, seed, or None
+        if no player found; set score strings in order)
     """
-    player_link = team_info.select_one(".player-wrapper a")
+    player_link = flag = seed_elem = None
+    scores = []
+    for el in _TEAM_PARTS_SEL.select(team_info):
+        classes = el.get("class") or []
+        if "drawsheet-widget__score" in classes:
+            scores.append(el.get_text(strip=True))
+        elif "drawsheet-widget__seeding" in classes:
+            seed_elem = seed_elem or el
+        elif "itf-flags" in classes:
+            flag = flag or el
+        elif el.name == "a":
+            player_link = player_link or el
+
     if not player_link:
-        return None
+        return None, scores
 
     # Name from first/last name spans
-    first = player_link.select_one(".drawsheet-widget__first-name")
-    last = player_link.select_one(".drawsheet-widget__last-name")
+    first = _FIRST_NAME_SEL.select_one(player_link)
+    last = _LAST_NAME_SEL.select_one(player_link)
     if first and last:
         name = f"{first.get_text(strip=True)} {last.get_text(strip=True)}"
     else:
         name = player_link.get_text(strip=True)
 
     if not name:
-        return None
+        return None, scores
 
     # ITF ID from player link href: /en/players/name/800399810/country/mt/s/
     itf_id = None
     href = player_link.get("href", "")
-    id_match = re.search(r"/players/[^/]+/(\d+)/", href)
+    id_match = _PLAYER_ID_RE.search(href)
     if id_match:
         itf_id = id_match.group(1)
 
     # Nationality from flag class: itf-flags--RUS -> RUS
     nationality = None
-    flag = team_info.select_one(".drawsheet-widget__nationality .itf-flags")
     if flag:
         for cls in flag.get("class", []):
             if cls.startswith("itf-flags--"):
@@ -840,13 +1138,13 @@ def _extract_player(team_info) -> Optional[dict]:
 
     # Seed from [N] in seeding span
     seed = None
-    seed_elem = team_info.select_one(".drawsheet-widget__seeding")
     if seed_elem:
-        seed_match = re.search(r"\[(\d+)\]", seed_elem.get_text(strip=True))
+        seed_match = _SEED_RE.search(seed_elem.get_text(strip=True))
         if seed_match:
             seed = int(seed_match.group(1))
 
-    return {"name": name, "itf_id": itf_id, "nationality": nationality, "seed": seed}
+    player = {"name": name, "itf_id": itf_id, "nationality": nationality, "seed": seed}
+    return player, scores
 
 
 def _build_score(scores_a: list[str], scores_b: list[str]) -> str:
@@ -888,15 +1186,15 @@ def _parse_draw_entry_widget(
     """
     Parse a draw widget into a ScrapedDrawEntry.
     """
-    team1 = widget.select_one(".drawsheet-widget__team-info--team-1")
-    team2 = widget.select_one(".drawsheet-widget__team-info--team-2")
+    team1 = _TEAM_1_SEL.select_one(widget)
+    team2 = _TEAM_2_SEL.select_one(widget)
     
     if not team1 or not team2:
         return None
 
     # Check for BYEs
-    player_a = _extract_player(team1)
-    player_b = _extract_player(team2)
+    player_a, scores_a = _extract_team(team1)
+    player_b, scores_b = _extract_team(team2)
     
     is_bye = False
     if (player_a and player_a["name"].lower() == "bye") or \
@@ -913,8 +1211,6 @@ def _parse_draw_entry_widget(
     winner_name = None
     
     if not is_bye:
-        scores_a = [s.get_text(strip=True) for s in team1.select(".drawsheet-widget__score")]
-        scores_b = [s.get_text(strip=True) for s in team2.select(".drawsheet-widget__score")]
         has_scores = any(s for s in scores_a) or any(s for s in scores_b)
         
         if has_scores:
@@ -7,6 +7,7 @@ tennis websites (ATP, WTA, ITF, betting sites).
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from bs4 import BeautifulSoup, Tag
@@ -242,6 +243,8 @@ def _extract_generic_player(element: Tag) -> Optional[ExtractedPlayer]:
     return None
 
 
+# Memoized: the same player names recur across every match of a backfill
+@lru_cache(maxsize=4096)
 def extract_seed_from_name(name: str) -> tuple[str, Optional[int]]:
     """
     Extract seed number if embedded in player name.
@@ -17,6 +17,7 @@ from teelo.elo.updater import EloUpdater
 from teelo.players.aliases import normalize_name
 from teelo.players.identity import PlayerIdentityService
 from teelo.scrape.atp import ATPScraper
+from teelo.scrape.base import ScrapedMatch
 from teelo.scrape.itf import ITFScraper
 from teelo.scrape.parsers.score import ScoreParseError, parse_score
 from teelo.scrape.utils import TOUR_TYPES
@@ -373,12 +374,33 @@ async def _execute_current_task(
         if verbose:
             print(message)
 
+    scrape_schedule = _should_scrape_schedule(task_params, today, fast_mode=fast_mode)
+    scrape_results = _should_scrape_results(task_params, today, fast_mode=fast_mode)
+
     async with scraper_ctx as active_scraper:
         edition = await get_or_create_edition(session, task_params, tour_key)
 
+        # ITF pages are scraped up front, all together: the draw and results
+        # share the draw carousel and the order of play loads alongside.
+        # Each phase below then picks up its part (or its scrape error), so
+        # their scrape time goes under its own "itf_combined" phase.
+        itf_scraped = None
+        if tour_key.startswith("ITF"):
+            report("Scraping Draw, Schedule and Results")
+            itf_scrape_start = perf_counter()
+            itf_scraped = await active_scraper.scrape_everything(
+                task_params.tournament_url,
+                _itf_tournament_info(task_params),
+                task_params.gender,
+                results=scrape_results,
+                fixtures=scrape_schedule,
+            )
+            itf_scrape_elapsed = perf_counter() - itf_scrape_start
+            timings["phases"]["itf_combined"] = {"scrape": itf_scrape_elapsed}
+            timings["scraping"] += itf_scrape_elapsed
+
         # 1. DRAW
         try:
-            report("Scraping Draw")
             draw_kwargs = {
                 "tournament_id": task_params.tournament_id,
                 "year": task_params.year,
@@ -394,11 +416,15 @@ async def _execute_current_task(
                     "tournament_info": _itf_tournament_info(task_params),
                 }
 
-            draw_scrape_start = perf_counter()
-            entries = await active_scraper.scrape_tournament_draw(**draw_kwargs)
-            draw_scrape_elapsed = perf_counter() - draw_scrape_start
-            timings["phases"]["draw"]["scrape"] += draw_scrape_elapsed
-            timings["scraping"] += draw_scrape_elapsed
+            if itf_scraped is not None:
+                entries = _scraped_part(itf_scraped[1])
+            else:
+                report("Scraping Draw")
+                draw_scrape_start = perf_counter()
+                entries = await active_scraper.scrape_tournament_draw(**draw_kwargs)
+                draw_scrape_elapsed = perf_counter() - draw_scrape_start
+                timings["phases"]["draw"]["scrape"] += draw_scrape_elapsed
+                timings["scraping"] += draw_scrape_elapsed
 
             draw_fp = _phase_fingerprint(
                 [
@@ -437,9 +463,8 @@ async def _execute_current_task(
             edition = await get_or_create_edition(session, task_params, tour_key)
 
         # 2. SCHEDULE
-        if _should_scrape_schedule(task_params, today, fast_mode=fast_mode):
+        if scrape_schedule:
             try:
-                report("Scraping Schedule")
                 sched_kwargs: dict[str, Any] = {}
                 if tour_key.startswith("ITF"):
                     sched_kwargs["tournament_url"] = task_params.tournament_url
@@ -452,13 +477,17 @@ async def _execute_current_task(
                 if tour_key in ["WTA", "WTA_125"]:
                     sched_kwargs["year"] = task_params.year
 
-                schedule_scrape_start = perf_counter()
                 fixtures = []
-                async for fixture in active_scraper.scrape_fixtures(**sched_kwargs):
-                    fixtures.append(fixture)
-                schedule_scrape_elapsed = perf_counter() - schedule_scrape_start
-                timings["phases"]["schedule"]["scrape"] += schedule_scrape_elapsed
-                timings["scraping"] += schedule_scrape_elapsed
+                if itf_scraped is not None:
+                    fixtures = _scraped_part(itf_scraped[2])
+                else:
+                    report("Scraping Schedule")
+                    schedule_scrape_start = perf_counter()
+                    async for fixture in active_scraper.scrape_fixtures(**sched_kwargs):
+                        fixtures.append(fixture)
+                    schedule_scrape_elapsed = perf_counter() - schedule_scrape_start
+                    timings["phases"]["schedule"]["scrape"] += schedule_scrape_elapsed
+                    timings["scraping"] += schedule_scrape_elapsed
 
                 schedule_fp = _phase_fingerprint(
                     [
@@ -501,9 +530,8 @@ async def _execute_current_task(
         # Tracks stats from ingest_results so we can run ELO inline after commit.
         # Stays None if results were skipped (fast_mode fingerprint match) or failed.
         results_ingest_stats: Optional[ResultsIngestionStats] = None
-        if _should_scrape_results(task_params, today, fast_mode=fast_mode):
+        if scrape_results:
             try:
-                report("Scraping Results")
                 res_kwargs = {
                     "tournament_id": task_params.tournament_id,
                     "year": task_params.year,
@@ -519,13 +547,17 @@ async def _execute_current_task(
                         "tournament_info": _itf_tournament_info(task_params),
                     }
 
-                results_scrape_start = perf_counter()
                 matches = []
-                async for match in active_scraper.scrape_tournament_results(**res_kwargs):
-                    matches.append(match)
-                results_scrape_elapsed = perf_counter() - results_scrape_start
-                timings["phases"]["results"]["scrape"] += results_scrape_elapsed
-                timings["scraping"] += results_scrape_elapsed
+                if itf_scraped is not None:
+                    matches = _scraped_part(itf_scraped[0])
+                else:
+                    report("Scraping Results")
+                    results_scrape_start = perf_counter()
+                    async for match in active_scraper.scrape_tournament_results(**res_kwargs):
+                        matches.append(match)
+                    results_scrape_elapsed = perf_counter() - results_scrape_start
+                    timings["phases"]["results"]["scrape"] += results_scrape_elapsed
+                    timings["scraping"] += results_scrape_elapsed
 
                 results_fp = _phase_fingerprint(
                     [
@@ -648,125 +680,77 @@ async def _execute_historical_task(
     known_external_ids.update(existing_matches_by_external_id.keys())
 
     # Flag to update tournament metadata once we have real data
+    # (only ATP results carry the real name, surface, etc.)
+    update_metadata = tour_config["scraper"] == "atp"
     metadata_updated = False
 
     scraper_ctx = _scraper_context(tour_key, scraper)
     pending_matches: list[Match] = []
     batch_size = 200
 
+    ingest_time = 0.0
+
+    async def ingest_match(scraped_match: ScrapedMatch) -> None:
+        nonlocal metadata_updated, ingest_time
+        ingest_start = perf_counter()
+        if update_metadata and not metadata_updated:
+            await update_tournament_metadata(session, edition, scraped_match)
+            metadata_updated = True
+
+        result["matches_scraped"] += 1
+        match_result, created = await process_scraped_match(
+            session,
+            scraped_match,
+            edition,
+            identity_service,
+            known_external_ids,
+            existing_matches_by_external_id,
+            player_cache_by_external_id,
+            player_cache_by_name,
+            overwrite=overwrite,
+        )
+        if match_result and created:
+            pending_matches.append(match_result)
+            result["matches_created"] += 1
+            if len(pending_matches) >= batch_size:
+                session.add_all(pending_matches)
+                session.flush()
+                pending_matches.clear()
+        ingest_time += perf_counter() - ingest_start
+
     async with scraper_ctx as active_scraper:
         if tour_config["scraper"] == "atp":
-            loop_start = perf_counter()
-            ingest_time = 0.0
-            async for scraped_match in active_scraper.scrape_tournament_results(
+            scraped = active_scraper.scrape_tournament_results(
                 task_params.tournament_id,
                 task_params.year,
                 tournament_number=task_params.tournament_number,
                 tour_type=task_params.tour_type or "main",
-            ):
-                ingest_start = perf_counter()
-                if not metadata_updated:
-                    await update_tournament_metadata(session, edition, scraped_match)
-                    metadata_updated = True
-
-                result["matches_scraped"] += 1
-                match_result, created = await process_scraped_match(
-                    session,
-                    scraped_match,
-                    edition,
-                    identity_service,
-                    known_external_ids,
-                    existing_matches_by_external_id,
-                    player_cache_by_external_id,
-                    player_cache_by_name,
-                    overwrite=overwrite,
-                )
-                if match_result and created:
-                    pending_matches.append(match_result)
-                    result["matches_created"] += 1
-                    if len(pending_matches) >= batch_size:
-                        session.add_all(pending_matches)
-                        session.flush()
-                        pending_matches.clear()
-                ingest_time += perf_counter() - ingest_start
-            loop_elapsed = perf_counter() - loop_start
-            timings["phases"]["matches"]["ingest"] += ingest_time
-            timings["phases"]["matches"]["scrape"] += max(loop_elapsed - ingest_time, 0.0)
-            timings["ingestion"] += ingest_time
-            timings["scraping"] += max(loop_elapsed - ingest_time, 0.0)
-
+            )
         elif tour_config["scraper"] == "itf":
             if not task_params.tournament_url:
                 raise ValueError("ITF tasks require tournament_url")
 
             tournament_info = _itf_tournament_info(task_params)
-
-            loop_start = perf_counter()
-            ingest_time = 0.0
-            async for scraped_match in active_scraper.scrape_tournament_results(
+            scraped = active_scraper.scrape_tournament_results(
                 task_params.tournament_url, tournament_info
-            ):
-                ingest_start = perf_counter()
-                result["matches_scraped"] += 1
-                match_result, created = await process_scraped_match(
-                    session,
-                    scraped_match,
-                    edition,
-                    identity_service,
-                    known_external_ids,
-                    existing_matches_by_external_id,
-                    player_cache_by_external_id,
-                    player_cache_by_name,
-                    overwrite=overwrite,
-                )
-                if match_result and created:
-                    pending_matches.append(match_result)
-                    result["matches_created"] += 1
-                    if len(pending_matches) >= batch_size:
-                        session.add_all(pending_matches)
-                        session.flush()
-                        pending_matches.clear()
-                ingest_time += perf_counter() - ingest_start
-            loop_elapsed = perf_counter() - loop_start
-            timings["phases"]["matches"]["ingest"] += ingest_time
-            timings["phases"]["matches"]["scrape"] += max(loop_elapsed - ingest_time, 0.0)
-            timings["ingestion"] += ingest_time
-            timings["scraping"] += max(loop_elapsed - ingest_time, 0.0)
-
+            )
         elif tour_config["scraper"] == "wta":
-            loop_start = perf_counter()
-            ingest_time = 0.0
-            async for scraped_match in active_scraper.scrape_tournament_results(
+            scraped = active_scraper.scrape_tournament_results(
                 task_params.tournament_id,
                 task_params.year,
                 tournament_number=task_params.tournament_number,
-            ):
-                ingest_start = perf_counter()
-                result["matches_scraped"] += 1
-                match_result, created = await process_scraped_match(
-                    session,
-                    scraped_match,
-                    edition,
-                    identity_service,
-                    known_external_ids,
-                    existing_matches_by_external_id,
-                    player_cache_by_external_id,
-                    player_cache_by_name,
-                    overwrite=overwrite,
-                )
-                if match_result and created:
-                    pending_matches.append(match_result)
-                    result["matches_created"] += 1
-                    if len(pending_matches) >= batch_size:
-                        session.add_all(pending_matches)
-                        session.flush()
-                        pending_matches.clear()
-                ingest_time += perf_counter() - ingest_start
-            loop_elapsed = perf_counter() - loop_start
-            timings["phases"]["matches"]["ingest"] += ingest_time
-            timings["phases"]["matches"]["scrape"] += max(loop_elapsed - ingest_time, 0.0)
-            timings["ingestion"] += ingest_time
-            timings["scraping"] += max(loop_elapsed - ingest_time, 0.0)
+            )
+        else:
+            raise ValueError(f"Unknown scraper type for {tour_key}")
+
+        # Scraping continues in the background while each match is ingested
+        loop_start = perf_counter()
+        await active_scraper.stream(scraped, ingest_match)
+        loop_elapsed = perf_counter() - loop_start
+        timings["phases"]["matches"]["ingest"] += ingest_time
+        timings["phases"]["matches"]["scrape"] += max(loop_elapsed - ingest_time, 0.0)
+        timings["ingestion"] += ingest_time
+        timings["scraping"] += max(loop_elapsed - ingest_time, 0.0)
 
     if pending_matches:
         flush_start = perf_counter()
@@ -789,6 +773,13 @@ async def _execute_historical_task(
     return result
 
 
+def _scraped_part(part: Any) -> Any:
+    """Return one part of ITFScraper.scrape_everything, raising its error."""
+    if isinstance(part, BaseException):
+        raise part
+    return part
+
+
 def _itf_tournament_info(task_params: TaskParams) -> dict[str, Any]:
     return {
         "id": task_params.tournament_id,
@@ -798,6 +789,8 @@ def _itf_tournament_info(task_params: TaskParams) -> dict[str, Any]:
         "surface": task_params.tournament_surface or "Hard",
         "location": task_params.tournament_location,
         "gender": task_params.gender or "men",
+        "start_date": task_params.start_date,
+        "end_date": task_params.end_date,
     }
 
 
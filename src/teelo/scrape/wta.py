@@ -318,8 +318,10 @@ class WTAScraper(BaseScraper):
             await self._clear_onetrust_overlays(page)
             await self._clear_onetrust_overlays(page)
 
-            # Find day navigation buttons
-            day_buttons = await page.query_selector_all("button.day-navigation__button")
+            # Find day navigation buttons: (data-date, title) for each day
+            day_buttons = await self.fetch_text_matrix(
+                page, "button.day-navigation__button", ["@data-date", "@title"]
+            )
             print(f"Found {len(day_buttons)} day navigation buttons")
 
             if not day_buttons:
@@ -333,11 +335,10 @@ class WTAScraper(BaseScraper):
 
             # Collect day info: (date_str, button_index) for each day
             # We'll click each button, wait for content, then parse singles matches
-            days = []
-            for btn in day_buttons:
-                date_str = await btn.get_attribute("data-date")
-                title = await btn.get_attribute("title") or ""
-                days.append({"date": date_str, "title": title})
+            days = [
+                {"date": date_str, "title": title or ""}
+                for date_str, title in day_buttons
+            ]
 
             print(f"Days to scrape: {[d['date'] for d in days]}")
 
@@ -1132,7 +1133,9 @@ class WTAScraper(BaseScraper):
             await self._clear_onetrust_overlays(page)
 
             # Check if we have day navigation buttons
-            day_buttons = await page.query_selector_all("button.day-navigation__button")
+            day_buttons = await self.fetch_text_matrix(
+                page, "button.day-navigation__button", ["@data-date"]
+            )
 
             if not day_buttons:
                 # Try parsing current content
@@ -1141,10 +1144,7 @@ class WTAScraper(BaseScraper):
                 return
 
             # Collect available days
-            days = []
-            for btn in day_buttons:
-                date_str = await btn.get_attribute("data-date")
-                days.append(date_str)
+            days = [date_str for (date_str,) in day_buttons]
 
             print(f"Found schedule days: {days}")
 
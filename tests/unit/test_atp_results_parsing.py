@@ -0,0 +1,407 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from bs4 import BeautifulSoup
+
+from teelo.scrape.atp import ATPScraper, scrape_atp_tournaments
+
+TOURNAMENT_INFO = {
+    "id": "brisbane",
+    "name": "Brisbane",
+    "year": 2026,
+    "level": "ATP 250",
+    "surface": "Hard",
+    "location": "Brisbane, Australia",
+    "country_ioc": "AUS",
+}
+
+
+def _match_html(
+    round_text: str,
+    player_a: tuple[str, str],
+    player_b: tuple[str, str],
+    scores_a: list[str],
+    scores_b: list[str],
+    cta: str = "H2H",
+) -> str:
+    def player(name: str, slug_id: str) -> str:
+        return (
+            f'<div class="name"><a href="/en/players/{name.lower()}/{slug_id}/overview">'
+            f"{name}</a></div>"
+        )
+
+    def scores(values: list[str]) -> str:
+        return "".join(
+            '<div class="score-item">'
+            + "".join(f"<span>{v}</span>" for v in value.split("|"))
+            + "</div>"
+            for value in values
+        )
+
+    return (
+        '<div class="match">'
+        f'<div class="match-header"><span>{round_text}</span></div>'
+        f"{player(*player_a)}{scores(scores_a)}"
+        f"{player(*player_b)}{scores(scores_b)}"
+        f'<div class="match-cta">{cta}</div>'
+        "</div>"
+    )
+
+
+def _day_html(header_text: str, *matches: str) -> str:
+    return (
+        '<div class="atp_accordion-item">'
+        '<div class="atp_accordion-header"><div class="tournament-day">'
+        f"<h4>{header_text}</h4></div></div>"
+        f'<div class="atp_accordion-content">{"".join(matches)}</div>'
+        "</div>"
+    )
+
+
+async def _parse(html: str) -> list:
+    scraper = ATPScraper()
+    return [m async for m in scraper._parse_results_page(html, dict(TOURNAMENT_INFO), "main")]
+
+
+async def test_day_grouped_results_carry_match_dates():
+    html = "<html><body>" + _day_html(
+        "Sun, 11 January, 2026Day (9)",
+        _match_html("Final", ("Sinner", "s0ag"), ("Alcaraz", "a0e2"), ["6", "7|5"], ["4", "6"]),
+    ) + _day_html(
+        "Sat, 10 January, 2026Day (8)",
+        _match_html("Semi-Finals", ("Sinner", "s0ag"), ("Zverev", "z355"), ["6", "6"], ["3", "2"]),
+    ) + "</body></html>"
+
+    matches = await _parse(html)
+
+    assert [m.round for m in matches] == ["F", "SF"]
+    assert [m.match_date for m in matches] == ["2026-01-11", "2026-01-10"]
+    assert [m.match_number for m in matches] == [1, 2]
+    final = matches[0]
+    assert final.player_a_external_id == "S0AG"
+    assert final.player_b_external_id == "A0E2"
+    assert final.winner_name == "Sinner"
+    assert final.score_raw == "6-4 7-6"
+    assert final.external_id == "2026_brisbane_F_A0E2_S0AG"
+
+
+async def test_results_extracted_without_page_wrappers_keep_day_dates():
+    # Shape returned by the in-browser extractor: top-level header/content
+    # pairs with no accordion-item wrapper or surrounding page
+    day = _day_html(
+        "Sun, 11 January, 2026Day (9)",
+        _match_html("Final", ("Sinner", "s0ag"), ("Alcaraz", "a0e2"), ["6", "6"], ["4", "4"]),
+    )
+    fragment = day.removeprefix('<div class="atp_accordion-item">').removesuffix("</div>")
+
+    matches = await _parse(fragment)
+
+    assert len(matches) == 1
+    assert matches[0].match_date == "2026-01-11"
+
+
+async def test_results_without_day_headers_fall_back_to_flat_match_list():
+    html = "<html><body>" + _match_html(
+        "Quarter-Finals", ("Rune", "r0dg"), ("Fritz", "fb98"), ["7", "2"], ["5", "1"]
+    ) + "</body></html>"
+
+    matches = await _parse(html)
+
+    assert len(matches) == 1
+    assert matches[0].round == "QF"
+    assert matches[0].match_date is None
+    assert matches[0].status == "retired"
+
+
+async def test_walkover_detected_from_cta_and_empty_scores():
+    html = "<html><body>" + _day_html(
+        "Final",
+        _match_html("Round of 16", ("Rune", "r0dg"), ("Fritz", "fb98"), [], [], cta="W/O"),
+    ) + "</body></html>"
+
+    matches = await _parse(html)
+
+    assert len(matches) == 1
+    assert matches[0].match_date is None
+    assert matches[0].status == "walkover"
+    assert matches[0].score_raw == "W/O"
+
+
+async def test_walkover_cta_ignores_placeholder_score_cells():
+    html = "<html><body>" + _match_html(
+        "Round of 16", ("Rune", "r0dg"), ("Fritz", "fb98"), ["0"], ["0"], cta="W/O"
+    ) + "</body></html>"
+
+    matches = await _parse(html)
+
+    assert matches[0].status == "walkover"
+    assert matches[0].score_raw == "W/O"
+
+
+async def test_page_chrome_around_results_is_ignored():
+    html = (
+        "<html><head><script>var match = 1;</script></head><body>"
+        '<nav><div class="atp_accordion-header"><span>Menu</span></div>'
+        '<div class="atp_accordion-content"><a href="/en/players">Players</a></div></nav>'
+        + _day_html(
+            "Sun, 11 January, 2026Day (9)",
+            _match_html("Final", ("Sinner", "s0ag"), ("Alcaraz", "a0e2"), ["6", "6"], ["4", "4"]),
+        )
+        + '<div class="cookie-banner">Accept</div></body></html>'
+    )
+
+    matches = await _parse(html)
+
+    assert len(matches) == 1
+    assert matches[0].match_date == "2026-01-11"
+    assert matches[0].score_raw == "6-4 6-4"
+
+
+async def test_retirement_detected_from_cta_with_complete_score():
+    html = "<html><body>" + _match_html(
+        "Round of 32", ("Rune", "r0dg"), ("Fritz", "fb98"), ["6", "6"], ["4", "3"], cta="Ret."
+    ) + "</body></html>"
+
+    matches = await _parse(html)
+
+    assert matches[0].status == "retired"
+    assert matches[0].score_raw == "6-4 6-3"
+
+
+def _day_header(header_text: str):
+    return BeautifulSoup(_day_html(header_text), "lxml").find(class_="tournament-day")
+
+
+def test_day_header_date_falls_back_to_tournament_year():
+    scraper = ATPScraper()
+    header = _day_header("Mon, 5 January Day (2)")
+    assert scraper._extract_date_from_day_header(header, 2026) == "2026-01-05"
+
+    header = _day_header("Sat, 31 February, 2026")
+    assert scraper._extract_date_from_day_header(header, 2026) is None
+
+    header = _day_header("Qualifying 2 Round")
+    assert scraper._extract_date_from_day_header(header, 2026) is None
+
+
+def _draw_player_html(name: str, slug_id: str, seed: str, games: list[str], winner: bool) -> str:
+    return (
+        '<div class="stats-item"><div class="player-info">'
+        f'<div class="name"><a href="/en/players/{name.lower()}/{slug_id}/overview">{name}</a>'
+        f"<span>{seed}</span></div>"
+        + ('<div class="winner"></div>' if winner else "")
+        + '</div><div class="scores">'
+        + "".join(f'<div class="score-item"><span>{g}</span><span></span></div>' for g in games)
+        + "</div></div>"
+    )
+
+
+def test_draw_page_parses_rounds_inside_page_chrome():
+    html = (
+        "<html><head><script>var draw = 1;</script></head><body><nav>Draws</nav>"
+        '<div class="draw"><div class="draw-header">Final</div><div class="draw-content">'
+        '<div class="draw-item"><div class="draw-stats">'
+        + _draw_player_html("Sinner", "s0ag", "(1)", ["6", "6"], winner=True)
+        + _draw_player_html("Alcaraz", "a0e2", "(2)", ["4", "3"], winner=False)
+        + "</div></div></div></div><footer>ATP</footer></body></html>"
+    )
+
+    entries = ATPScraper()._parse_draw_page(html, dict(TOURNAMENT_INFO))
+
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry.round == "F"
+    assert (entry.player_a_external_id, entry.player_a_seed) == ("S0AG", 1)
+    assert (entry.player_b_external_id, entry.player_b_seed) == ("A0E2", 2)
+    assert entry.score_raw == "6-4 6-3"
+    assert entry.winner_name == "Sinner"
+
+
+def test_build_draw_score_merges_tiebreaks_and_pads_missing_sets():
+    scraper = ATPScraper()
+    score = scraper._build_draw_score(
+        [("6", ""), ("7", ""), ("6", "")],
+        [("3", ""), ("6", "4")],
+    )
+    assert score == "6-3 7-6(4) 6-0"
+
+
+async def test_results_scrape_loads_overview_and_results_concurrently():
+    scraper = ATPScraper()
+    started = []
+
+    async def fake_info(tournament_id, year, tour_type, tournament_number):
+        started.append("info")
+        await asyncio.sleep(0.01)
+        assert "results" in started
+        return dict(TOURNAMENT_INFO)
+
+    async def fake_results(results_url):
+        started.append("results")
+        await asyncio.sleep(0.01)
+        assert "info" in started
+        return "<html><body>" + _match_html(
+            "Final", ("Sinner", "s0ag"), ("Alcaraz", "a0e2"), ["6", "6"], ["4", "4"]
+        ) + "</body></html>"
+
+    scraper._load_tournament_info = fake_info
+    scraper._fetch_results_html = fake_results
+
+    results = scraper.scrape_tournament_results("brisbane", 2026, tournament_number="339")
+    matches = [m async for m in results]
+
+    assert len(matches) == 1
+    assert matches[0].external_id == "2026_brisbane_F_A0E2_S0AG"
+
+
+async def test_tournament_lists_fetch_years_concurrently_with_cap():
+    scraper = ATPScraper()
+    in_flight = 0
+    peak = 0
+
+    async def fake_list(year, tour_type="main"):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [{"id": f"event-{year}", "year": year}]
+
+    scraper.get_tournament_list = fake_list
+
+    lists = await scraper.get_tournament_lists([2022, 2023, 2024, 2025], concurrency=2)
+
+    assert list(lists) == [2022, 2023, 2024, 2025]
+    assert lists[2024] == [{"id": "event-2024", "year": 2024}]
+    assert peak == 2
+
+
+async def test_tournament_number_found_in_raw_archive_html():
+    scraper = ATPScraper()
+    html = (
+        '<ul class="events">'
+        '<li><a href="/en/scores/archive/brisbane/339/2026/results">Brisbane</a></li>'
+        '<li><a href="/en/scores/archive/adelaide/8998/2026/results">Adelaide</a></li>'
+        "</ul>"
+    )
+
+    async def fake_fetch(page, url, **kwargs):
+        return html
+
+    scraper.fetch_html = fake_fetch
+
+    assert await scraper._get_tournament_number(None, "adelaide", 2026) == "8998"
+    assert await scraper._get_tournament_number(None, "doha", 2026) is None
+    assert scraper._tournament_number_cache[("doha", 2026, "main")] is None
+
+
+def _schedule_html(
+    court: str | None,
+    time_text: str,
+    player: tuple[str, str],
+    opponent: tuple[str, str],
+) -> str:
+    def team(cls: str, name: str, slug_id: str) -> str:
+        return (
+            f'<div class="{cls}"><div class="names"><div class="name">'
+            f'<a href="/en/players/{name.lower()}/{slug_id}/overview">{name}</a>'
+            "</div></div></div>"
+        )
+
+    location = f"<span><strong>{court}</strong></span>" if court else ""
+    return (
+        '<div class="schedule" data-matchdate="2026-01-08">'
+        '<div class="schedule-header"><div class="schedule-location-timestamp">'
+        f'{location}<span class="matchtime">{time_text}</span></div></div>'
+        '<div class="schedule-content"><div class="schedule-type">Quarter-Finals</div>'
+        '<div class="schedule-players">'
+        f'{team("player", *player)}{team("opponent", *opponent)}'
+        "</div>"
+        "</div></div>"
+    )
+
+
+async def test_fixtures_parsed_from_schedule_inside_page_chrome():
+    html = (
+        "<html><head><script>var schedule = 1;</script></head><body>"
+        '<nav><div class="match-card-nav">Scores</div></nav>'
+        '<div class="content-group">'
+        + _schedule_html("Pat Rafter Arena", "11:00 AM", ("Sinner", "S0AG"), ("Alcaraz", "A0E2"))
+        + _schedule_html(None, "Followed By", ("Rune", "R0DG"), ("Fritz", "FB98"))
+        + "</div><footer>ATP</footer></body></html>"
+    )
+
+    class FakePage:
+        async def content(self):
+            return html
+
+    @asynccontextmanager
+    async def fake_acquire_page():
+        yield FakePage()
+
+    async def no_op(*args, **kwargs):
+        pass
+
+    scraper = ATPScraper()
+    scraper.acquire_page = fake_acquire_page
+    scraper.navigate = no_op
+    scraper.random_delay = no_op
+
+    fixtures = [f async for f in scraper.scrape_fixtures("brisbane", tournament_number="339")]
+
+    assert [(f.player_a_name, f.player_b_name) for f in fixtures] == [
+        ("Sinner", "Alcaraz"),
+        ("Rune", "Fritz"),
+    ]
+    assert [f.round for f in fixtures] == ["QF", "QF"]
+    # Second block inherits the court and follows the first match by two hours
+    assert [f.court for f in fixtures] == ["Pat Rafter Arena", "Pat Rafter Arena"]
+    assert [f.scheduled_time for f in fixtures] == ["11:00", "13:00"]
+
+
+def test_score_items_keep_parenthesised_tiebreaks():
+    soup = BeautifulSoup(
+        '<div class="score-item"><span>7</span><span>(5)</span></div>'
+        '<div class="score-item"><span>6</span></div>'
+        '<div class="score-item"><span>6</span></div>'
+        '<div class="score-item"><span>3</span></div>',
+        "lxml",
+    )
+
+    score, last_set = ATPScraper()._parse_score_items(soup.find_all(class_="score-item"))
+
+    assert score == "7-6(5) 6-3"
+    assert last_set == (6, 3)
+
+
+async def test_batch_scrape_runs_tournaments_concurrently_in_one_session(monkeypatch):
+    sessions = []
+    in_flight = 0
+    peak = 0
+
+    async def fake_enter(self):
+        sessions.append(self)
+        return self
+
+    async def fake_exit(self, *exc):
+        pass
+
+    async def fake_results(self, tournament_id, year, tour_type="main"):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        yield f"{year}_{tournament_id}"
+
+    monkeypatch.setattr(ATPScraper, "__aenter__", fake_enter)
+    monkeypatch.setattr(ATPScraper, "__aexit__", fake_exit)
+    monkeypatch.setattr(ATPScraper, "scrape_tournament_results", fake_results)
+
+    matches = await scrape_atp_tournaments(
+        [("brisbane", 2026), ("adelaide", 2026), ("auckland", 2026)], max_concurrency=2
+    )
+
+    assert matches == ["2026_brisbane", "2026_adelaide", "2026_auckland"]
+    assert len(sessions) == 1
+    assert peak == 2
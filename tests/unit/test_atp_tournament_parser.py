@@ -0,0 +1,71 @@
+from teelo.scrape.atp_tournament_parser import (
+    _detect_level_from_banner,
+    parse_atp_date_range,
+    parse_tournament_html,
+)
+
+
+def _entry_html(slug: str, number: str, name: str, dates: str, banner: str) -> str:
+    return (
+        "<li><div class=\"tournament-info\">"
+        '<div class="event-badge_container">'
+        f'<img class="events_banner" src="/assets/categorystamps_{banner}.png"/></div>'
+        f'<a class="tournament__profile" href="/en/tournaments/{slug}/{number}/overview">'
+        f'<span class="name">{name}</span>'
+        f'<span class="venue">{name}, Australia | </span>'
+        f'<span class="Date">{dates}</span></a></div>'
+        '<div class="non-live-cta">'
+        f'<a class="results" href="/en/scores/archive/{slug}/{number}/2024/results">Results</a>'
+        "</div>"
+        "</li>"
+    )
+
+
+def test_archive_html_parsed_from_tournament_list_only():
+    html = (
+        "<html><head><script>var events = [];</script></head><body>"
+        '<nav><ul class="events">'
+        '<li><a class="results" href="/en/scores/archive/menu/1/2024/results">Menu</a></li>'
+        "</ul></nav>"
+        '<div class="tournament-list"><ul class="events">'
+        + _entry_html(
+            "brisbane", "339", "Brisbane", "31 December, 2023 - 7 January, 2024", "250"
+        )
+        + _entry_html(
+            "australian-open", "580", "Australian Open", "14 - 28 January, 2024", "grandslam"
+        )
+        + "</ul></div><footer>ATP</footer></body></html>"
+    )
+
+    tournaments = parse_tournament_html(html, 2024)
+
+    assert [(t["id"], t["number"], t["level"]) for t in tournaments] == [
+        ("brisbane", "339", "ATP 250"),
+        ("australian-open", "580", "Grand Slam"),
+    ]
+    assert tournaments[0]["location"] == "Brisbane, Australia"
+    assert tournaments[0]["start_date"] == "2023-12-31"
+    assert tournaments[0]["end_date"] == "2024-01-07"
+
+
+def test_date_range_formats():
+    cases = [
+        ("1 - 7 January, 2024", 2024, ("2024-01-01", "2024-01-07")),
+        ("29 January - 4 February, 2024", 2024, ("2024-01-29", "2024-02-04")),
+        ("30 - 5 February, 2024", 2024, ("2024-01-30", "2024-02-05")),
+        ("28 December - 3 January, 2021", 2021, ("2020-12-28", "2021-01-03")),
+        ("29 February - 6 March, 2024", 2024, ("2024-02-29", "2024-03-06")),
+        ("TBC", 2024, (None, None)),
+        ("1 - 7 Janvier, 2024", 2024, (None, None)),
+    ]
+    for date_text, year, expected in cases:
+        assert parse_atp_date_range(date_text, year) == expected, date_text
+
+
+def test_level_detected_from_banner_filename():
+    cdn_banner = "https://cdn.example/w_500/categorystamps_250.png"
+    assert _detect_level_from_banner(cdn_banner) == "ATP 250"
+    assert _detect_level_from_banner("/assets/CategoryStamps_GrandSlam.png") == "Grand Slam"
+    assert _detect_level_from_banner("/assets/categorystamps_1000.png") == "Masters 1000"
+    assert _detect_level_from_banner("/assets/categorystamps_nextgen.png") == "ATP Finals"
+    assert _detect_level_from_banner("/assets/categorystamps_unknown.png") is None
@@ -0,0 +1,88 @@
+"""Unit tests for populate_queue in scripts/backfill_historical.py."""
+
+import ast
+from datetime import datetime, timedelta
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "scripts" / "backfill_historical.py"
+
+
+class _FakeScraper:
+    def __init__(self, tour_key: str, events: list, launch_fails: bool):
+        self.tour_key = tour_key
+        self.events = events
+        self.launch_fails = launch_fails
+
+    async def __aenter__(self):
+        if self.launch_fails:
+            raise RuntimeError("chromium did not start")
+        self.events.append(("open", self.tour_key))
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.events.append(("close", self.tour_key))
+
+
+def _load_populate_queue(events: list, failing_launches: set, failing_years: set):
+    """Load populate_queue from source with fake scrapers and year discovery."""
+    source = SCRIPT_PATH.read_text()
+    module_ast = ast.parse(source)
+    selected_nodes = [
+        node
+        for node in module_ast.body
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == "populate_queue"
+    ]
+    compiled = compile(ast.Module(body=selected_nodes, type_ignores=[]), str(SCRIPT_PATH), "exec")
+
+    def get_scraper_class(tour_key):
+        return lambda headless: _FakeScraper(tour_key, events, tour_key in failing_launches)
+
+    async def queue_tour_year(session, scraper, tour_key, year, future_cutoff, metrics):
+        events.append(("year", tour_key, year))
+        if (tour_key, year) in failing_years:
+            raise RuntimeError("page crashed")
+        return 1
+
+    namespace = {
+        "TOUR_TYPES": {"ATP": {"description": "ATP"}, "WTA": {"description": "WTA"}},
+        "ScrapeQueueManager": object,
+        "datetime": datetime,
+        "timedelta": timedelta,
+        "_get_scraper_class": get_scraper_class,
+        "_queue_tour_year": queue_tour_year,
+    }
+    exec(compiled, namespace)
+    return namespace["populate_queue"]
+
+
+async def test_failed_year_reopens_the_scraper_for_later_years(capsys):
+    events: list = []
+    populate_queue = _load_populate_queue(events, set(), {("ATP", 2023)})
+
+    added, _ = await populate_queue(None, None, [2024, 2023, 2022], ["ATP"])
+
+    assert added == 2
+    assert events == [
+        ("open", "ATP"),
+        ("year", "ATP", 2024),
+        ("year", "ATP", 2023),
+        ("close", "ATP"),
+        ("open", "ATP"),
+        ("year", "ATP", 2022),
+        ("close", "ATP"),
+    ]
+    assert "Error loading 2023 tournaments" in capsys.readouterr().out
+
+
+async def test_browser_launch_failure_moves_on_to_the_next_tour(capsys):
+    events: list = []
+    populate_queue = _load_populate_queue(events, {"ATP"}, set())
+
+    added, _ = await populate_queue(None, None, [2024, 2023], ["ATP", "WTA"])
+
+    assert added == 2
+    assert [event for event in events if event[0] == "year"] == [
+        ("year", "WTA", 2024),
+        ("year", "WTA", 2023),
+    ]
+    assert "Error running the ATP scraper" in capsys.readouterr().out
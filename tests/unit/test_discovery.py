@@ -0,0 +1,84 @@
+"""Unit tests for tournament task discovery helpers."""
+
+import asyncio
+from datetime import date
+
+from teelo.scrape import discovery
+from teelo.scrape.atp import ATPScraper
+from teelo.scrape.itf import ITFScraper
+
+
+async def test_discover_all_runs_tours_together_and_keeps_order(monkeypatch):
+    open_now = 0
+    peak = 0
+
+    async def fake_discover(tour_key, year, task_type, *, window=None, headless=None):
+        nonlocal open_now, peak
+        open_now += 1
+        peak = max(peak, open_now)
+        # Later tours finish first
+        await asyncio.sleep(0.03 if tour_key == "ATP" else 0.01)
+        open_now -= 1
+        return [f"{tour_key}-{year}-{task_type}-{n}" for n in range(2)]
+
+    monkeypatch.setattr(discovery, "discover_tournament_tasks", fake_discover)
+
+    tasks = await discovery.discover_all_tournament_tasks(
+        ["ATP", "WTA", "ITF_MEN"], 2025, "current_tournament"
+    )
+
+    # All scrapers were open at once, so they shared one browser
+    assert peak == 3
+    assert tasks == [
+        "ATP-2025-current_tournament-0",
+        "ATP-2025-current_tournament-1",
+        "WTA-2025-current_tournament-0",
+        "WTA-2025-current_tournament-1",
+        "ITF_MEN-2025-current_tournament-0",
+        "ITF_MEN-2025-current_tournament-1",
+    ]
+
+
+def test_parse_date_accepts_iso_dates_only():
+    assert discovery._parse_date("2025-01-06") == date(2025, 1, 6)
+    assert discovery._parse_date("2025-02-30") is None
+    assert discovery._parse_date("06/01/2025") is None
+    assert discovery._parse_date("") is None
+    assert discovery._parse_date(None) is None
+
+
+def test_tournament_window_overlap():
+    window = (date(2025, 3, 10), date(2025, 3, 16))
+
+    def in_window(start, end=None):
+        return discovery._is_tournament_in_window(
+            {"start_date": start, "end_date": end}, *window
+        )
+
+    assert in_window("2025-03-03", "2025-03-10")
+    assert not in_window("2025-03-03", "2025-03-09")
+    assert in_window("2025-03-16", "2025-03-22")
+    assert not in_window("2025-03-17", "2025-03-23")
+    # Start date only: counted as running for a week
+    assert in_window("2025-03-03")
+    assert not in_window("2025-03-02")
+    assert not in_window(None, "2025-03-12")
+
+
+def test_scraper_dispatch_per_tour():
+    assert discovery._get_scraper_class("CHALLENGER") is ATPScraper
+    assert discovery._get_scraper_class("ITF_WOMEN") is ITFScraper
+
+
+async def test_tournament_list_called_with_tour_arguments():
+    calls = []
+
+    class _Scraper:
+        async def get_tournament_list(self, year, **kwargs):
+            calls.append((year, kwargs))
+            return []
+
+    await discovery._fetch_tournaments_with_scraper(_Scraper(), "WTA_125", 2025)
+    await discovery._fetch_tournaments_with_scraper(_Scraper(), "ITF_MEN", 2025)
+
+    assert calls == [(2025, {"tour_type": "125"}), (2025, {"gender": "men"})]
@@ -0,0 +1,466 @@
+"""Unit tests for ITF draw-sheet parsing and carousel loading."""
+
+import asyncio
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from teelo.config import settings
+from teelo.scrape import itf
+from teelo.scrape.itf import (
+    ITFScraper,
+    _draws_final_after,
+    _normalize_round,
+    _parse_oop_date,
+)
+
+TOURNAMENT_INFO = {
+    "id": "m-itf-gbr-2024-001",
+    "name": "M15 Sheffield",
+    "year": 2024,
+    "level": "ITF $15K",
+    "surface": "Hard",
+    "gender": "men",
+}
+
+
+def _team(team: int, first: str, last: str, itf_id: str, scores: list[str], winner: bool) -> str:
+    winner_class = " is-winner" if winner else ""
+    score_spans = "".join(f'<span class="drawsheet-widget__score">{s}</span>' for s in scores)
+    return f"""
+    <div class="drawsheet-widget__team-info drawsheet-widget__team-info--team-{team}{winner_class}">
+      <div class="player-wrapper">
+        <a href="/en/players/{first.lower()}-{last.lower()}/{itf_id}/gbr/mt/s/">
+          <span class="drawsheet-widget__first-name">{first}</span>
+          <span class="drawsheet-widget__last-name">{last}</span>
+        </a>
+      </div>
+      {score_spans}
+    </div>
+    """
+
+
+def _widget(a: tuple, b: tuple) -> str:
+    return f"""
+    <div class="drawsheet-widget">
+      {_team(1, *a, ["6", "6"], True)}
+      {_team(2, *b, ["3", "4"], False)}
+    </div>
+    """
+
+
+def _round(title: str, *widgets: str) -> str:
+    return f"""
+    <div class="drawsheet-round-container">
+      <h3 class="drawsheet-round-container__round-title">{title}</h3>
+      {''.join(widgets)}
+    </div>
+    """
+
+
+SF = _round("Semi-finals", _widget(("Jack", "Draper", "1"), ("Dan", "Evans", "2")))
+FINAL = _round("Final", _widget(("Jack", "Draper", "1"), ("Cam", "Norrie", "3")))
+
+
+async def test_results_merge_overlapping_carousel_views(monkeypatch):
+    scraper = ITFScraper()
+    in_flight = 0
+    peak = 0
+
+    async def load_view(draws_url, view, final_after=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        # View 1 repeats the semi-final already shown in view 0
+        return [f"<html>{SF}</html>", f"<html>{SF}{FINAL}</html>", None][view]
+
+    monkeypatch.setattr(scraper, "_load_draw_view", load_view)
+
+    matches = [
+        m async for m in scraper.scrape_tournament_results(
+            "https://www.itftennis.com/en/tournament/m15-sheffield/gbr/2024/m-itf-gbr-2024-001/",
+            TOURNAMENT_INFO,
+        )
+    ]
+
+    # All views were loaded at the same time
+    assert peak == 3
+    assert [(m.round, m.player_b_name) for m in matches] == [
+        ("SF", "Dan Evans"),
+        ("F", "Cam Norrie"),
+    ]
+    assert [m.match_number for m in matches] == [1, 2]
+    assert matches[0].winner_name == "Jack Draper"
+    assert matches[0].score_raw == "6-3 6-4"
+
+
+async def test_draw_views_stop_at_first_unreachable_view(monkeypatch):
+    scraper = ITFScraper()
+
+    async def load_view(draws_url, view, final_after=None):
+        return [f"<html>{SF}</html>", None, f"<html>{FINAL}</html>"][view]
+
+    monkeypatch.setattr(scraper, "_load_draw_view", load_view)
+
+    entries = await scraper.scrape_tournament_draw(
+        "https://www.itftennis.com/en/tournament/m15-sheffield/gbr/2024/m-itf-gbr-2024-001/",
+        TOURNAMENT_INFO,
+    )
+
+    assert {entry.round for entry in entries} == {"SF"}
+
+
+class _FakeDrawPage:
+    def __init__(self, html: str):
+        self.html = html
+        self.visits = 0
+
+    def is_closed(self):
+        return False
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.visits += 1
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        return None
+
+    async def evaluate(self, script):
+        assert script == itf._DRAWSHEET_HTML_SCRIPT
+        return self.html
+
+
+class _FakeButton:
+    def __init__(self, page):
+        self.page = page
+
+    async def is_visible(self):
+        return True
+
+    async def click(self):
+        self.page.view += 1
+
+
+class _FakeCarouselPage(_FakeDrawPage):
+    """Draws page whose next button shifts the carousel one round."""
+
+    def __init__(self, views: list[str]):
+        super().__init__(views[0])
+        self.views = views
+        self.view = 0
+        self.waits = []
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        return _FakeButton(self) if "chevron-next" in selector else None
+
+    async def evaluate(self, script):
+        if script == itf._DRAWSHEET_HTML_SCRIPT:
+            return self.views[self.view]
+        return f"titles-{self.view}"
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        # The round titles must have moved on from the pre-click snapshot
+        self.waits.append(arg)
+        assert arg != f"titles-{self.view}"
+
+    async def wait_for_load_state(self, state, timeout=None):
+        raise AssertionError("networkidle wait")
+
+
+class _FakeContext:
+    def __init__(self, page):
+        self.page = page
+
+    async def new_page(self):
+        return self.page
+
+
+async def test_draw_view_is_served_from_html_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "scrape_cache_dir", str(tmp_path))
+    scraper = ITFScraper()
+    scraper._accept_cookies = lambda page: asyncio.sleep(0)
+    page = _FakeDrawPage(SF)
+    scraper._context = _FakeContext(page)
+    url = "https://www.itftennis.com/en/tournament/m15-sheffield/gbr/2024/m-itf-gbr-2024-001/draws-and-results/"
+
+    first = await scraper._load_draw_view(url, 0)
+    second = await scraper._load_draw_view(url, 0)
+
+    assert first == second == SF
+    assert page.visits == 1
+
+
+def _calendar_row(slug: str, tourney_id: str, name: str, dates: str) -> str:
+    return f"""
+    <tr>
+      <td><a href="/en/tournament/{slug}/tun/2024/{tourney_id}/">
+        <span class="short">{name}</span><span class="long">{name} Open</span></a></td>
+      <td class="date"><span class="date">{dates}</span></td>
+      <td><a href="/en/tournament/{slug}/tun/2024/{tourney_id}/draws-and-results/">Draws</a></td>
+    </tr>
+    """
+
+
+async def test_calendar_rows_give_each_link_its_start_date():
+    scraper = ITFScraper()
+    html = "<table>{}{}{}</table>".format(
+        _calendar_row(
+            "m15-monastir", "m-itf-tun-2024-001", "M15 Monastir", "08 Jan to 14 Jan 2024"
+        ),
+        # A December start with a January finish belongs to the previous year
+        _calendar_row("m25-sharm", "m-itf-egy-2024-002", "M25 Sharm", "30 Dec to 05 Jan 2024"),
+        _calendar_row("m15-antalya", "m-itf-tur-2024-003", "M15 Antalya", "TBC"),
+    )
+    scraper.read_cached_html = lambda key, ttl=None, final_after=None: html
+
+    tournaments = await scraper.get_tournament_list(2024, gender="men")
+
+    assert [(t["id"], t["level"], t["start_date"]) for t in tournaments] == [
+        ("m-itf-tun-2024-001", "ITF $15K", "2024-01-08"),
+        ("m-itf-egy-2024-002", "ITF $25K", "2023-12-30"),
+        ("m-itf-tur-2024-003", "ITF $15K", None),
+    ]
+    assert tournaments[0]["name"] == "M15 Monastir"
+
+
+async def test_calendar_keeps_links_outside_rows_and_counts_nested_rows_once():
+    scraper = ITFScraper()
+    html = """
+    <table class="legend"><tr><td>Surface key</td></tr></table>
+    <div class="featured">
+      <a href="/en/tournament/m25-sharm/egy/2024/m-itf-egy-2024-002/">
+        <span class="short">M25 Sharm</span></a>
+    </div>
+    <table><tr><td>
+      <table>{}</table>
+    </td></tr></table>
+    """.format(
+        _calendar_row("m15-monastir", "m-itf-tun-2024-001", "M15 Monastir", "08 Jan to 14 Jan 2024")
+    )
+    scraper.read_cached_html = lambda key, ttl=None, final_after=None: html
+
+    tournaments = await scraper.get_tournament_list(2024, gender="men")
+
+    assert [(t["id"], t["start_date"]) for t in tournaments] == [
+        ("m-itf-egy-2024-002", None),
+        ("m-itf-tun-2024-001", "2024-01-08"),
+    ]
+
+
+def test_order_of_play_date_header():
+    assert _parse_oop_date("Monday 15 January 2024") == "2024-01-15"
+    assert _parse_oop_date("Court 1") is None
+
+
+async def test_carousel_click_waits_for_round_titles_to_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "scrape_cache_dir", str(tmp_path))
+    scraper = ITFScraper()
+    scraper._accept_cookies = lambda page: asyncio.sleep(0)
+    page = _FakeCarouselPage([SF, SF + FINAL])
+    scraper._context = _FakeContext(page)
+
+    html = await scraper._load_draw_view("https://www.itftennis.com/x/draws-and-results/", 1)
+
+    assert html == SF + FINAL
+    assert page.waits == ["titles-0"]
+
+
+class _FakeStuckCarouselPage(_FakeCarouselPage):
+    """Draws page whose next button doesn't move the carousel in time."""
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        self.view -= 1
+        raise PlaywrightTimeout("round titles unchanged")
+
+
+async def test_carousel_view_is_not_cached_when_click_times_out(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "scrape_cache_dir", str(tmp_path))
+    scraper = ITFScraper()
+    scraper._accept_cookies = lambda page: asyncio.sleep(0)
+    scraper._context = _FakeContext(_FakeStuckCarouselPage([SF, SF + FINAL]))
+
+    html = await scraper._load_draw_view("https://www.itftennis.com/x/draws-and-results/", 1)
+
+    assert html == SF
+    assert not list(tmp_path.rglob("*.html"))
+
+
+class _FakeMoreButton:
+    def __init__(self, page):
+        self.page = page
+
+    async def is_visible(self):
+        return self.page.pages_left > 0
+
+    async def click(self, no_wait_after=False):
+        assert no_wait_after
+        self.page.pages_left -= 1
+        self.page.in_flight += 1
+        self.page.peak_in_flight = max(self.page.peak_in_flight, self.page.in_flight)
+        asyncio.get_running_loop().call_later(0.02, self.page.load_page)
+
+
+class _FakeCalendarPage:
+    """Calendar whose More Matches button appends 10 links per click, later."""
+
+    def __init__(self, pages: int):
+        self.pages_left = pages
+        self.links = 10
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def load_page(self):
+        self.in_flight -= 1
+        self.links += 10
+
+    async def wait_for_selector(self, selector, timeout=None):
+        return _FakeMoreButton(self)
+
+    async def query_selector(self, selector):
+        return _FakeMoreButton(self)
+
+    async def evaluate(self, script):
+        return self.links
+
+
+async def test_more_matches_clicks_are_batched(monkeypatch):
+    monkeypatch.setattr(itf, "_SETTLE_INTERVAL", 0.05)
+    page = _FakeCalendarPage(pages=7)
+
+    await ITFScraper()._load_all_tournaments(page)
+
+    assert page.links == 80
+    assert page.in_flight == 0
+    # Clicks within a batch overlapped instead of waiting on each other
+    assert page.peak_in_flight == 5
+
+
+async def test_scrape_everything_shares_one_draw_load(monkeypatch):
+    scraper = ITFScraper()
+    loads = []
+
+    async def load_view(draws_url, view, final_after=None):
+        loads.append(view)
+        await asyncio.sleep(0.01)
+        return [f"<html>{SF}</html>", f"<html>{SF}{FINAL}</html>", None][view]
+
+    async def scrape_fixtures(tournament_url, gender=None):
+        raise RuntimeError("order of play unavailable")
+        yield
+
+    monkeypatch.setattr(scraper, "_load_draw_view", load_view)
+    monkeypatch.setattr(scraper, "scrape_fixtures", scrape_fixtures)
+
+    matches, entries, fixtures = await scraper.scrape_everything(
+        "https://www.itftennis.com/en/tournament/m15-sheffield/gbr/2024/m-itf-gbr-2024-001/",
+        TOURNAMENT_INFO,
+        "men",
+    )
+
+    # Results and draw parsed the same three views, loaded once
+    assert sorted(loads) == [0, 1, 2]
+    assert [m.round for m in matches] == ["SF", "F"]
+    assert {e.round for e in entries} == {"SF", "F"}
+    # A failed part is handed back rather than sinking the others
+    assert isinstance(fixtures, RuntimeError)
+    assert scraper._draw_view_loads == {}
+
+
+async def test_results_stream_before_later_views_load(monkeypatch):
+    scraper = ITFScraper()
+    final_view = asyncio.Event()
+
+    async def load_view(draws_url, view, final_after=None):
+        if view == 1:
+            await final_view.wait()
+        return [f"<html>{SF}</html>", f"<html>{SF}{FINAL}</html>", None][view]
+
+    monkeypatch.setattr(scraper, "_load_draw_view", load_view)
+
+    results = scraper.scrape_tournament_results(
+        "https://www.itftennis.com/en/tournament/m15-sheffield/gbr/2024/m-itf-gbr-2024-001/",
+        TOURNAMENT_INFO,
+    )
+    # The semi-final arrives while the view with the final is still loading
+    first = await asyncio.wait_for(anext(results), timeout=1)
+    assert first.round == "SF"
+
+    final_view.set()
+    assert [m.round async for m in results] == ["F"]
+
+
+def test_round_names_normalize_across_spellings():
+    assert _normalize_round("Quarter-finals") == "QF"
+    assert _normalize_round(" Quarter Finals ") == "QF"
+    assert _normalize_round("SEMI-FINALS") == "SF"
+    assert _normalize_round("1st Round") == "R32"
+    assert _normalize_round("Round Robin") == "ROUND ROBIN"
+
+
+class _FakeCookieContext:
+    def __init__(self, cookies):
+        self._cookies = cookies
+
+    async def cookies(self, urls=None):
+        return self._cookies
+
+
+class _FakeBannerPage:
+    def __init__(self, cookies):
+        self.context = _FakeCookieContext(cookies)
+        self.banner_waits = 0
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        self.banner_waits += 1
+        return None
+
+
+async def test_cookie_banner_skipped_once_consent_is_stored():
+    scraper = ITFScraper()
+
+    consented = _FakeBannerPage([{"name": "OptanonAlertBoxClosed", "value": "2024-01-01"}])
+    await scraper._accept_cookies(consented)
+    assert consented.banner_waits == 0
+
+    fresh = _FakeBannerPage([{"name": "OptanonConsent", "value": "x"}])
+    await scraper._accept_cookies(fresh)
+    assert fresh.banner_waits == 1
+
+
+def test_team_block_parts_are_read_in_one_pass():
+    html = """
+    <div class="drawsheet-widget__team-info drawsheet-widget__team-info--team-1">
+      <span class="drawsheet-widget__seeding">[3]</span>
+      <div class="drawsheet-widget__nationality">
+        <span class="itf-flags itf-flags--GBR"></span>
+      </div>
+      <div class="player-wrapper">
+        <a href="/en/players/jack-draper/800123456/gbr/mt/s/">
+          <span class="drawsheet-widget__first-name">Jack</span>
+          <span class="drawsheet-widget__last-name">Draper</span>
+        </a>
+      </div>
+      <span class="drawsheet-widget__score">6</span>
+      <span class="drawsheet-widget__score">76</span>
+    </div>
+    """
+    team = BeautifulSoup(html, "lxml").select_one(".drawsheet-widget__team-info")
+
+    player, scores = itf._extract_team(team)
+
+    assert player == {"name": "Jack Draper", "itf_id": "800123456", "nationality": "GBR", "seed": 3}
+    assert scores == ["6", "76"]
+
+
+def test_draws_final_after_falls_back_past_unparseable_dates():
+    assert _draws_final_after({**TOURNAMENT_INFO, "end_date": "2024-01-14"}) == datetime(
+        2024, 1, 15
+    )
+    assert _draws_final_after(
+        {**TOURNAMENT_INFO, "end_date": "14/01/2024", "start_date": "2024-01-08"}
+    ) == datetime(2024, 1, 16)
+    assert _draws_final_after(
+        {**TOURNAMENT_INFO, "end_date": "TBC", "start_date": 20240108}
+    ) == datetime(2025, 1, 1)
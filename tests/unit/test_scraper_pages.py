@@ -0,0 +1,615 @@
+"""Unit tests for BaseScraper page handling: checkout, blocking, caching, rate limits."""
+
+import asyncio
+import os
+import signal
+import sys
+import types
+from datetime import datetime
+
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from teelo.config import settings
+from teelo.scrape.atp import ATPScraper
+from teelo.scrape.base import (
+    BaseScraper,
+    RateLimitedError,
+    VirtualDisplay,
+    _block_unneeded_requests,
+    _pacing_for,
+    run_scraper,
+)
+from teelo.scrape.itf import ITFScraper, _season_end
+
+
+class _FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = _FakePage()
+        self.pages.append(page)
+        return page
+
+
+def _scraper(max_pages: int) -> ATPScraper:
+    scraper = ATPScraper()
+    scraper._context = _FakeContext()
+    scraper._page_slots = asyncio.BoundedSemaphore(max_pages)
+    return scraper
+
+
+async def test_acquire_page_caps_open_pages():
+    scraper = _scraper(max_pages=2)
+    open_now = 0
+    peak = 0
+
+    async def job():
+        nonlocal open_now, peak
+        async with scraper.acquire_page():
+            open_now += 1
+            peak = max(peak, open_now)
+            await asyncio.sleep(0.01)
+            open_now -= 1
+
+    await asyncio.gather(*[job() for _ in range(5)])
+
+    assert peak == 2
+    # Finished pages are reused rather than reopened for each job
+    assert len(scraper._context.pages) == 2
+    assert not any(page.closed for page in scraper._context.pages)
+    assert len(scraper._idle_pages) == 2
+
+
+async def test_pages_in_use_are_capped_across_scrapers(monkeypatch):
+    monkeypatch.setattr(settings, "scrape_max_total_pages", 3)
+    monkeypatch.setattr(BaseScraper, "_shared_page_slots_loop", None)
+    scrapers = [_scraper(max_pages=2), _scraper(max_pages=2)]
+    in_use = 0
+    peak = 0
+
+    async def job(scraper):
+        nonlocal in_use, peak
+        async with scraper.acquire_page():
+            in_use += 1
+            peak = max(peak, in_use)
+            await asyncio.sleep(0.01)
+            in_use -= 1
+
+    await asyncio.gather(*(job(scraper) for scraper in scrapers for _ in range(3)))
+
+    assert peak == 3
+
+
+async def test_acquire_page_closes_page_on_error():
+    scraper = _scraper(max_pages=1)
+
+    try:
+        async with scraper.acquire_page():
+            raise RuntimeError("navigation failed")
+    except RuntimeError:
+        pass
+
+    assert scraper._context.pages[0].closed
+    # Slot was released, so the next checkout does not block, and the
+    # failed page is not handed out again
+    async with scraper.acquire_page() as page:
+        assert not page.closed
+    assert len(scraper._context.pages) == 2
+
+
+class _FakeRoute:
+    def __init__(self, resource_type: str, url: str):
+        self.request = type("Request", (), {"resource_type": resource_type, "url": url})()
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+
+async def test_unneeded_requests_are_blocked():
+    cases = {
+        ("image", "https://www.atptour.com/banner.png"): "abort",
+        ("font", "https://www.atptour.com/font.woff2"): "abort",
+        ("script", "https://www.googletagmanager.com/gtm.js"): "abort",
+        ("document", "https://www.atptour.com/en/scores/results-archive"): "continue",
+        ("stylesheet", "https://www.atptour.com/site.css"): "continue",
+        ("script", "https://www.atptour.com/app.js"): "continue",
+    }
+    for (resource_type, url), expected in cases.items():
+        route = _FakeRoute(resource_type, url)
+        await _block_unneeded_requests(route)
+        assert route.outcome == expected, url
+
+
+class _FakeNavPage:
+    def __init__(self, html: str, ready: bool = True):
+        self.html = html
+        self.ready = ready
+        self.visits = 0
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.visits += 1
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        if not self.ready:
+            raise PlaywrightTimeout("not rendered")
+
+    async def content(self):
+        return self.html
+
+
+async def test_fetch_html_reuses_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "scrape_cache_dir", str(tmp_path))
+    scraper = ATPScraper()
+    page = _FakeNavPage("<html>archive</html>")
+    url = "https://www.atptour.com/en/scores/results-archive?year=2024"
+
+    first = await scraper.fetch_html(page, url, ready_selector=".tournament-list")
+    second = await scraper.fetch_html(page, url, ready_selector=".tournament-list")
+
+    assert first == second == "<html>archive</html>"
+    assert page.visits == 1
+
+    # Expired entries are fetched again
+    assert (await scraper.fetch_html(page, url, ttl=0)) == "<html>archive</html>"
+    assert page.visits == 2
+
+
+def test_cached_season_pages_are_final_only_if_saved_after_it_ended(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(settings, "scrape_cache_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "scrape_cache_ttl", 3600)
+    scraper = ITFScraper()
+    season_end = _season_end(2024)
+    before, after = "calendar?startdate=2024#before", "calendar?startdate=2024#after"
+    scraper.write_cached_html(before, "<html>mid-season</html>")
+    scraper.write_cached_html(after, "<html>final</html>")
+    mid_season = datetime(2024, 12, 20).timestamp()
+    final = datetime(2025, 1, 3).timestamp()
+    os.utime(scraper._html_cache_path(before), (mid_season, mid_season))
+    os.utime(scraper._html_cache_path(after), (final, final))
+
+    # Saved before the season ended, so the default ttl still applies
+    assert scraper.read_cached_html(before, final_after=season_end) is None
+    assert scraper.read_cached_html(after, final_after=season_end) == "<html>final</html>"
+    assert scraper.read_cached_html(after) is None
+
+
+async def test_fetch_html_does_not_cache_unrendered_pages(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "scrape_cache_dir", str(tmp_path))
+    scraper = ATPScraper()
+
+    async def no_delay():
+        pass
+
+    scraper.random_delay = no_delay
+    page = _FakeNavPage("<html>loading</html>", ready=False)
+    url = "https://www.atptour.com/en/scores/archive/x/1/2024/results"
+
+    await scraper.fetch_html(page, url, ready_selector=".match")
+    await scraper.fetch_html(page, url, ready_selector=".match")
+
+    assert page.visits == 2
+    assert not list(tmp_path.rglob("*.html"))
+
+
+class _FakeResponse:
+    def __init__(self, status: int, headers: dict | None = None):
+        self.status = status
+        self.headers = headers or {}
+
+
+class _RateLimitedPage:
+    def __init__(self, responses: list):
+        self.responses = responses
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        return self.responses.pop(0)
+
+
+async def test_navigate_retries_after_rate_limit_and_backs_off(monkeypatch):
+    monkeypatch.setattr("teelo.scrape.base._host_pacing", {})
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("teelo.scrape.base.asyncio.sleep", fake_sleep)
+    scraper = ATPScraper()
+    page = _RateLimitedPage([_FakeResponse(429, {"retry-after": "7"}), _FakeResponse(200)])
+
+    await scraper.navigate(page, "https://www.atptour.com/en/scores/results-archive")
+
+    assert not page.responses
+    # Retry waited out the Retry-After cooldown before navigating again
+    assert any(s >= 6.5 for s in sleeps)
+    # Pause was doubled from zero to the minimum step, then eased on success
+    assert _pacing_for("https://www.atptour.com/").pause == 0.5
+
+
+async def test_navigate_raises_when_still_rate_limited(monkeypatch):
+    monkeypatch.setattr("teelo.scrape.base._host_pacing", {})
+    async def fake_sleep(seconds):
+        pass
+
+    monkeypatch.setattr("teelo.scrape.base.asyncio.sleep", fake_sleep)
+    scraper = ATPScraper()
+    page = _RateLimitedPage([_FakeResponse(503) for _ in range(3)])
+
+    try:
+        await scraper.navigate(page, "https://www.atptour.com/", max_attempts=3)
+    except RateLimitedError as e:
+        assert e.status == 503
+    else:
+        raise AssertionError("expected RateLimitedError")
+    assert _pacing_for("https://www.atptour.com/").pause == 4.0
+    # Other hosts are not slowed down
+    assert _pacing_for("https://www.itftennis.com/").pause == 0.0
+
+
+async def test_fetch_html_can_extract_markup_in_browser():
+    scraper = ATPScraper()
+    page = _FakeNavPage("<html>full page</html>")
+    scripts = []
+
+    async def evaluate(script):
+        scripts.append(script)
+        return '<div class="match"></div>'
+
+    page.evaluate = evaluate
+
+    html = await scraper.fetch_html(
+        page, "https://www.atptour.com/results", ready_selector=".match", extract_script="() => ''"
+    )
+
+    assert html == '<div class="match"></div>'
+    assert scripts == ["() => ''"]
+
+
+async def test_fetch_text_matrix_reads_grid_in_one_call():
+    scraper = ATPScraper()
+    page = _FakeNavPage("")
+    calls = []
+
+    async def evaluate(script, arg):
+        calls.append(arg)
+        return [["2024-01-08", "Mon 8"], ["2024-01-09", None]]
+
+    page.evaluate = evaluate
+
+    rows = await scraper.fetch_text_matrix(
+        page, "button.day", ["@data-date", "@title"], url="https://www.wtatennis.com/x"
+    )
+
+    assert rows == [["2024-01-08", "Mon 8"], ["2024-01-09", None]]
+    assert page.visits == 1
+    assert calls == [{"rowSelector": "button.day", "columns": ["@data-date", "@title"]}]
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.closed = False
+        self.contexts = []
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **kwargs):
+        context = _FakeBrowserContext(kwargs.get("storage_state"))
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeBrowserContext(_FakeContext):
+    def __init__(self, storage_state=None):
+        super().__init__()
+        self.closed = False
+        self.storage_state_in = storage_state
+
+    async def storage_state(self, path=None):
+        with open(path, "w") as f:
+            f.write('{"cookies": [], "origins": []}')
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def add_init_script(self, script=None, **kwargs):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakePlaywright:
+    def __init__(self, launches: list):
+        self.launches = launches
+        self.chromium = self
+
+    async def start(self):
+        return self
+
+    async def launch(self, headless=None):
+        browser = _FakeBrowser()
+        self.launches.append(browser)
+        return browser
+
+    async def stop(self):
+        pass
+
+
+async def test_open_scrapers_share_one_browser(monkeypatch):
+    launches = []
+    monkeypatch.setattr("teelo.scrape.base.async_playwright", lambda: _FakePlaywright(launches))
+    monkeypatch.setattr(settings, "scrape_virtual_display", False)
+
+    async with ATPScraper(headless=True) as first:
+        async with ATPScraper(headless=True) as second:
+            assert len(launches) == 1
+            assert first._context is not second._context
+        # Still in use by the first scraper
+        assert not launches[0].closed
+        assert second._context is None
+
+    assert launches[0].closed
+
+    # The next scraper launches a fresh browser
+    async with ATPScraper(headless=True):
+        assert len(launches) == 2
+
+
+async def test_storage_state_is_saved_and_restored(tmp_path, monkeypatch):
+    launches = []
+    monkeypatch.setattr("teelo.scrape.base.async_playwright", lambda: _FakePlaywright(launches))
+    monkeypatch.setattr(settings, "scrape_virtual_display", False)
+    monkeypatch.setattr(settings, "scrape_state_dir", str(tmp_path / "state"))
+
+    async with ATPScraper(headless=True) as scraper:
+        # Nothing saved yet, so the first run starts with a clean context
+        assert scraper._context.storage_state_in is None
+
+    saved = tmp_path / "state" / "atpscraper.json"
+    assert saved.exists()
+
+    async with ATPScraper(headless=True) as scraper:
+        assert scraper._context.storage_state_in == str(saved)
+
+
+async def test_navigations_are_capped_across_scrapers(monkeypatch):
+    monkeypatch.setattr(settings, "scrape_max_concurrency", 2)
+    monkeypatch.setattr(BaseScraper, "_nav_slots_loop", None)
+    in_flight = 0
+    peak = 0
+
+    class SlowPage:
+        async def goto(self, url, wait_until=None, timeout=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    scrapers = [ATPScraper(), ATPScraper()]
+    await asyncio.gather(
+        *(
+            scraper.navigate(SlowPage(), f"https://www.atptour.com/{i}")
+            for i in range(3)
+            for scraper in scrapers
+        )
+    )
+
+    assert peak == 2
+
+
+async def test_with_retry_gives_up_when_backoff_would_pass_deadline(monkeypatch):
+    sleeps = []
+    clock = [1000.0]
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr("teelo.scrape.base.asyncio.sleep", fake_sleep)
+    monkeypatch.setattr("teelo.scrape.base.time.monotonic", lambda: clock[0])
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        raise PlaywrightTimeout("slow page")
+
+    try:
+        await ATPScraper().with_retry(flaky, max_attempts=5, base_delay=2.0, deadline=5.0)
+    except PlaywrightTimeout:
+        pass
+    else:
+        raise AssertionError("expected PlaywrightTimeout")
+
+    # 2-3s backoff fits the 5s budget; the next 4-5s backoff would not
+    assert attempts == 2
+    assert len(sleeps) == 1
+
+
+def test_second_virtual_display_shares_the_claimed_display(monkeypatch):
+    monkeypatch.setenv("DISPLAY", ":0")
+    owner = VirtualDisplay(display_num=917)
+    assert owner._claim_display()
+    try:
+        other = VirtualDisplay(display_num=917)
+        other.start()
+
+        # No servers were spawned; the display is just reused
+        assert other._running
+        assert other._xvfb_proc is None
+        assert os.environ["DISPLAY"] == ":917"
+        other.stop()
+    finally:
+        owner.stop()
+
+    # Released lock can be claimed again
+    again = VirtualDisplay(display_num=917)
+    assert again._claim_display()
+    again._display_lock.close()
+
+
+async def test_with_retry_does_not_retry_programming_errors():
+    attempts = 0
+
+    async def broken():
+        nonlocal attempts
+        attempts += 1
+        raise AttributeError("'NoneType' object has no attribute 'text'")
+
+    try:
+        await ATPScraper().with_retry(broken, max_attempts=3)
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("expected AttributeError")
+
+    assert attempts == 1
+
+
+def test_run_scraper_uses_uvloop_when_installed(monkeypatch):
+    loops = []
+
+    def new_event_loop():
+        loop = asyncio.new_event_loop()
+        loops.append(loop)
+        return loop
+
+    monkeypatch.setitem(sys.modules, "uvloop", types.SimpleNamespace(new_event_loop=new_event_loop))
+
+    async def main():
+        return asyncio.get_running_loop()
+
+    assert run_scraper(main()) is loops[0]
+
+    # Falls back to asyncio.run() without uvloop
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert run_scraper(main()) is not loops[0]
+
+
+async def test_stream_feeds_consumer_in_order_with_bounded_buffer():
+    produced = 0
+    consumed = []
+    max_ahead = 0
+
+    async def scrape():
+        nonlocal produced
+        for i in range(10):
+            produced += 1
+            yield i
+
+    async def consume(item):
+        nonlocal max_ahead
+        max_ahead = max(max_ahead, produced - len(consumed))
+        await asyncio.sleep(0)
+        consumed.append(item)
+
+    await ATPScraper().stream(scrape(), consume, maxsize=2)
+
+    assert consumed == list(range(10))
+    # At most maxsize items queued plus the one being handed over
+    assert max_ahead <= 4
+
+
+async def test_stream_closes_generator_when_consumer_fails():
+    closed = False
+
+    async def scrape():
+        nonlocal closed
+        try:
+            for i in range(100):
+                yield i
+        finally:
+            closed = True
+
+    async def consume(item):
+        if item == 3:
+            raise ValueError("bad row")
+
+    try:
+        await ATPScraper().stream(scrape(), consume, maxsize=2)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+    assert closed
+
+
+async def test_stream_raises_scraper_error_after_consuming_earlier_items():
+    consumed = []
+
+    async def scrape():
+        yield 1
+        yield 2
+        raise PlaywrightTimeout("page died")
+
+    async def consume(item):
+        consumed.append(item)
+
+    try:
+        await ATPScraper().stream(scrape(), consume)
+    except PlaywrightTimeout:
+        pass
+    else:
+        raise AssertionError("expected PlaywrightTimeout")
+    assert consumed == [1, 2]
+
+
+def test_signal_in_event_loop_unwinds_tasks_via_previous_handler(monkeypatch):
+    monkeypatch.setattr("atexit.register", lambda func: None)
+    received = []
+    unwound = []
+    main = None
+
+    def previous(signum, frame):
+        received.append(signum)
+        main.cancel()
+
+    async def scrape():
+        nonlocal main
+        main = asyncio.current_task()
+        VirtualDisplay(display_num=918)._register_cleanup()
+        try:
+            signal.raise_signal(signal.SIGTERM)
+            await asyncio.sleep(5)
+        finally:
+            # Where a scraper would close its context and browser
+            unwound.append(True)
+
+    old = signal.signal(signal.SIGTERM, previous)
+    try:
+        asyncio.run(scrape())
+    except asyncio.CancelledError:
+        pass
+    else:
+        raise AssertionError("expected the main task to be cancelled")
+    finally:
+        signal.signal(signal.SIGTERM, old)
+
+    # Handled in the loop, once, and the task unwound normally
+    assert received == [signal.SIGTERM]
+    assert unwound == [True]